@@ -0,0 +1,37 @@
+# apps/common/bulk.py
+
+# Largest id list a bulk action accepts in one request.
+BULK_ACTION_MAX_IDS = 1000
+
+
+class BulkActionResult:
+    """
+    Per-id outcome of a bulk action. Every outcome listed in `outcomes` is counted in the
+    summary (zero included); 'not_found' is recorded for ids that matched nothing.
+    """
+
+    def __init__(self, outcomes=('updated', 'skipped', 'not_found')):
+        self.outcomes = outcomes
+        self.results = {}
+
+    def record(self, pk, result, detail=None):
+        self.results[pk] = {'id': pk, 'result': result}
+        if detail:
+            self.results[pk]['detail'] = detail
+
+    def updated(self, pk):
+        self.record(pk, 'updated')
+
+    def skipped(self, pk, detail):
+        self.record(pk, 'skipped', detail)
+
+    def not_found(self, pk, detail="Not found or does not match the filters."):
+        self.record(pk, 'not_found', detail)
+
+    def count(self, result):
+        return sum(1 for item in self.results.values() if item['result'] == result)
+
+    def as_dict(self):
+        summary = {outcome: self.count(outcome) for outcome in self.outcomes}
+        summary['results'] = [self.results[pk] for pk in sorted(self.results)]
+        return summary
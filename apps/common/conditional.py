@@ -0,0 +1,104 @@
+# apps/common/conditional.py
+
+import hashlib
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .pagination import KeysetPagination
+
+
+def make_etag(*parts):
+    """Strong ETag derived from the given values (timestamps, counts, query parameters...)."""
+    return quote_etag(hashlib.md5(repr(parts).encode()).hexdigest())
+
+
+def etag_matches(request, etag):
+    """True when the request's If-None-Match already names `etag` (or is '*'); weak tags compare equal."""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    etags = [tag.removeprefix('W/') for tag in parse_etags(header)]
+    return '*' in etags or etag.removeprefix('W/') in etags
+
+
+def not_modified_since(request, last_modified):
+    """If-Modified-Since check; only consulted when the request has no If-None-Match."""
+    if last_modified is None or 'If-None-Match' in request.headers:
+        return False
+    since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return since is not None and int(last_modified.timestamp()) <= since
+
+
+def conditional_response(request, etag, build_response, last_modified=None):
+    """
+    Answers 304 Not Modified when the client's copy is current (If-None-Match, or
+    If-Modified-Since when `last_modified` is given); otherwise builds the response with
+    `build_response()`. The validators are attached either way, and `no-cache` makes
+    clients revalidate on every use instead of trusting a stale copy.
+    """
+    if etag_matches(request, etag) or not_modified_since(request, last_modified):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = build_response()
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def touch(model, pk):
+    """
+    Bumps `updated_at` of a parent row whose detail payload embeds the child that changed
+    (a task's comments, a meeting's attendees...), so its validators change too.
+    Uses queryset.update(), which sends no signals.
+    """
+    model.objects.filter(pk=pk).update(updated_at=timezone.now())
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET for list and retrieve. Validators are computed before serialization:
+    - list: max(`conditional_timestamp_field`) and COUNT(*) of the filtered queryset in one
+      aggregate, so edits, additions and deletions all change the ETag. Lists send no
+      Last-Modified, since a deletion can leave the newest timestamp unchanged.
+    - retrieve: the object's timestamp, sent as ETag and Last-Modified.
+    The request path (filters, page, cursor) and the user are part of the ETag.
+    Nested data that does not bump the parent's timestamp must `touch()` it.
+    Keyset-paginated lists are served without validators: they exist to avoid counting the
+    table, which the list ETag would do on every page.
+    """
+    conditional_timestamp_field = 'updated_at'
+
+    def is_keyset_list(self, request):
+        paginator = self.paginator
+        if isinstance(paginator, KeysetPagination):
+            return True
+        is_keyset_request = getattr(paginator, 'is_keyset_request', None)
+        return is_keyset_request is not None and is_keyset_request(request)
+
+    def list(self, request, *args, **kwargs):
+        if self.is_keyset_list(request):
+            return super().list(request, *args, **kwargs)
+        state = self.filter_queryset(self.get_queryset()).aggregate(
+            last_modified=Max(self.conditional_timestamp_field), total=Count('pk')
+        )
+        etag = make_etag(
+            'list', self.get_serializer_class().__name__, request.get_full_path(), request.user.pk,
+            state['last_modified'], state['total']
+        )
+        return conditional_response(request, etag, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        last_modified = getattr(instance, self.conditional_timestamp_field)
+        etag = make_etag(
+            'detail', self.get_serializer_class().__name__, request.get_full_path(), request.user.pk,
+            instance.pk, last_modified
+        )
+        return conditional_response(
+            request, etag, lambda: Response(self.get_serializer(instance).data), last_modified=last_modified
+        )
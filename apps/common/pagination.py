@@ -0,0 +1,162 @@
+# apps/common/pagination.py
+
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination keyed on a unique ordering, `(-created_at, -id)` by default.
+    Every page is one range scan from the cursor position, with no COUNT(*) and no OFFSET,
+    so deep pages cost the same as the first one.
+    Views pick the ordering with `keyset_ordering`; its last field must be unique.
+    """
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = tuple(getattr(view, 'keyset_ordering', self.ordering))
+        self.fields = [queryset.model._meta.get_field(field.lstrip('-')) for field in self.ordering]
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+        ordering = tuple(self._flip(field) for field in self.ordering) if reverse else self.ordering
+
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(self._after(ordering, cursor['position']))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor({'position': self._position(self.page[-1]), 'reverse': False})
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor({'position': self._position(self.page[0]), 'reverse': True})
+
+    def encode_cursor(self, cursor):
+        return replace_query_param(self.base_url, self.cursor_query_param, self.cursor_token(cursor))
+
+    @staticmethod
+    def cursor_token(cursor):
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode('ascii')).decode('ascii')
+
+    @classmethod
+    def cursor_for(cls, obj, ordering, reverse=False):
+        """
+        `?cursor=` value positioned at `obj` in `ordering`, for links built outside a paginated
+        response. With `reverse` the page holds the rows before `obj`.
+        """
+        fields = [obj._meta.get_field(field.lstrip('-')) for field in ordering]
+        return cls.cursor_token({'position': [field.value_to_string(obj) for field in fields], 'reverse': reverse})
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            position = [field.to_python(value) for field, value in zip(self.fields, cursor['position'], strict=True)]
+            return {'position': position, 'reverse': bool(cursor.get('reverse'))}
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _position(self, obj):
+        # value_to_string keeps full precision (microseconds included) for datetimes.
+        return [field.value_to_string(obj) for field in self.fields]
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _after(ordering, position):
+        """
+        Rows strictly after `position` in `ordering`: (a > x) OR (a = x AND b > y) ...
+        The extra range condition on the leading field lets the database seek into its index.
+        """
+        branches, equal = [], {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            branches.append(Q(**equal, **{f'{name}__{lookup}': value}))
+            equal[name] = value
+        leading = ordering[0].lstrip('-')
+        bound = Q(**{f"{leading}__{'lte' if ordering[0].startswith('-') else 'gte'}": position[0]})
+        return bound & reduce(or_, branches)
+
+
+class SizedPagination(PageNumberPagination):
+    """Page-number pagination whose page size clients may set with `?page_size=` (up to 100)."""
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class FeedPagination(SizedPagination):
+    """
+    Page-number pagination by default. `?pagination=cursor` (or any `?cursor=`) switches the
+    request to KeysetPagination, which suits infinite-scroll clients. Page sizes are set with `?page_size=`.
+    In cursor mode the view's `keyset_ordering` applies instead of `?ordering=`.
+    """
+    pagination_query_param = 'pagination'
+    keyset_class = KeysetPagination
+
+    keyset = None
+
+    def is_keyset_request(self, request):
+        return (request.query_params.get(self.pagination_query_param) == 'cursor'
+                or self.keyset_class.cursor_query_param in request.query_params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_keyset_request(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            'name': self.pagination_query_param,
+            'required': False,
+            'in': 'query',
+            'description': "Set to 'cursor' for cursor pagination (no total count; follow the next/previous links).",
+            'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+        })
+        parameters.append({
+            'name': self.keyset_class.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': "Cursor returned in the next/previous links of a cursor-paginated page.",
+            'schema': {'type': 'string'},
+        })
+        return parameters
@@ -0,0 +1,32 @@
+# apps/common/search.py
+
+import re
+from django.contrib.postgres.search import SearchQuery
+from django.db import models
+
+# Text search configuration of the stored search vectors and of the queries run against them.
+# 'simple' does no stemming, which keeps Uzbek, Russian and English text searchable alike.
+SEARCH_CONFIG = 'simple'
+SEARCH_MAX_TERMS = 10
+
+_TERM_RE = re.compile(r'\w+')
+
+
+class SearchVectorManager(models.Manager):
+    """Leaves the `search_vector` column out of ordinary queries; only search reads it."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
+def build_search_query(text):
+    """
+    SearchQuery matching every word of `text`, the last one as a prefix so results follow
+    the user as they type. Only word characters reach the tsquery, so any input is safe.
+    Returns None when `text` has no words.
+    """
+    terms = _TERM_RE.findall(text.lower())[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    terms[-1] += ':*'
+    return SearchQuery(' & '.join(terms), search_type='raw', config=SEARCH_CONFIG)
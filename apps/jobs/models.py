@@ -1,6 +1,9 @@
 # apps/jobs/models.py
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from apps.common.search import SEARCH_CONFIG, SearchVectorManager
 from apps.users.models import User
 from apps.workspaces.models import Workspace
 
@@ -25,10 +28,20 @@ class Job(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='ACTIVE')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector('title', weight='A', config=SEARCH_CONFIG) + SearchVector('description', weight='B', config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchVectorManager()
 
     class Meta:
         db_table = 'jobs'
         ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='jobs_search_gin'),
+        ]
         verbose_name = "Loyiha (Job)"
         verbose_name_plural = "Loyihalar (Jobs)"
 
@@ -50,10 +63,24 @@ class JobVacancy(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_vacancies')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='OPEN')
     created_at = models.DateTimeField(auto_now_add=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('description', weight='B', config=SEARCH_CONFIG)
+            + SearchVector('requirements', weight='C', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchVectorManager()
 
     class Meta:
         db_table = 'job_vacancies'
         ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='job_vacancies_search_gin'),
+        ]
         verbose_name = "Vacancy"
         verbose_name_plural = "Vacancies"
 
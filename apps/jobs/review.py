@@ -0,0 +1,140 @@
+# apps/jobs/review.py
+
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from rest_framework.exceptions import ValidationError
+
+from apps.common.bulk import BulkActionResult
+from apps.notifications.utils import create_notifications_bulk
+from apps.tasks.models import Task
+from apps.users.skills import skill_match_count
+from apps.workspaces.bulk import add_members
+from apps.workspaces.models import WorkspaceMember
+from .models import JobVacancy, VacancyApplication
+
+REVIEW_STATUSES = ('PENDING', 'REVIEWING')
+
+
+def _count(queryset, field):
+    """Correlated COUNT(*) of `queryset` rows whose `field` is the application's applicant."""
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef('applicant_id')}).order_by().values(field).annotate(total=Count('id')).values('total'),
+        output_field=IntegerField(),
+    ), 0)
+
+
+def rank_applications(queryset, skills):
+    """
+    Annotates and orders applications for review, best candidates first: by how many of the
+    vacancy's `skills` the applicant lists, then by track record (completed tasks, applications
+    accepted elsewhere), then by who applied first. Applicants and their student profiles are
+    joined in, so serializing a page needs no further queries.
+    """
+    return (
+        queryset.select_related('applicant', 'applicant__student_profile')
+        .annotate(
+            matched_skills_count=skill_match_count(skills, field='applicant__student_profile__skills_normalized'),
+            completed_tasks=_count(Task.objects.filter(status='COMPLETED'), 'assigned_to_id'),
+            accepted_applications=_count(
+                VacancyApplication.objects.filter(status='ACCEPTED').exclude(vacancy_id=OuterRef('vacancy_id')),
+                'applicant_id'
+            ),
+        )
+        .order_by('-matched_skills_count', '-completed_tasks', '-accepted_applications', 'applied_at', 'id')
+    )
+
+
+def _notification(status, vacancy, workspace):
+    """(verb, message) sent to the applicant when their application moves to `status`."""
+    if status == 'ACCEPTED':
+        return ("Your application has been approved",
+                f"Congratulations! Your application for the '{vacancy.title}' vacancy has been accepted "
+                f"and you have been added to the '{workspace.name}' workspace.")
+    if status == 'REVIEWING':
+        return ("Your application is under review.",
+                f"Your application for the '{vacancy.title}' vacancy is being reviewed.")
+    if status == 'REJECTED':
+        return ("Your application has been rejected.",
+                f"Unfortunately, your application for the '{vacancy.title}' vacancy has been rejected.")
+    return None
+
+
+def review_applications(vacancy, application_ids, status, reviewer, notes=None):
+    """
+    Moves the vacancy's applications to `status` in one transaction and notifies the applicants
+    with one bulk insert.
+
+    Accepting adds the applicants to the project workspace with one bulk insert, each new member
+    taking one of the vacancy's `slots_available`; the vacancy closes when none are left. The
+    vacancy row is locked first, so concurrent reviews cannot hand out the same slot twice, and
+    a ValidationError is raised, changing nothing, when the applicants do not fit the free slots.
+    Accepted applications are final and are skipped. Returns a BulkActionResult.
+    """
+    result = BulkActionResult()
+    with transaction.atomic():
+        vacancy = JobVacancy.objects.select_for_update(of=('self',)).select_related('job__workspace').get(pk=vacancy.pk)
+        workspace = vacancy.job.workspace
+        applications = {
+            application.id: application
+            for application in vacancy.applications.filter(id__in=application_ids)
+            .select_for_update(of=('self',)).select_related('applicant').order_by('id')
+        }
+
+        changed, recipients = [], []
+        for pk in application_ids:
+            application = applications.get(pk)
+            if application is None:
+                result.not_found(pk, "Application not found for this vacancy.")
+            elif application.status == 'ACCEPTED':
+                result.skipped(pk, "The application has already been accepted.")
+            elif application.status == status:
+                result.skipped(pk, f"The application is already {application.get_status_display().lower()}.")
+            else:
+                application.vacancy = vacancy
+                changed.append(application)
+        if not changed:
+            return result
+
+        if status == 'ACCEPTED':
+            if workspace is None:
+                raise ValidationError("The project of this vacancy has no workspace to add the applicants to.")
+            applicant_ids = [application.applicant_id for application in changed]
+            existing = set(WorkspaceMember.objects.filter(workspace=workspace, user_id__in=applicant_ids).values_list('user_id', flat=True))
+            new_member_ids = [user_id for user_id in applicant_ids if user_id not in existing]
+            if len(new_member_ids) > vacancy.slots_available:
+                raise ValidationError(
+                    f"The vacancy has {vacancy.slots_available} free slots; {len(new_member_ids)} applicants cannot be accepted."
+                )
+            members, _ = add_members(workspace, new_member_ids, roles={user_id: 'STUDENT' for user_id in new_member_ids}, notify=False)
+            added = {member.user_id for member in members}
+            # As with a single acceptance, only applicants who just joined the workspace hear about it.
+            recipients = [application for application in changed if application.applicant_id in added]
+            if members:
+                vacancy.slots_available -= len(members)
+                if vacancy.slots_available == 0:
+                    vacancy.status = 'CLOSED'
+                vacancy.save(update_fields=['slots_available', 'status'])
+
+        # queryset.update() sends no post_save, so the per-application acceptance signal stays out of the way.
+        values = {'status': status}
+        if notes is not None:
+            values['notes'] = notes
+        VacancyApplication.objects.filter(id__in=[application.id for application in changed]).update(**values)
+        for application in changed:
+            application.status = status
+            result.updated(application.id)
+        if status != 'ACCEPTED':
+            recipients = changed
+
+        notification = _notification(status, vacancy, workspace)
+        if notification and recipients:
+            verb, message = notification
+            create_notifications_bulk(
+                [(application.applicant_id, application) for application in recipients],
+                actor=reviewer,
+                verb=verb,
+                message=message,
+                target=workspace if status == 'ACCEPTED' else None
+            )
+    return result
@@ -1,10 +1,13 @@
 # apps/jobs/serializers.py
 
 from rest_framework import serializers
+from drf_spectacular.utils import extend_schema_field
 from .models import Job, JobVacancy, VacancyApplication
-from apps.users.models import User
+from apps.common.bulk import BULK_ACTION_MAX_IDS
+from apps.users.models import User, Student
 
-from apps.users.serializers import UserSummarySerializer
+from apps.users.serializers import UserSummarySerializer, StudentSkillMatchSerializer
+from apps.users.skills import SKILL_MATCH_LIMIT, matched_skills
 from apps.workspaces.serializers import WorkspaceSummarySerializer
 
 
@@ -29,7 +32,7 @@ class JobDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Job
-        fields = '__all__'
+        exclude = ['search_vector']
 
 
 class JobVacancySummarySerializer(serializers.ModelSerializer):
@@ -54,7 +57,7 @@ class JobVacancyDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = JobVacancy
-        fields = '__all__'
+        exclude = ['search_vector']
 
 class VacancyApplicationListSerializer(serializers.ModelSerializer):
     vacancy = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -107,3 +110,79 @@ class VacancyApplicationManageSerializer(serializers.ModelSerializer):
         if request:
             instance._reviewed_by_user = request.user
         return super().update(instance, validated_data)
+
+
+# ----------------- Skill Matching Serializers -----------------
+
+class VacancyMatchQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(required=False, default=SKILL_MATCH_LIMIT, min_value=1, max_value=100,
+                                     help_text="Number of best matching students returned.")
+
+class VacancyStudentMatchSerializer(serializers.Serializer):
+    vacancy = serializers.IntegerField()
+    skills = serializers.ListField(child=serializers.CharField(), help_text="Skills read from the vacancy requirements.")
+    results = StudentSkillMatchSerializer(many=True)
+
+
+# ----------------- Application Review Serializers -----------------
+
+class ApplicantProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Student
+        fields = ['level_status', 'year_of_study', 'it_skills', 'jlpt', 'ielts']
+
+class VacancyApplicationReviewQuerySerializer(serializers.Serializer):
+    status = serializers.MultipleChoiceField(choices=VacancyApplication.STATUS_CHOICES, required=False,
+                                             help_text="Application statuses to list. Defaults to pending and reviewing.")
+
+class VacancyApplicationReviewSerializer(serializers.ModelSerializer):
+    """An application ranked against the vacancy's skills, passed in the context as `skills` (normalized)."""
+    applicant = UserSummarySerializer(read_only=True)
+    profile = serializers.SerializerMethodField()
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    matched_skills_count = serializers.IntegerField(read_only=True)
+    matched_skills = serializers.SerializerMethodField()
+    completed_tasks = serializers.IntegerField(read_only=True, help_text="Tasks the applicant has completed.")
+    accepted_applications = serializers.IntegerField(read_only=True, help_text="Applicant's accepted applications for other vacancies.")
+
+    class Meta:
+        model = VacancyApplication
+        fields = ['id', 'applicant', 'profile', 'status', 'status_display', 'applied_at', 'cover_letter', 'notes',
+                  'matched_skills_count', 'matched_skills', 'completed_tasks', 'accepted_applications']
+
+    def _student(self, obj):
+        try:
+            return obj.applicant.student_profile
+        except Student.DoesNotExist:
+            return None
+
+    @extend_schema_field(ApplicantProfileSerializer(allow_null=True))
+    def get_profile(self, obj):
+        student = self._student(obj)
+        return ApplicantProfileSerializer(student).data if student else None
+
+    def get_matched_skills(self, obj) -> list[str]:
+        student = self._student(obj)
+        return matched_skills(student.it_skills, self.context['skills']) if student else []
+
+class VacancyApplicationBulkReviewSerializer(serializers.Serializer):
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=BULK_ACTION_MAX_IDS,
+        help_text="IDs of the vacancy's applications to change."
+    )
+    status = serializers.ChoiceField(choices=[choice for choice in VacancyApplication.STATUS_CHOICES if choice[0] != 'PENDING'])
+    notes = serializers.CharField(required=False, allow_blank=True, help_text="Staff notes stored on every changed application.")
+
+    def validate_application_ids(self, value):
+        return list(dict.fromkeys(value))
+
+class VacancyApplicationBulkItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(help_text="Application ID")
+    result = serializers.ChoiceField(choices=('updated', 'skipped', 'not_found'))
+    detail = serializers.CharField(required=False)
+
+class VacancyApplicationBulkReviewResultSerializer(serializers.Serializer):
+    updated = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    not_found = serializers.IntegerField()
+    results = VacancyApplicationBulkItemSerializer(many=True)
@@ -1,6 +1,7 @@
 # apps/jobs/views.py
 
 from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
@@ -10,11 +11,20 @@ from .serializers import (
     JobListSerializer, JobDetailSerializer, JobCreateUpdateSerializer,
     JobVacancyListSerializer, JobVacancyDetailSerializer, JobVacancyCreateUpdateSerializer,
     VacancyApplicationListSerializer, VacancyApplicationDetailSerializer,
-    VacancyApplicationCreateSerializer, VacancyApplicationManageSerializer
+    VacancyApplicationCreateSerializer, VacancyApplicationManageSerializer,
+    VacancyMatchQuerySerializer, VacancyStudentMatchSerializer,
+    VacancyApplicationReviewQuerySerializer, VacancyApplicationReviewSerializer,
+    VacancyApplicationBulkReviewSerializer, VacancyApplicationBulkReviewResultSerializer
 )
+from .review import REVIEW_STATUSES, rank_applications, review_applications
 from .permissions import IsApplicantOrStaff, IsAdminOrReadOnly
-from apps.users.permissions import IsAdminUser, IsAdminOrStaff, IsStudentUser
+from apps.users.filters import StudentProfileFilter
+from apps.users.models import Student
+from apps.users.permissions import IsAdminUser, IsAdminOrStaff, IsRecruiterUser, IsStudentUser
+from apps.users.skills import match_students, parse_requirements
 from apps.notifications.utils import create_notification
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.pagination import SizedPagination
 
 
 @extend_schema_view(
@@ -25,7 +35,7 @@ from apps.notifications.utils import create_notification
     partial_update=extend_schema(summary="[ADMIN] Partially Edit Project", request=JobCreateUpdateSerializer, tags=['Projects']),
     destroy=extend_schema(summary="[ADMIN] Delete Project", tags=['Projects']),
 )
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Job.objects.all().select_related('workspace', 'created_by')
     permission_classes = [permissions.IsAuthenticated, IsAdminOrReadOnly]
 
@@ -54,6 +64,18 @@ class JobViewSet(viewsets.ModelViewSet):
     update=extend_schema(summary="[STAFF] Edit Vacancy", request=JobVacancyCreateUpdateSerializer, tags=['Vacancies']),
     partial_update=extend_schema(summary="[STAFF] Partially Edit Vacancy", request=JobVacancyCreateUpdateSerializer, tags=['Vacancies']),
     destroy=extend_schema(summary="[STAFF] Delete Vacancy", tags=['Vacancies']),
+    matching_students=extend_schema(
+        parameters=[VacancyMatchQuerySerializer], responses=VacancyStudentMatchSerializer,
+        summary="[STAFF/RECRUITER] Students Best Matching the Vacancy Requirements", tags=['Vacancies']
+    ),
+    applications_review=extend_schema(
+        parameters=[VacancyApplicationReviewQuerySerializer], responses=VacancyApplicationReviewSerializer(many=True),
+        summary="[STAFF] Vacancy Applications Ranked for Review", tags=['Applications']
+    ),
+    bulk_review=extend_schema(
+        request=VacancyApplicationBulkReviewSerializer, responses=VacancyApplicationBulkReviewResultSerializer,
+        summary="[STAFF] Accept, Review or Reject Applications in Bulk", tags=['Applications']
+    ),
 )
 class JobVacancyViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
@@ -74,11 +96,76 @@ class JobVacancyViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
             return [permissions.IsAuthenticated()]
+        if self.action == 'matching_students':
+            return [(IsAdminOrStaff | IsRecruiterUser)()]
         return [IsAdminOrStaff()]
     
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
+    @action(detail=True, methods=['get'], url_path='matching-students', filter_backends=[], pagination_class=None)
+    def matching_students(self, request, pk=None):
+        """
+        Scores active students by how many of the vacancy's required skills (the comma- or
+        line-separated items of `requirements`) they list, and returns the best `limit`.
+        The student profile filters (skills, year_of_study_min, level_status, jlpt, ielts...)
+        narrow the candidates down first.
+        """
+        vacancy = self.get_object()
+        params = VacancyMatchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        skills = parse_requirements(vacancy.requirements)
+
+        candidates = StudentProfileFilter(
+            request.query_params, queryset=Student.objects.filter(user__is_active=True).select_related('user'), request=request
+        )
+        if not candidates.is_valid():
+            return Response(candidates.errors, status=status.HTTP_400_BAD_REQUEST)
+        students = match_students(candidates.qs, skills, limit=params.validated_data['limit'])
+        return Response(VacancyStudentMatchSerializer(
+            {'vacancy': vacancy.id, 'skills': skills, 'results': students}, context={'skills': skills}
+        ).data)
+
+    @action(detail=True, methods=['get'], url_path='applications-review', filter_backends=[], pagination_class=SizedPagination)
+    def applications_review(self, request, pk=None):
+        """
+        The vacancy's applications, best candidates first: ranked by how many of the required
+        skills the applicant lists, then by completed tasks and applications accepted elsewhere.
+        Lists pending and reviewing applications unless `status` says otherwise.
+        """
+        vacancy = self.get_object()
+        params = VacancyApplicationReviewQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        skills = parse_requirements(vacancy.requirements)
+
+        applications = rank_applications(
+            vacancy.applications.filter(status__in=params.validated_data.get('status') or REVIEW_STATUSES), skills
+        )
+        page = self.paginate_queryset(applications)
+        context = {**self.get_serializer_context(), 'skills': skills}
+        if page is not None:
+            return self.get_paginated_response(VacancyApplicationReviewSerializer(page, many=True, context=context).data)
+        return Response(VacancyApplicationReviewSerializer(applications, many=True, context=context).data)
+
+    @action(detail=True, methods=['post'], url_path='bulk-review')
+    def bulk_review(self, request, pk=None):
+        """
+        Moves many of the vacancy's applications to ACCEPTED, REVIEWING or REJECTED at once.
+        Accepted applicants join the project workspace, each taking one of the vacancy's free
+        slots; the request is refused as a whole when they do not fit.
+        """
+        vacancy = self.get_object()
+        serializer = VacancyApplicationBulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = review_applications(
+            vacancy,
+            serializer.validated_data['application_ids'],
+            serializer.validated_data['status'],
+            reviewer=request.user,
+            notes=serializer.validated_data.get('notes'),
+        )
+        return Response(VacancyApplicationBulkReviewResultSerializer(result.as_dict()).data)
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -3,13 +3,27 @@
 from uuid import uuid4
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from django.conf import settings
 import traceback
 
 SERVICE_ACCOUNT_FILE = getattr(settings, 'GOOGLE_SERVICE_ACCOUNT_FILE', None)
 SCOPES = ['https://www.googleapis.com/auth/calendar', 'https://www.googleapis.com/auth/calendar.events']
 
-def create_google_meet_event(title, description, start_time, end_time, attendees_emails):
+def meeting_event_id(meeting_id):
+    """Calendar event id of a meeting. Event ids use base32hex characters (0-9, a-v) only."""
+    return f"meeting{meeting_id:012d}"
+
+def _meet_link(event):
+    conference_data = event.get('conferenceData', {})
+    return next((ep['uri'] for ep in conference_data.get('entryPoints', []) if ep.get('entryPointType') == 'video'), None)
+
+def create_google_meet_event(title, description, start_time, end_time, attendees_emails, event_id=None):
+    """
+    Creates the calendar event with a Meet link and returns (meet_link, event_id).
+    With `event_id` the call is idempotent: if the event already exists (an earlier attempt
+    created it), that event is read back instead of creating a second one.
+    """
     if not SERVICE_ACCOUNT_FILE:
         print("WARNING: Google Service Account file is not configured.")
         return None, None
@@ -38,20 +52,22 @@ def create_google_meet_event(title, description, start_time, end_time, attendees
                 }
             }
         }
+        if event_id:
+            event_body['id'] = event_id
 
-        created_event = service.events().insert(
-            calendarId='primary',  
-            body=event_body,
-            conferenceDataVersion=1
-        ).execute()
-
-        print(f"✅ Event was Created for  ({DELEGATED_USER_EMAIL})")
-
-        conference_data = created_event.get('conferenceData', {})
-        meet_link = next((ep['uri'] for ep in conference_data.get('entryPoints', []) if ep.get('entryPointType') == 'video'), None)
-        event_id = created_event.get('id')
+        try:
+            created_event = service.events().insert(
+                calendarId='primary',  
+                body=event_body,
+                conferenceDataVersion=1
+            ).execute()
+            print(f"✅ Event was Created for  ({DELEGATED_USER_EMAIL})")
+        except HttpError as e:
+            if not event_id or e.resp.status != 409:
+                raise
+            created_event = service.events().get(calendarId='primary', eventId=event_id).execute()
 
-        return meet_link, event_id
+        return _meet_link(created_event), created_event.get('id')
 
     except Exception as e:
         print("❌ Error occurred while creating event:")
@@ -1,6 +1,7 @@
 # apps/meetings/permissions.py
 from rest_framework import permissions
 from .models import MeetingAttendee
+from apps.workspaces.membership import is_member
 
 class IsMeetingOrganizerOrAdmin(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
@@ -12,9 +13,8 @@ class CanViewMeeting(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.user_type == 'ADMIN':
             return True
-        is_attendee = MeetingAttendee.objects.filter(meeting=obj, user=request.user).exists()
-        is_workspace_member = obj.workspace and obj.workspace.members.filter(user=request.user).exists()
-        return is_attendee or is_workspace_member
+        is_workspace_member = obj.workspace_id and is_member(request.user, obj.workspace_id, active_only=False)
+        return is_workspace_member or MeetingAttendee.objects.filter(meeting=obj, user=request.user).exists()
 
 class IsAttendee(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
@@ -0,0 +1,12 @@
+# apps/meetings/signals.py
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.common.conditional import touch
+from .models import Meeting, MeetingAttendee
+
+@receiver([post_save, post_delete], sender=MeetingAttendee)
+def touch_meeting_on_attendee_change(sender, instance, **kwargs):
+    """Meeting details embed the attendees and their answers, so an attendee change is a meeting change."""
+    touch(Meeting, instance.meeting_id)
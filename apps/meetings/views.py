@@ -16,11 +16,13 @@ from .serializers import (
 from .permissions import IsMeetingOrganizerOrAdmin, IsAttendee
 from apps.users.permissions import IsAdminOrStaff
 from apps.users.models import User
-from .google_api import create_google_meet_event
-from apps.notifications.utils import create_notification
+from apps.notifications.utils import create_notification, create_notifications_bulk
+from apps.outbox.utils import enqueue
+from apps.workspaces.membership import get_workspace_ids
+from apps.common.conditional import ConditionalGetMixin
 
 
-class MeetingViewSet(viewsets.ModelViewSet):
+class MeetingViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Meeting.objects.all().prefetch_related('attendees__user', 'workspace', 'organizer')
     
     def get_serializer_class(self):
@@ -46,7 +48,7 @@ class MeetingViewSet(viewsets.ModelViewSet):
         if user.user_type == 'ADMIN':
             return self.queryset
         
-        user_workspaces = user.workspace_memberships.values_list('workspace_id', flat=True)
+        user_workspaces = get_workspace_ids(user)
         user_meetings = user.meeting_attendances.values_list('meeting_id', flat=True)
         
         return self.queryset.filter(
@@ -54,42 +56,35 @@ class MeetingViewSet(viewsets.ModelViewSet):
         ).distinct()
 
     def perform_create(self, serializer):
-        meeting = serializer.save(organizer=self.request.user)
-        invited_users_data = serializer.validated_data.get('invited_users', [])
-        attendee_users_qs = User.objects.none()
-
-        if meeting.audience_type == Meeting.AudienceType.WORKSPACE_MEMBERS and meeting.workspace:
-            attendee_users_qs = User.objects.filter(workspace_memberships__workspace=meeting.workspace, is_active=True)
-        elif meeting.audience_type == Meeting.AudienceType.ALL_STAFF:
-            attendee_users_qs = User.objects.filter(user_type__in=['STAFF', 'ADMIN'], is_active=True)
-        elif meeting.audience_type == Meeting.AudienceType.SPECIFIC_USERS:
-            attendee_users_qs = User.objects.filter(id__in=[user.id for user in invited_users_data])
-
-        attendees_emails = set(attendee_users_qs.values_list('email', flat=True))
-        if meeting.organizer and meeting.organizer.email:
-            attendees_emails.add(meeting.organizer.email)
-        
-        final_attendee_emails = list(attendees_emails)
-
         with transaction.atomic():
+            meeting = serializer.save(organizer=self.request.user)
+            invited_users_data = serializer.validated_data.get('invited_users', [])
+            attendee_users_qs = User.objects.none()
+
+            if meeting.audience_type == Meeting.AudienceType.WORKSPACE_MEMBERS and meeting.workspace:
+                attendee_users_qs = User.objects.filter(workspace_memberships__workspace=meeting.workspace, is_active=True)
+            elif meeting.audience_type == Meeting.AudienceType.ALL_STAFF:
+                attendee_users_qs = User.objects.filter(user_type__in=['STAFF', 'ADMIN'], is_active=True)
+            elif meeting.audience_type == Meeting.AudienceType.SPECIFIC_USERS:
+                attendee_users_qs = User.objects.filter(id__in=[user.id for user in invited_users_data])
+
+            attendees_emails = set(attendee_users_qs.values_list('email', flat=True))
+            if meeting.organizer and meeting.organizer.email:
+                attendees_emails.add(meeting.organizer.email)
+
+            final_attendee_emails = list(attendees_emails)
+
             attendee_users = User.objects.filter(email__in=final_attendee_emails)
             attendees_to_create = [MeetingAttendee(meeting=meeting, user=user) for user in attendee_users]
             if attendees_to_create:
                 MeetingAttendee.objects.bulk_create(attendees_to_create, ignore_conflicts=True)
 
-        if not meeting.google_event_id and final_attendee_emails:
-            link, event_id = create_google_meet_event(
-                meeting.title, meeting.description, meeting.start_time,
-                meeting.end_time, final_attendee_emails
-            )
-            if link and event_id:
-                meeting.meeting_link = link
-                meeting.google_event_id = event_id
-                meeting.save(update_fields=['meeting_link', 'google_event_id'])
-
-        for attendee in meeting.attendees.all():
-            create_notification(
-                recipient=attendee.user,
+            # The Google Calendar event is created by the outbox worker after this transaction commits.
+            if not meeting.google_event_id and final_attendee_emails:
+                enqueue('meetings.create_calendar_event', {"meeting_id": meeting.id})
+
+            create_notifications_bulk(
+                meeting.attendees.values_list('user_id', flat=True),
                 actor=meeting.organizer,
                 verb="You have been invited to a meeting",
                 message=f"You have been invited to a new meeting titled '{meeting.title}'.",
@@ -0,0 +1,123 @@
+# apps/notifications/management/commands/benchmark_notification_inbox.py
+
+import statistics
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.notifications.models import Notification
+from apps.users.models import User
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the notification inbox queries (list page, unread count, mark_all_as_read) on a generated "
+        "table, first without and then with the inbox indexes. Everything runs in one transaction that is "
+        "rolled back, so no data is left behind."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2_000_000, help="Notifications to generate.")
+        parser.add_argument('--recipients', type=int, default=1000, help="Users the notifications are spread over.")
+        parser.add_argument('--read-ratio', type=float, default=0.9, help="Share of generated notifications already read.")
+        parser.add_argument('--repeat', type=int, default=20, help="Runs per measured query.")
+        parser.add_argument('--force', action='store_true', help="Run even with DEBUG off.")
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError("This benchmark locks the notifications table while it runs. Use a local database or pass --force.")
+
+        try:
+            with transaction.atomic():
+                recipient_id = self.populate(options['rows'], options['recipients'], options['read_ratio'])
+
+                self.drop_indexes()
+                without_indexes = self.measure(recipient_id, options['repeat'])
+                self.create_indexes()
+                with_indexes = self.measure(recipient_id, options['repeat'])
+
+                self.report(without_indexes, with_indexes)
+                raise Rollback
+        except Rollback:
+            self.stdout.write("Generated data rolled back.")
+
+    def populate(self, rows, recipients, read_ratio):
+        self.stdout.write(f"Generating {rows} notifications for {recipients} recipients...")
+        users = User.objects.bulk_create([
+            User(email=f"inbox-benchmark-{i}@example.invalid", first_name="Benchmark", last_name=str(i))
+            for i in range(recipients)
+        ])
+        user_ids = [user.id for user in users]
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO {Notification._meta.db_table} (recipient_id, verb, message, is_read, created_at)
+                SELECT (%s::bigint[])[1 + g %% %s], 'Benchmark', 'Benchmark notification',
+                       random() < %s, now() - g * interval '1 second'
+                FROM generate_series(1, %s) AS g
+            """, [user_ids, recipients, read_ratio, rows])
+            # Run the deferred foreign key checks now; pending trigger events would block CREATE INDEX.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        return user_ids[0]
+
+    def drop_indexes(self):
+        with connection.cursor() as cursor:
+            for index in Notification._meta.indexes:
+                cursor.execute(f"DROP INDEX IF EXISTS {connection.ops.quote_name(index.name)}")
+        self.analyze()
+
+    def create_indexes(self):
+        with connection.schema_editor() as editor:
+            for index in Notification._meta.indexes:
+                editor.add_index(Notification, index)
+        self.analyze()
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Notification._meta.db_table}")
+
+    def measure(self, recipient_id, repeat):
+        inbox = Notification.objects.filter(recipient_id=recipient_id)
+        page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+
+        def list_page():
+            # What the paginated list endpoint runs: the total count and the first page.
+            inbox.count()
+            list(inbox[:page_size])
+
+        def unread_count():
+            inbox.filter(is_read=False).count()
+
+        def mark_all_as_read():
+            savepoint = transaction.savepoint()
+            inbox.filter(is_read=False).update(is_read=True)
+            transaction.savepoint_rollback(savepoint)
+
+        return {
+            'list': self.time(list_page, repeat),
+            'unread_count': self.time(unread_count, repeat),
+            'mark_all_as_read': self.time(mark_all_as_read, repeat),
+        }
+
+    def time(self, func, repeat):
+        func()  # warm-up
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))]
+
+    def report(self, without_indexes, with_indexes):
+        self.stdout.write(f"{'query':<18}{'without (median / p95 ms)':>28}{'with (median / p95 ms)':>26}{'speedup':>10}")
+        for name, (before_median, before_p95) in without_indexes.items():
+            after_median, after_p95 = with_indexes[name]
+            speedup = before_median / after_median if after_median else float('inf')
+            self.stdout.write(
+                f"{name:<18}{before_median:>17.2f} / {before_p95:>8.2f}{after_median:>15.2f} / {after_p95:>8.2f}{speedup:>9.1f}x"
+            )
@@ -1,5 +1,6 @@
 # apps/notifications/models.py
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -26,6 +27,11 @@ class Notification(models.Model):
     target_id = models.PositiveIntegerField(null=True, blank=True)
     target = GenericForeignKey('target_content_type', 'target_id')
     
+    # Summaries of action_object and target taken when the notification was created,
+    # so opening a notification does not have to load and serialize the live objects.
+    action_object_snapshot = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    target_snapshot = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+
     # Read or not
     is_read = models.BooleanField(default=False)
 
@@ -37,6 +43,17 @@ class Notification(models.Model):
     class Meta:
         ordering = ['-created_at']
         db_table = 'notifications'
+        indexes = [
+            # Inbox: a recipient's notifications, newest first.
+            models.Index(fields=['recipient', '-created_at'], name='notif_recipient_created_idx'),
+            # Unread count, unread listing and mark_all_as_read only touch unread rows,
+            # which stay a small fraction of the table.
+            models.Index(
+                fields=['recipient', '-created_at'],
+                condition=models.Q(is_read=False),
+                name='notif_recipient_unread_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"To: {self.recipient.email} - {self.verb}"
\ No newline at end of file
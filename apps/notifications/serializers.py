@@ -1,5 +1,7 @@
 # apps/notifications/serializers.py
 
+from django.apps import apps
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from rest_framework import serializers
 from .models import Notification
 
@@ -13,6 +15,35 @@ class GenericObjectSummarySerializer(serializers.Serializer):
     object_type = serializers.CharField(source='_meta.model_name')
     display_text = serializers.CharField(source='__str__')
 
+# Relations each model's __str__ follows, so `display_text` needs no extra queries.
+# Models not listed here are still fetched once per content type, just without joins.
+GENERIC_SUMMARY_SELECT_RELATED = {
+    'tasks.task': ['workspace'],
+    'tasks.taskcomment': ['task', 'user'],
+    'workspaces.workspacemember': ['user', 'workspace'],
+    'reports.dailyreport': ['student', 'workspace'],
+    'reports.monthlyreport': ['student', 'workspace'],
+    'reports.salaryrecord': ['student', 'workspace'],
+    'meetings.meetingattendee': ['user', 'meeting'],
+    'jobs.jobvacancy': ['job'],
+    'jobs.vacancyapplication': ['applicant', 'vacancy'],
+    'users.recruiter': ['user'],
+    'users.staff': ['user'],
+}
+
+def generic_summary_prefetches(*lookups):
+    """
+    Prefetches for the given GenericForeignKeys that load every referenced object
+    with one query per content type, joined with what its summary needs.
+    """
+    return [
+        GenericPrefetch(lookup, [
+            apps.get_model(label)._default_manager.select_related(*fields)
+            for label, fields in GENERIC_SUMMARY_SELECT_RELATED.items()
+        ])
+        for lookup in lookups
+    ]
+
 # ====================================================================
 # 2. Smart field to read GenericForeignKey
 # ====================================================================
@@ -46,6 +77,31 @@ class SmartGenericRelatedField(serializers.RelatedField):
         
         return GenericObjectSummarySerializer(value).data
 
+# ====================================================================
+# 2.1 Snapshot-first field for the detail view
+# ====================================================================
+class SnapshotGenericRelatedField(SmartGenericRelatedField):
+    """
+    Serves the summary stored on the notification when it was created.
+    `?expand=live` (or a notification without a snapshot) falls back to the live object.
+    """
+    def __init__(self, snapshot_field, **kwargs):
+        self.snapshot_field = snapshot_field
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        request = self.context.get('request')
+        expand_live = request is not None and request.query_params.get('expand') == 'live'
+        snapshot = getattr(instance, self.snapshot_field)
+        if snapshot is not None and not expand_live:
+            return snapshot
+        return super().get_attribute(instance)
+
+    def to_representation(self, value):
+        if isinstance(value, dict):
+            return value
+        return super().to_representation(value)
+
 # ====================================================================
 # 3. General Notification Serializer
 # ====================================================================
@@ -65,16 +121,16 @@ class NotificationListSerializer(NotificationBaseSerializer):
         fields = NotificationBaseSerializer.Meta.fields + ['action_object', 'target']
 
 class NotificationDetailSerializer(NotificationBaseSerializer):
-    action_object = SmartGenericRelatedField(read_only=True)
-    target = SmartGenericRelatedField(read_only=True)
+    action_object = SnapshotGenericRelatedField(snapshot_field='action_object_snapshot', read_only=True)
+    target = SnapshotGenericRelatedField(snapshot_field='target_snapshot', read_only=True)
 
     class Meta(NotificationBaseSerializer.Meta):
         fields = NotificationBaseSerializer.Meta.fields + ['action_object', 'target']
         
     actor = UserSummarySerializer(read_only=True)
     recipient = serializers.PrimaryKeyRelatedField(read_only=True)
-    action_object = SmartGenericRelatedField(read_only=True)
-    target = SmartGenericRelatedField(read_only=True)
+    action_object = SnapshotGenericRelatedField(snapshot_field='action_object_snapshot', read_only=True)
+    target = SnapshotGenericRelatedField(snapshot_field='target_snapshot', read_only=True)
 
     class Meta:
         model = Notification
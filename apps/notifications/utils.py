@@ -1,8 +1,75 @@
 # apps/notifications/utils.py (yangi fayl yarating)
 
+from collections import Counter
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
 from .models import Notification
 
+NOTIFICATION_BATCH_SIZE = 500
+UNREAD_COUNT_CACHE_KEY = 'notifications:unread:{user_id}'
+
+# Fields stored in a notification's snapshot next to id, object_type and display_text.
+SNAPSHOT_FIELDS = {
+    'tasks.task': ['title', 'status', 'priority', 'due_date'],
+    'meetings.meeting': ['title', 'status', 'start_time', 'end_time', 'meeting_link'],
+    'workspaces.workspace': ['name', 'workspace_type', 'is_active'],
+    'reports.monthlyreport': ['year', 'month', 'status'],
+    'reports.salaryrecord': ['year', 'month', 'total_hours', 'net_amount', 'status'],
+    'jobs.jobvacancy': ['title', 'status', 'application_deadline'],
+    'jobs.vacancyapplication': ['status', 'applied_at'],
+}
+
+def object_snapshot(obj):
+    """
+    Compact summary of a notification's action object or target, stored with the notification.
+    Has the same shape as GenericObjectSummarySerializer plus a few model-specific fields.
+    """
+    if obj is None:
+        return None
+    snapshot = {'id': obj.pk, 'object_type': obj._meta.model_name, 'display_text': str(obj)}
+    for name in SNAPSHOT_FIELDS.get(obj._meta.label_lower, []):
+        snapshot[name] = getattr(obj, name)
+    return snapshot
+
+def _unread_count_key(user_id):
+    return UNREAD_COUNT_CACHE_KEY.format(user_id=user_id)
+
+def get_unread_count(user):
+    """
+    Returns the user's unread notification count from the cache.
+    On a miss (or after the TTL expired) it is counted from the database and cached again,
+    which also reconciles any drift of the counter. With NOTIFICATION_UNREAD_COUNT_TTL at 0
+    it is always counted from the database.
+    """
+    ttl = settings.NOTIFICATION_UNREAD_COUNT_TTL
+    if ttl <= 0:
+        return Notification.objects.filter(recipient=user, is_read=False).count()
+    key = _unread_count_key(user.pk)
+    count = cache.get(key)
+    if count is None or count < 0:
+        count = Notification.objects.filter(recipient=user, is_read=False).count()
+        cache.set(key, count, timeout=ttl)
+    return count
+
+def _adjust_unread_counts(deltas):
+    for user_id, delta in deltas.items():
+        try:
+            cache.incr(_unread_count_key(user_id), delta)
+        except ValueError:
+            # Not cached; the next read counts from the database.
+            pass
+
+def adjust_unread_counts_on_commit(deltas):
+    """
+    Applies {user_id: delta} to the cached counters once the current transaction commits,
+    so rolled-back notifications never show up in the counters.
+    """
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    if deltas and settings.NOTIFICATION_UNREAD_COUNT_TTL > 0:
+        transaction.on_commit(lambda: _adjust_unread_counts(deltas))
+
 def create_notification(recipient, actor, verb, message, action_object=None, target=None):
     """
     Create a new notification.
@@ -18,7 +85,64 @@ def create_notification(recipient, actor, verb, message, action_object=None, tar
     )
     if action_object:
         notification.action_object = action_object
+        notification.action_object_snapshot = object_snapshot(action_object)
     if target:
         notification.target = target
-    
-    notification.save()
\ No newline at end of file
+        notification.target_snapshot = object_snapshot(target)
+
+    notification.save()
+    adjust_unread_counts_on_commit({notification.recipient_id: 1})
+
+def _pk(value):
+    return getattr(value, 'pk', value)
+
+def create_notifications_bulk(recipients, actor, verb, message, action_object=None, target=None, batch_size=NOTIFICATION_BATCH_SIZE):
+    """
+    Create notifications for many recipients with a handful of queries.
+    `recipients` holds users (or user ids), or (recipient, action_object) pairs when
+    every notification points at its own object. `verb` and `message` may be callables
+    receiving the action object, for per-object wording.
+    Content types and snapshots are resolved once per model/object and self-notifications are skipped.
+    """
+    content_types = {}
+    snapshots = {}
+
+    def content_type_for(obj):
+        model = type(obj)
+        if model not in content_types:
+            content_types[model] = ContentType.objects.get_for_model(obj)
+        return content_types[model]
+
+    def snapshot_for(obj):
+        key = (type(obj), obj.pk)
+        if key not in snapshots:
+            snapshots[key] = object_snapshot(obj)
+        return snapshots[key]
+
+    actor_id = _pk(actor)
+    notifications = []
+    for item in recipients:
+        recipient, obj = item if isinstance(item, tuple) else (item, action_object)
+        recipient_id = _pk(recipient)
+        if recipient_id == actor_id:
+            continue
+
+        notification = Notification(
+            recipient_id=recipient_id,
+            actor_id=actor_id,
+            verb=verb(obj) if callable(verb) else verb,
+            message=message(obj) if callable(message) else message,
+        )
+        if obj:
+            notification.action_object_content_type = content_type_for(obj)
+            notification.action_object_id = obj.pk
+            notification.action_object_snapshot = snapshot_for(obj)
+        if target:
+            notification.target_content_type = content_type_for(target)
+            notification.target_id = target.pk
+            notification.target_snapshot = snapshot_for(target)
+        notifications.append(notification)
+
+    notifications = Notification.objects.bulk_create(notifications, batch_size=batch_size)
+    adjust_unread_counts_on_commit(Counter(notification.recipient_id for notification in notifications))
+    return notifications
@@ -7,7 +7,9 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from .models import Notification
 from drf_spectacular.utils import extend_schema_view, OpenApiParameter, OpenApiResponse
-from .serializers import NotificationListSerializer, NotificationDetailSerializer
+from .serializers import NotificationListSerializer, NotificationDetailSerializer, generic_summary_prefetches
+from .utils import adjust_unread_counts_on_commit, get_unread_count
+from apps.common.pagination import FeedPagination
 
 @extend_schema_view(
     list=extend_schema(
@@ -16,6 +18,9 @@ from .serializers import NotificationListSerializer, NotificationDetailSerialize
     ),
     retrieve=extend_schema(
         summary="🔔 View a single notification",
+        parameters=[
+            OpenApiParameter(name='expand', description="'live' serializes the current action object and target instead of the stored snapshot.", required=False, type=str, enum=['live']),
+        ],
         responses=NotificationDetailSerializer
     ),
     mark_as_read=extend_schema(summary="✔️ Mark notification as read"),
@@ -27,6 +32,9 @@ class NotificationViewSet(mixins.ListModelMixin,
                         viewsets.GenericViewSet):
     
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = FeedPagination
+    keyset_ordering = ('-created_at', '-id')
+
     def get_serializer_class(self):
         if self.action == 'list':
             return NotificationListSerializer
@@ -34,26 +42,33 @@ class NotificationViewSet(mixins.ListModelMixin,
     def get_queryset(self):
         if getattr(self, 'swagger_fake_view', False):
             return Notification.objects.none()
-        return Notification.objects.filter(recipient=self.request.user)
+        queryset = Notification.objects.filter(recipient=self.request.user)
+        if self.action == 'list':
+            queryset = queryset.select_related('actor').prefetch_related(
+                *generic_summary_prefetches('action_object', 'target')
+            )
+        elif self.action == 'retrieve':
+            queryset = queryset.select_related('actor')
+        return queryset
 
     @action(detail=True, methods=['post'])
     def mark_as_read(self, request, pk=None):
         """Mark a single notification as read."""
         notification = self.get_object()
-        notification.is_read = True
-        notification.save()
+        # Only a notification that was actually unread changes the counter.
+        updated = Notification.objects.filter(pk=notification.pk, is_read=False).update(is_read=True)
+        adjust_unread_counts_on_commit({request.user.pk: -updated})
         return Response({'status': 'marked as read'}, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['post'])
     def mark_all_as_read(self, request):
         """Mark all unread notifications as read."""
-        unread_notifications = self.get_queryset().filter(is_read=False)
-        count = unread_notifications.count()
-        unread_notifications.update(is_read=True)
+        count = self.get_queryset().filter(is_read=False).update(is_read=True)
+        adjust_unread_counts_on_commit({request.user.pk: -count})
         return Response({'status': f'{count} notifications marked as read'}, status=status.HTTP_200_OK)
     
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
         """Get the count of unread notifications."""
-        count = self.get_queryset().filter(is_read=False).count()
+        count = get_unread_count(request.user)
         return Response({'unread_count': count}, status=status.HTTP_200_OK)
\ No newline at end of file
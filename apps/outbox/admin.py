@@ -0,0 +1,20 @@
+# apps/outbox/admin.py
+
+from django.contrib import admin
+from .handlers import HANDLERS
+from .models import OutboxMessage
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ('id', 'topic', 'status', 'attempts', 'available_at', 'created_at', 'processed_at')
+    list_filter = ('status', 'topic')
+    # The raw payload is never editable; payloads of sensitive topics (e.g. welcome emails with passwords) are not shown at all.
+    exclude = ('payload',)
+    readonly_fields = ('payload_display', 'created_at', 'processed_at', 'last_error')
+
+    @admin.display(description="Payload")
+    def payload_display(self, obj):
+        _, sensitive = HANDLERS.get(obj.topic, (None, False))
+        if sensitive:
+            return "(hidden)"
+        return obj.payload
@@ -0,0 +1,72 @@
+# apps/outbox/handlers.py
+
+import logging
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# topic -> (handler, sensitive). Payloads of sensitive topics are wiped once the message is finished.
+HANDLERS = {}
+
+
+class OutboxDeliveryError(Exception):
+    """Raised by a handler when delivery failed and should be retried."""
+
+
+def register(topic, sensitive=False):
+    def decorator(func):
+        HANDLERS[topic] = (func, sensitive)
+        return func
+    return decorator
+
+
+@register('users.welcome_email', sensitive=True)
+def send_welcome_email(payload):
+    lambda_url = settings.LAMBDA_WELCOME_EMAIL_URL
+    api_key = settings.LAMBDA_API_KEY
+    if not lambda_url or not api_key:
+        logger.warning("Lambda URL or API Key is not configured. Skipping welcome email for %s.", payload.get('email'))
+        return
+
+    headers = {
+        "Content-Type": "application/json",
+        "x-api-key": api_key
+    }
+    response = requests.post(lambda_url, json=payload, headers=headers, timeout=settings.OUTBOX_HTTP_TIMEOUT)
+    if response.status_code != 200:
+        raise OutboxDeliveryError(f"Lambda returned {response.status_code}: {response.text[:500]}")
+    logger.info("Welcome email triggered for %s.", payload.get('email'))
+
+
+@register('meetings.create_calendar_event')
+def create_meeting_calendar_event(payload):
+    from apps.meetings.google_api import create_google_meet_event, meeting_event_id
+    from apps.meetings.models import Meeting
+
+    if not getattr(settings, 'GOOGLE_SERVICE_ACCOUNT_FILE', None):
+        logger.warning("Google Service Account file is not configured. Skipping calendar event.")
+        return
+
+    meeting = Meeting.objects.filter(pk=payload['meeting_id']).first()
+    if meeting is None or (meeting.google_event_id and meeting.meeting_link):
+        return
+
+    attendee_emails = [email for email in meeting.attendees.values_list('user__email', flat=True) if email]
+    if not attendee_emails:
+        return
+
+    # The event id is fixed per meeting, so a retry (or a second delivery) reads back the event
+    # an earlier attempt created instead of creating another one.
+    link, event_id = create_google_meet_event(
+        meeting.title, meeting.description, meeting.start_time,
+        meeting.end_time, attendee_emails, event_id=meeting.google_event_id or meeting_event_id(meeting.pk)
+    )
+    if event_id and event_id != meeting.google_event_id:
+        meeting.google_event_id = event_id
+        meeting.save(update_fields=['google_event_id'])
+    if not link:
+        raise OutboxDeliveryError(f"Google Calendar event could not be created for meeting #{meeting.pk}.")
+
+    meeting.meeting_link = link
+    meeting.save(update_fields=['meeting_link'])
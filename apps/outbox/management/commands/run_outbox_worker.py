@@ -0,0 +1,48 @@
+# apps/outbox/management/commands/run_outbox_worker.py
+
+import signal
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.outbox.worker import process_batch
+
+
+class Command(BaseCommand):
+    help = "Delivers pending outbox messages (welcome emails, calendar events) with retries and dead-lettering."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.OUTBOX_BATCH_SIZE)
+        parser.add_argument('--poll-interval', type=float, default=settings.OUTBOX_POLL_INTERVAL,
+                            help="Seconds to sleep when there is nothing to deliver.")
+        parser.add_argument('--once', action='store_true', help="Drain the due messages and exit.")
+
+    def handle(self, *args, **options):
+        # A lease covers one delivery (see renew_lease); it must outlast the slowest one, or
+        # another worker could pick the message up mid-delivery and send it twice.
+        if settings.OUTBOX_LEASE_SECONDS <= 2 * settings.OUTBOX_HTTP_TIMEOUT:
+            raise CommandError(
+                f"OUTBOX_LEASE_SECONDS ({settings.OUTBOX_LEASE_SECONDS}) must be more than twice "
+                f"OUTBOX_HTTP_TIMEOUT ({settings.OUTBOX_HTTP_TIMEOUT})."
+            )
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        self.stdout.write("Outbox worker started.")
+
+        while not self.stopping:
+            close_old_connections()
+            processed = process_batch(options['batch_size'])
+            if processed:
+                self.stdout.write(f"Processed {processed} outbox messages.")
+                continue
+            if options['once']:
+                break
+            time.sleep(options['poll_interval'])
+
+        self.stdout.write("Outbox worker stopped.")
+
+    def _stop(self, signum, frame):
+        # Finish the current batch, then exit.
+        self.stopping = True
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+def scrub_passwords(apps, schema_editor):
+    # Welcome emails no longer carry the password; remove it from messages queued before.
+    OutboxMessage = apps.get_model('outbox', 'OutboxMessage')
+    messages = OutboxMessage.objects.filter(topic='users.welcome_email', payload__has_key='password')
+    for message in messages.iterator():
+        message.payload.pop('password', None)
+        message.save(update_fields=['payload'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outbox', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(scrub_passwords, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# apps/outbox/models.py
+
+from django.db import models
+from django.utils import timezone
+
+class OutboxMessage(models.Model):
+    """
+    A side effect (e-mail, calendar event, ...) recorded in the same transaction as the
+    change that caused it, and delivered later by the `run_outbox_worker` command.
+    """
+    STATUS_CHOICES = (
+        ('PENDING', 'Pending'),
+        ('DONE', 'Done'),
+        ('DEAD', 'Dead'),
+    )
+    topic = models.CharField(max_length=100, verbose_name="Topic")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="Payload")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Delivery attempts")
+    available_at = models.DateTimeField(default=timezone.now, verbose_name="Next attempt at")
+    last_error = models.TextField(blank=True, null=True, verbose_name="Last error")
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'outbox_messages'
+        ordering = ['id']
+        indexes = [
+            models.Index(
+                fields=['available_at', 'id'],
+                condition=models.Q(status='PENDING'),
+                name='outbox_pending_idx'
+            ),
+        ]
+        verbose_name = "Outbox Message"
+        verbose_name_plural = "Outbox Messages"
+
+    def __str__(self):
+        return f"{self.topic} #{self.pk} ({self.status})"
@@ -0,0 +1,10 @@
+# apps/outbox/utils.py
+
+from .models import OutboxMessage
+
+def enqueue(topic, payload):
+    """
+    Record a side effect for the outbox worker.
+    Call it inside the transaction that caused the side effect, so both commit or roll back together.
+    """
+    return OutboxMessage.objects.create(topic=topic, payload=payload)
@@ -0,0 +1,105 @@
+# apps/outbox/worker.py
+
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .handlers import HANDLERS
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts):
+    """Exponential backoff: base, 2*base, 4*base ... capped at OUTBOX_RETRY_MAX_DELAY seconds."""
+    delay = settings.OUTBOX_RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(delay, settings.OUTBOX_RETRY_MAX_DELAY))
+
+
+def claim_batch(batch_size):
+    """
+    Leases up to `batch_size` due messages to this worker and returns them.
+    Rows locked by another worker are skipped, and pushing `available_at` forward by the lease
+    keeps them away from other workers while the external calls run outside any transaction.
+    Each message's lease is restarted when its delivery begins (see renew_lease).
+    If the worker dies mid-batch the lease simply expires and the messages are picked up again.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(status='PENDING', available_at__lte=now)
+            .order_by('available_at', 'id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if ids:
+            OutboxMessage.objects.filter(id__in=ids).update(
+                available_at=now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+            )
+    return list(OutboxMessage.objects.filter(id__in=ids).order_by('id'))
+
+
+def deliver(message):
+    """Runs the handler of one message, outside any transaction, and records the outcome on it."""
+    handler, sensitive = HANDLERS.get(message.topic, (None, False))
+    message.attempts += 1
+    if handler is None:
+        message.status = 'DEAD'
+        message.last_error = f"No handler registered for topic '{message.topic}'."
+    else:
+        try:
+            # No transaction around the handler: its external calls must not hold a connection
+            # open in a transaction. Handlers keep their own database writes atomic.
+            handler(message.payload)
+        except Exception as e:
+            message.last_error = f"{type(e).__name__}: {e}"
+            if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                message.status = 'DEAD'
+            else:
+                message.available_at = timezone.now() + retry_delay(message.attempts)
+        else:
+            message.status = 'DONE'
+            message.last_error = None
+
+    if message.status == 'DEAD':
+        logger.error("Outbox message #%s (%s) dead-lettered after %s attempts: %s",
+                     message.pk, message.topic, message.attempts, message.last_error)
+    elif message.status == 'PENDING':
+        logger.warning("Outbox message #%s (%s) failed, retrying at %s: %s",
+                       message.pk, message.topic, message.available_at, message.last_error)
+
+    if message.status != 'PENDING':
+        message.processed_at = timezone.now()
+        if sensitive:
+            message.payload = {}
+    message.save(update_fields=['status', 'attempts', 'available_at', 'last_error', 'processed_at', 'payload'])
+
+
+def renew_lease(message):
+    """
+    Restarts the message's lease right before it is delivered, so the lease covers one
+    delivery rather than the whole batch. The update only matches while the lease this worker
+    took is still in place; returns False when it expired and another worker may own the message.
+    """
+    lease_until = timezone.now() + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+    renewed = OutboxMessage.objects.filter(
+        pk=message.pk, status='PENDING', available_at=message.available_at
+    ).update(available_at=lease_until)
+    if renewed:
+        message.available_at = lease_until
+    return bool(renewed)
+
+
+def process_batch(batch_size=None):
+    """Claims and delivers one batch. Returns the number of messages handled."""
+    messages = claim_batch(batch_size or settings.OUTBOX_BATCH_SIZE)
+    handled = 0
+    for message in messages:
+        if not renew_lease(message):
+            logger.warning("Outbox message #%s lease expired before delivery; leaving it to another worker.", message.pk)
+            continue
+        deliver(message)
+        handled += 1
+    return handled
@@ -1,7 +1,7 @@
 # apps/reports/admin.py
 
 from django.contrib import admin
-from .models import DailyReport, MonthlyReport, SalaryRecord
+from .models import DailyReport, MonthlyHoursRollup, MonthlyReport, SalaryRecord
 
 @admin.register(DailyReport)
 class DailyReportAdmin(admin.ModelAdmin):
@@ -10,6 +10,13 @@ class DailyReportAdmin(admin.ModelAdmin):
     search_fields = ('student__first_name', 'student__last_name', 'work_description')
     date_hierarchy = 'report_date'
 
+@admin.register(MonthlyHoursRollup)
+class MonthlyHoursRollupAdmin(admin.ModelAdmin):
+    list_display = ('student', 'workspace', 'year', 'month', 'total_hours', 'report_count', 'updated_at')
+    list_filter = ('year', 'month')
+    search_fields = ('student__first_name', 'student__last_name')
+    raw_id_fields = ('student', 'workspace')
+
 @admin.register(MonthlyReport)
 class MonthlyReportAdmin(admin.ModelAdmin):
     list_display = ('student', 'year', 'month', 'status', 'created_at')
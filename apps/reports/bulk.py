@@ -0,0 +1,28 @@
+# apps/reports/bulk.py
+
+def select_for_bulk(queryset, selection, result):
+    """
+    Locks and returns the records picked by a bulk action: the requested `ids`, everything
+    matching `filters`, or the requested ids that also match the filters.
+    Rows are locked in id order so concurrent bulk actions cannot deadlock each other.
+    Requested ids that were not found are recorded on `result`.
+    """
+    filters = selection.get('filters') or {}
+    lookups = {
+        'workspace_id': filters.get('workspace'),
+        'year': filters.get('year'),
+        'month': filters.get('month'),
+        'status': filters.get('status'),
+    }
+    queryset = queryset.filter(**{name: value for name, value in lookups.items() if value is not None})
+    ids = selection.get('ids')
+    if ids:
+        queryset = queryset.filter(id__in=ids)
+
+    records = list(queryset.order_by('id'))
+    if ids:
+        found = {record.id for record in records}
+        for pk in ids:
+            if pk not in found:
+                result.not_found(pk)
+    return records
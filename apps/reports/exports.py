@@ -0,0 +1,105 @@
+# apps/reports/exports.py
+
+import csv
+from tempfile import SpooledTemporaryFile
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from openpyxl import Workbook
+
+EXPORT_FORMATS = ('csv', 'xlsx')
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+# Bytes per chunk when streaming a finished workbook.
+XLSX_STREAM_BLOCK_SIZE = 64 * 1024
+
+# (header, lookup) pairs; lookups are read with values_list(), so no model instances are built.
+SALARY_EXPORT_COLUMNS = [
+    ("ID", 'id'),
+    ("Student ID", 'student_id'),
+    ("Student Email", 'student__email'),
+    ("First Name", 'student__first_name'),
+    ("Last Name", 'student__last_name'),
+    ("Workspace ID", 'workspace_id'),
+    ("Workspace", 'workspace__name'),
+    ("Year", 'year'),
+    ("Month", 'month'),
+    ("Total Hours", 'total_hours'),
+    ("Hourly Rate", 'hourly_rate'),
+    ("Gross Amount", 'gross_amount'),
+    ("Deduction %", 'deduction_percentage'),
+    ("Deduction Amount", 'deduction_amount'),
+    ("Net Amount", 'net_amount'),
+    ("Status", 'status'),
+    ("Approved At", 'approved_at'),
+    ("Paid At", 'paid_at'),
+]
+
+DAILY_REPORT_EXPORT_COLUMNS = [
+    ("ID", 'id'),
+    ("Student ID", 'student_id'),
+    ("Student Email", 'student__email'),
+    ("First Name", 'student__first_name'),
+    ("Last Name", 'student__last_name'),
+    ("Workspace ID", 'workspace_id'),
+    ("Workspace", 'workspace__name'),
+    ("Report Date", 'report_date'),
+    ("Hours Worked", 'hours_worked'),
+    ("Work Description", 'work_description'),
+    ("Created At", 'created_at'),
+]
+
+
+class Echo:
+    """File-like object whose write() hands the value back, so csv.writer can feed a generator."""
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, columns):
+    """Streams the rows with a server-side cursor, `EXPORT_CHUNK_SIZE` rows per round trip."""
+    return queryset.values_list(*[lookup for _, lookup in columns]).iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+
+def _excel_value(value):
+    # Excel has no time zones; write local wall-clock time.
+    if hasattr(value, 'tzinfo') and value.tzinfo is not None:
+        return timezone.localtime(value).replace(tzinfo=None)
+    return value
+
+
+def stream_csv(columns, rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow([header for header, _ in columns])
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_xlsx(sheet_title, columns, rows):
+    """
+    Writes the rows into a write-only workbook (one row in memory at a time), spooled to disk
+    once it grows past `EXPORT_SPOOL_MAX_SIZE`, then streams the finished file in blocks.
+    An XLSX archive can only be written once all rows are in, so the first byte arrives after
+    the whole sheet is built; CSV starts streaming with the first row and suits the largest exports.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title)
+    sheet.append([header for header, _ in columns])
+    for row in rows:
+        sheet.append([_excel_value(value) for value in row])
+    with SpooledTemporaryFile(max_size=settings.EXPORT_SPOOL_MAX_SIZE) as buffer:
+        workbook.save(buffer)
+        buffer.seek(0)
+        while block := buffer.read(XLSX_STREAM_BLOCK_SIZE):
+            yield block
+
+
+def export_response(queryset, columns, file_name, file_format):
+    """StreamingHttpResponse with the queryset exported as CSV or XLSX."""
+    rows = export_rows(queryset, columns)
+    if file_format == 'xlsx':
+        response = StreamingHttpResponse(stream_xlsx(file_name[:31], columns, rows), content_type=XLSX_CONTENT_TYPE)
+    else:
+        response = StreamingHttpResponse(stream_csv(columns, rows), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{file_name}.{file_format}"'
+    return response
@@ -1,97 +1,103 @@
 # apps/reports/jobs.py
 
+import logging
+from collections import defaultdict
 from django.utils import timezone
-from django.db.models import Sum
-from openpyxl import Workbook
-from django.core.files.base import ContentFile
-from decimal import Decimal
+from django.db import transaction
 
 from apps.users.models import User
-from .models import DailyReport, SalaryRecord, MonthlyReport
-from apps.workspaces.models import Workspace, WorkspaceMember
-from apps.notifications.utils import create_notification
+from .models import SalaryRecord, MonthlyReport
+from .payroll import collect_monthly_totals, build_salary_records, monthly_reports_queryset
+from .rendering import ReportFile, delete_report_files, render_and_upload_report_files
+from apps.workspaces.models import Workspace
+from apps.notifications.utils import create_notifications_bulk
 
-def generate_monthly_reports_and_salaries():
+logger = logging.getLogger(__name__)
+
+# Student/workspace pairs whose reports are rendered, uploaded and saved together.
+MONTHLY_REPORT_CHUNK_SIZE = 500
+
+def generate_monthly_reports_and_salaries(year=None, month=None, chunk_size=MONTHLY_REPORT_CHUNK_SIZE):
     """
     Creates separate monthly reports and salaries for all students for the past month for each work area.
+    `year` and `month` select another month (backfills); pairs that already have a report are skipped.
+    Pairs are handled `chunk_size` at a time, each chunk committed on its own, so memory stays flat
+    however many students there are; a failed run is resumed by running it again.
+    The number of queries grows with the number of chunks only.
+    Returns the number of reports created.
     """
-    print(f"Generating monthly reports... {timezone.now()}")
-    today = timezone.now().date()
-    first_day_of_current_month = today.replace(day=1)
-    last_day_of_previous_month = first_day_of_current_month - timezone.timedelta(days=1)
-    year = last_day_of_previous_month.year
-    month = last_day_of_previous_month.month
+    if year is None or month is None:
+        today = timezone.localdate()
+        first_day_of_current_month = today.replace(day=1)
+        last_day_of_previous_month = first_day_of_current_month - timezone.timedelta(days=1)
+        year = last_day_of_previous_month.year
+        month = last_day_of_previous_month.month
+    logger.info("Generating monthly reports for %s-%s.", year, month)
 
-    students_with_reports = User.objects.filter(
-        user_type='STUDENT',
-        daily_reports__report_date__year=year,
-        daily_reports__report_date__month=month
-    ).distinct()
+    created = 0
+    while True:
+        # Saved pairs drop out of collect_monthly_totals, so every pass picks up the next chunk.
+        rows = collect_monthly_totals(year, month, limit=chunk_size)
+        if not rows:
+            break
+        created += _generate_chunk(year, month, rows)
 
-    for student in students_with_reports:
-        workspaces = Workspace.objects.filter(
-            daily_reports__student=student,
-            daily_reports__report_date__year=year,
-            daily_reports__report_date__month=month
-        ).distinct()
+    if not created:
+        logger.info("No new monthly reports to generate for %s-%s.", year, month)
+        return 0
+    logger.info("Monthly report generation completed: %d reports created.", created)
+    return created
 
-        for workspace in workspaces:
-            if MonthlyReport.objects.filter(student=student, workspace=workspace, year=year, month=month).exists():
-                print(f"This monthly report for {student.get_full_name()} in workspace '{workspace.name}' for {year}-{month} already exists. Skipping...")
-                continue
-            reports = DailyReport.objects.filter(student=student, workspace=workspace, report_date__year=year, report_date__month=month)
-            total_hours = reports.aggregate(Sum('hours_worked'))['hours_worked__sum'] or Decimal('0.00')
-            final_hourly_rate = Decimal('0.00')
-            job = getattr(workspace, 'job', None) 
-            
-            if job:
-                try:
-                    member_record = WorkspaceMember.objects.get(user=student, workspace=workspace)
-                    if member_record.hourly_rate_override is not None:
-                        final_hourly_rate = member_record.hourly_rate_override
-                    else:
-                        final_hourly_rate = job.base_hourly_rate
-                except WorkspaceMember.DoesNotExist:
-                    final_hourly_rate = job.base_hourly_rate
+def _generate_chunk(year, month, rows):
+    """Renders, uploads and saves the reports and salaries of one chunk of pairs."""
+    pairs = {(row['student_id'], row['workspace_id']) for row in rows}
+    students = User.objects.in_bulk({student_id for student_id, _ in pairs})
+    workspaces = Workspace.objects.in_bulk({workspace_id for _, workspace_id in pairs})
 
-            salary = SalaryRecord.objects.create(
-                student=student,
-                workspace=workspace,
-                year=year,
-                month=month,
-                total_hours=total_hours,
-                hourly_rate=final_hourly_rate
+    daily_rows = defaultdict(list)
+    reports = monthly_reports_queryset(year, month).filter(student_id__in=students).order_by('report_date').values_list(
+        'student_id', 'workspace_id', 'report_date', 'hours_worked', 'work_description'
+    )
+    for student_id, workspace_id, report_date, hours_worked, work_description in reports:
+        if (student_id, workspace_id) in pairs:
+            daily_rows[(student_id, workspace_id)].append(
+                [report_date.strftime("%Y-%m-%d"), hours_worked, work_description]
             )
 
-            workbook = Workbook()
-            sheet = workbook.active
-            sheet.title = f"{year}-{month} Report"
-            headers = ["Date", "Hours Worked", "Work Description"]
-            sheet.append(headers)
-            for report in reports.order_by('report_date'):
-                row = [report.report_date.strftime("%Y-%m-%d"), report.hours_worked, report.work_description]
-                sheet.append(row)
-            
-            excel_file_in_memory = ContentFile(b'')
-            workbook.save(excel_file_in_memory)
+    salaries = build_salary_records(year, month, rows)
+    report_files = []
+    for salary in salaries:
+        student = students[salary.student_id]
+        workspace = workspaces[salary.workspace_id]
+        file_name = f"{student.first_name.lower()}_{workspace.name.replace(' ', '_').lower()}_{year}-{month}.xlsx"
+        monthly_report = MonthlyReport(
+            student=student,
+            workspace=workspace,
+            year=year,
+            month=month,
+        )
+        report_files.append(ReportFile(monthly_report, file_name, f"{year}-{month} Report", daily_rows.pop((student.id, workspace.id), [])))
 
-            file_name = f"{student.first_name.lower()}_{workspace.name.replace(' ', '_').lower()}_{year}-{month}.xlsx"
-            monthly_report = MonthlyReport(
-                student=student,
-                workspace=workspace,
-                salary=salary,
-                year=year,
-                month=month,
-            )
-            monthly_report.file.save(file_name, excel_file_in_memory, save=True)
-            print(f"This monthly report for {student.get_full_name()} in workspace '{workspace.name}' for {year}-{month} has been created.")
+    try:
+        render_and_upload_report_files(report_files)
+        logger.info("%d monthly report files for %s-%s have been uploaded.", len(report_files), year, month)
 
-            create_notification(
-                recipient=student,
+        with transaction.atomic():
+            salaries = SalaryRecord.objects.bulk_create(salaries)
+            monthly_reports = []
+            for salary, report_file in zip(salaries, report_files):
+                report_file.monthly_report.salary = salary
+                monthly_reports.append(report_file.monthly_report)
+            monthly_reports = MonthlyReport.objects.bulk_create(monthly_reports)
+
+            create_notifications_bulk(
+                [(monthly_report.student, monthly_report) for monthly_report in monthly_reports],
                 actor=None,
                 verb="Monthly report generated",
-                message=f"Your report for {year}-{month} in workspace '{workspace.name}' is ready. Please check it.",
-                action_object=monthly_report
+                message=lambda monthly_report: f"Your report for {year}-{month} in workspace '{monthly_report.workspace.name}' is ready. Please check it."
             )
-
-    print("Monthly report generation completed.")
+    except Exception:
+        # Nothing of this chunk was saved, so its uploaded files would be orphaned; the next run uploads them again.
+        delete_report_files(report_files)
+        raise
+    return len(monthly_reports)
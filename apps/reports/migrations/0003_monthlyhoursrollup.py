@@ -0,0 +1,59 @@
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rollups(apps, schema_editor):
+    DailyReport = apps.get_model('reports', 'DailyReport')
+    MonthlyHoursRollup = apps.get_model('reports', 'MonthlyHoursRollup')
+    totals = (
+        DailyReport.objects.values('student_id', 'workspace_id', 'report_date__year', 'report_date__month')
+        .annotate(total_hours=Sum('hours_worked'), report_count=Count('id'))
+        .order_by()
+    )
+    MonthlyHoursRollup.objects.bulk_create([
+        MonthlyHoursRollup(
+            student_id=row['student_id'],
+            workspace_id=row['workspace_id'],
+            year=row['report_date__year'],
+            month=row['report_date__month'],
+            total_hours=row['total_hours'],
+            report_count=row['report_count'],
+        )
+        for row in totals.iterator()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_initial'),
+        ('workspaces', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyHoursRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField(verbose_name='Year')),
+                ('month', models.IntegerField(verbose_name='Month')),
+                ('total_hours', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=6, verbose_name='Total hours')),
+                ('report_count', models.PositiveIntegerField(default=0, verbose_name='Daily reports')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_hours_rollups', to=settings.AUTH_USER_MODEL)),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_hours_rollups', to='workspaces.workspace')),
+            ],
+            options={
+                'verbose_name': 'Monthly Hours Rollup',
+                'verbose_name_plural': 'Monthly Hours Rollups',
+                'db_table': 'monthly_hours_rollups',
+                'ordering': ['-year', '-month'],
+                'unique_together': {('student', 'workspace', 'year', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and avoids
+    # blocking writes to the daily reports table while the index is built.
+    atomic = False
+
+    dependencies = [
+        ('reports', '0003_monthlyhoursrollup'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='dailyreport',
+            index=models.Index(fields=['student', '-created_at', '-id'], name='daily_reports_student_feed_idx'),
+        ),
+    ]
@@ -1,7 +1,7 @@
 # apps/reports/models.py
 
 from decimal import Decimal
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
 from apps.users.models import User
 from apps.workspaces.models import Workspace
@@ -32,12 +32,50 @@ class DailyReport(models.Model):
         db_table = 'daily_reports'
         ordering = ['-report_date']
         unique_together = ('student', 'report_date', 'workspace')
+        indexes = [
+            # Daily report feed: a student's reports, newest first (keyset pagination on created_at, id).
+            models.Index(fields=['student', '-created_at', '-id'], name='daily_reports_student_feed_idx'),
+        ]
         verbose_name = "Daily Report"
         verbose_name_plural = "Daily Reports"
 
     def __str__(self):
         return f"{self.student.get_full_name()} report ({self.workspace.name}) - {self.report_date}"
 
+    # The rollup update in the post_save/post_delete signals commits together with the report,
+    # which rebuild_monthly_rollups relies on.
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            return super().delete(*args, **kwargs)
+
+class MonthlyHoursRollup(models.Model):
+    """
+    Running total of a student's reported hours in a workspace for one month.
+    Kept up to date from DailyReport saves and deletes (see signals.py), so month-to-date
+    figures and month-end payroll never have to aggregate the raw daily reports.
+    """
+    student = models.ForeignKey(User, on_delete=models.CASCADE, related_name='monthly_hours_rollups')
+    workspace = models.ForeignKey(Workspace, on_delete=models.CASCADE, related_name='monthly_hours_rollups')
+    year = models.IntegerField(verbose_name="Year")
+    month = models.IntegerField(verbose_name="Month")
+    total_hours = models.DecimalField(max_digits=6, decimal_places=2, default=Decimal('0.00'), verbose_name="Total hours")
+    report_count = models.PositiveIntegerField(default=0, verbose_name="Daily reports")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'monthly_hours_rollups'
+        ordering = ['-year', '-month']
+        unique_together = ('student', 'workspace', 'year', 'month')
+        verbose_name = "Monthly Hours Rollup"
+        verbose_name_plural = "Monthly Hours Rollups"
+
+    def __str__(self):
+        return f"{self.student_id} / {self.workspace_id} - {self.year}/{self.month}: {self.total_hours}h"
+
 class SalaryRecord(models.Model):
     """Model for each student's monthly salary record."""
     STATUS_CHOICES = (
@@ -69,10 +107,14 @@ class SalaryRecord(models.Model):
         verbose_name = "Monthly Salary Record"
         verbose_name_plural = "Monthly Salary Records"
 
-    def save(self, *args, **kwargs):
+    def calculate_amounts(self):
+        """Fills gross, deduction and net amounts from hours, rate and deduction percentage."""
         self.gross_amount = Decimal(self.total_hours) * Decimal(self.hourly_rate)
         self.deduction_amount = (self.gross_amount * Decimal(self.deduction_percentage)) / Decimal(100)
         self.net_amount = self.gross_amount - self.deduction_amount
+
+    def save(self, *args, **kwargs):
+        self.calculate_amounts()
         super().save(*args, **kwargs)
 
     def __str__(self):
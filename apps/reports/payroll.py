@@ -0,0 +1,92 @@
+# apps/reports/payroll.py
+
+from datetime import date
+from decimal import Decimal
+from django.db.models import Exists, F, FilteredRelation, OuterRef, Q
+
+from .models import DailyReport, MonthlyHoursRollup, SalaryRecord, MonthlyReport
+
+
+def month_bounds(year, month):
+    """Returns the first day of the month and the first day of the following month."""
+    first_day = date(year, month, 1)
+    if month == 12:
+        return first_day, date(year + 1, 1, 1)
+    return first_day, date(year, month + 1, 1)
+
+
+def monthly_reports_queryset(year, month):
+    """Daily reports of students for the given month."""
+    first_day, next_first_day = month_bounds(year, month)
+    return DailyReport.objects.filter(
+        report_date__gte=first_day,
+        report_date__lt=next_first_day,
+        student__user_type='STUDENT'
+    )
+
+
+def monthly_totals_queryset(year, month):
+    """
+    Precomputed (student, workspace) hour totals for the month, read from MonthlyHoursRollup,
+    together with the job's base rate and the member's personal rate override.
+    """
+    return (
+        MonthlyHoursRollup.objects.filter(year=year, month=month, report_count__gt=0)
+        .annotate(membership=FilteredRelation(
+            'workspace__members', condition=Q(workspace__members__user=F('student'))
+        ))
+        .values('student_id', 'workspace_id', 'total_hours')
+        .annotate(
+            job_id=F('workspace__job__id'),
+            base_hourly_rate=F('workspace__job__base_hourly_rate'),
+            hourly_rate_override=F('membership__hourly_rate_override'),
+        )
+        .order_by('student_id', 'workspace_id')
+    )
+
+
+def collect_monthly_totals(year, month, limit=None):
+    """
+    Returns one row per student/workspace pair that reported hours in the given month
+    and has no monthly report yet (the first `limit` pairs, if given). The hours come from
+    the rollup table in one query, so month-end payroll no longer aggregates the raw daily reports.
+    """
+    existing_reports = MonthlyReport.objects.filter(
+        student=OuterRef('student'), workspace=OuterRef('workspace'), year=year, month=month
+    )
+    rows = (
+        monthly_totals_queryset(year, month)
+        .filter(student__user_type='STUDENT')
+        .exclude(Exists(existing_reports))
+    )
+    return list(rows if limit is None else rows[:limit])
+
+
+def resolve_hourly_rate(row):
+    """
+    Personal override wins over the job's standard rate.
+    Workspaces without a job are paid at zero, as before.
+    """
+    if row['job_id'] is None:
+        return Decimal('0.00')
+    if row['hourly_rate_override'] is not None:
+        return row['hourly_rate_override']
+    return row['base_hourly_rate']
+
+
+def build_salary_record(year, month, row):
+    """Builds an unsaved salary record with the same amounts `SalaryRecord.save()` would compute."""
+    salary = SalaryRecord(
+        student_id=row['student_id'],
+        workspace_id=row['workspace_id'],
+        year=year,
+        month=month,
+        total_hours=row['total_hours'] or Decimal('0.00'),
+        hourly_rate=resolve_hourly_rate(row)
+    )
+    salary.calculate_amounts()
+    return salary
+
+
+def build_salary_records(year, month, rows):
+    return [build_salary_record(year, month, row) for row in rows]
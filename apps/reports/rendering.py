@@ -0,0 +1,104 @@
+# apps/reports/rendering.py
+
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from tempfile import NamedTemporaryFile
+
+from django.conf import settings
+from django.core.files import File
+from openpyxl import Workbook
+
+MONTHLY_REPORT_HEADERS = ["Date", "Hours Worked", "Work Description"]
+
+# One workbook to render: the unsaved MonthlyReport whose `file` receives the upload,
+# the target file name, the sheet title and the plain data rows.
+ReportFile = namedtuple('ReportFile', ['monthly_report', 'file_name', 'sheet_title', 'rows'])
+
+
+def render_monthly_report(sheet_title, rows):
+    """
+    Renders a monthly report workbook into a temporary file and returns the file's path.
+    openpyxl's write-only mode streams the rows instead of building the sheet in memory,
+    and only the path travels back to the parent process, never the workbook itself.
+    The caller deletes the file once it is uploaded.
+    Runs in worker processes, so it only works with plain data and never touches the database.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title)
+    sheet.append(MONTHLY_REPORT_HEADERS)
+    for row in rows:
+        sheet.append(row)
+    with NamedTemporaryFile(suffix='.xlsx', delete=False) as output:
+        try:
+            workbook.save(output)
+        except BaseException:
+            os.unlink(output.name)
+            raise
+    return output.name
+
+
+def _upload(report_file, path):
+    """Streams the rendered file at `path` to storage, then removes it."""
+    try:
+        with open(path, 'rb') as content:
+            report_file.monthly_report.file.save(report_file.file_name, File(content), save=False)
+    finally:
+        os.unlink(path)
+
+
+def delete_report_files(report_files):
+    """Removes the already uploaded files of `report_files` from storage, e.g. when saving the reports failed."""
+    for report_file in report_files:
+        if report_file.monthly_report.file:
+            report_file.monthly_report.file.delete(save=False)
+
+
+def render_and_upload_report_files(report_files):
+    """
+    Renders workbooks in a bounded process pool and uploads them to storage from a thread pool,
+    so rendering scales with cores while uploads overlap with each other.
+    At most a fixed number of files are in flight, which keeps memory flat however many
+    reports are generated; workbooks reach the uploads as temporary files, not in memory.
+    Only the file names are set on the reports; nothing is saved.
+    """
+    render_workers = settings.MONTHLY_REPORT_RENDER_WORKERS or os.cpu_count() or 1
+    upload_workers = settings.MONTHLY_REPORT_UPLOAD_WORKERS
+    max_in_flight = 2 * (render_workers + upload_workers)
+    report_files = iter(report_files)
+
+    # 'spawn' keeps worker processes safe to start from the scheduler's threads.
+    render_pool = ProcessPoolExecutor(max_workers=render_workers, mp_context=multiprocessing.get_context('spawn'))
+    upload_pool = ThreadPoolExecutor(max_workers=upload_workers)
+    with render_pool, upload_pool:
+        renders, uploads = {}, set()
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(renders) + len(uploads) < max_in_flight:
+                    report_file = next(report_files, None)
+                    if report_file is None:
+                        exhausted = True
+                        break
+                    future = render_pool.submit(render_monthly_report, report_file.sheet_title, report_file.rows)
+                    renders[future] = report_file
+                if not renders and not uploads:
+                    break
+                done, _ = wait(set(renders) | uploads, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in renders:
+                        report_file = renders.pop(future)
+                        uploads.add(upload_pool.submit(_upload, report_file, future.result()))
+                    else:
+                        uploads.remove(future)
+                        future.result()
+        except BaseException:
+            # Drop the temporary files of workbooks rendered but never handed to an upload.
+            for future in renders:
+                future.cancel()
+            wait(renders)
+            for future in renders:
+                if not future.cancelled() and future.exception() is None:
+                    os.unlink(future.result())
+            raise
@@ -0,0 +1,74 @@
+# apps/reports/rollups.py
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from .models import DailyReport, MonthlyHoursRollup
+
+
+def apply_hours_delta(student_id, workspace_id, report_date, hours, reports):
+    """
+    Adds `hours` and `reports` (both may be negative) to the rollup of the report's month
+    with a single F() update. A missing row is created only for positive changes, so a
+    delete can never leave behind a rollup that no report backs.
+    """
+    if not hours and not reports:
+        return
+    key = dict(student_id=student_id, workspace_id=workspace_id, year=report_date.year, month=report_date.month)
+    changes = dict(total_hours=F('total_hours') + hours, report_count=F('report_count') + reports)
+    if MonthlyHoursRollup.objects.filter(**key).update(**changes) or reports <= 0:
+        return
+    try:
+        with transaction.atomic():
+            MonthlyHoursRollup.objects.create(total_hours=hours, report_count=reports, **key)
+    except IntegrityError:
+        # Created concurrently by another report of the same month.
+        MonthlyHoursRollup.objects.filter(**key).update(**changes)
+
+
+def rebuild_monthly_rollups(year=None, month=None):
+    """
+    Recomputes rollups from the raw daily reports, for one month or for everything, to
+    reconcile writes that bypassed the signals (queryset.update, raw SQL...).
+    The rollup table is locked against writes first, so signal updates running meanwhile wait
+    and then apply on top of the rebuilt rows instead of being overwritten: a report is either
+    counted by the rebuild or by its own signal, never by both. Returns the number of rollup rows written.
+    """
+    reports = DailyReport.objects.all()
+    rollups = MonthlyHoursRollup.objects.all()
+    if year is not None and month is not None:
+        reports = reports.filter(report_date__year=year, report_date__month=month)
+        rollups = rollups.filter(year=year, month=month)
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {MonthlyHoursRollup._meta.db_table} IN EXCLUSIVE MODE")
+        totals = list(
+            reports.values('student_id', 'workspace_id', 'report_date__year', 'report_date__month')
+            .annotate(total_hours=Sum('hours_worked'), report_count=Count('id'))
+            .order_by()
+        )
+        rollups.delete()
+        created = MonthlyHoursRollup.objects.bulk_create([
+            MonthlyHoursRollup(
+                student_id=row['student_id'],
+                workspace_id=row['workspace_id'],
+                year=row['report_date__year'],
+                month=row['report_date__month'],
+                total_hours=row['total_hours'],
+                report_count=row['report_count'],
+            )
+            for row in totals
+        ], batch_size=1000)
+    return len(created)
+
+
+def reconcile_monthly_rollups():
+    """
+    Scheduled reconciliation: rebuilds the current and the previous month, the ones still
+    written to and the one month-end payroll reads. Returns the number of rollup rows written.
+    """
+    today = timezone.localdate()
+    previous = today.replace(day=1) - timezone.timedelta(days=1)
+    return sum(rebuild_monthly_rollups(day.year, day.month) for day in (previous, today))
@@ -3,8 +3,11 @@
 from rest_framework import serializers
 from django.utils import timezone
 from .models import DailyReport, MonthlyReport, SalaryRecord
+from .exports import EXPORT_FORMATS
 from apps.users.models import User
-from apps.workspaces.models import WorkspaceMember, Workspace
+from apps.workspaces.models import Workspace
+from apps.workspaces.membership import is_member
+from apps.common.bulk import BULK_ACTION_MAX_IDS
 
 from apps.users.serializers import UserSummarySerializer
 from apps.workspaces.serializers import WorkspaceSummarySerializer
@@ -42,14 +45,43 @@ class DailyReportCreateSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         workspace = data.get('workspace')
         report_date = data.get('report_date')
-        if report_date > timezone.now().date():
+        if report_date > timezone.localdate():
             raise serializers.ValidationError({"report_date": "You cannot create a report for a future date."})
-        if not WorkspaceMember.objects.filter(user=user, workspace=workspace, is_active=True).exists():
+        if not is_member(user, workspace):
             raise serializers.ValidationError({"workspace_id": "You are not a member of this workspace."})
         if DailyReport.objects.filter(student=user, report_date=report_date, workspace=workspace).exists():
             raise serializers.ValidationError(f"A report already exists for {report_date} in this workspace.")
         return data
 
+class ReportMonthQuerySerializer(serializers.Serializer):
+    """`?year=&month=` query parameters; both default to the current month."""
+    year = serializers.IntegerField(required=False, min_value=2000, max_value=9999)
+    month = serializers.IntegerField(required=False, min_value=1, max_value=12)
+
+    def validate(self, data):
+        today = timezone.localdate()
+        data.setdefault('year', today.year)
+        data.setdefault('month', today.month)
+        return data
+
+class MonthToDateHoursSerializer(serializers.Serializer):
+    workspace = serializers.IntegerField(source='workspace_id')
+    year = serializers.IntegerField()
+    month = serializers.IntegerField()
+    total_hours = serializers.DecimalField(max_digits=6, decimal_places=2)
+    report_count = serializers.IntegerField()
+
+class ProjectedSalarySerializer(serializers.Serializer):
+    workspace = serializers.IntegerField(source='workspace_id')
+    year = serializers.IntegerField()
+    month = serializers.IntegerField()
+    total_hours = serializers.DecimalField(max_digits=6, decimal_places=2)
+    hourly_rate = serializers.DecimalField(max_digits=10, decimal_places=2)
+    gross_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    deduction_percentage = serializers.DecimalField(max_digits=5, decimal_places=2)
+    deduction_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    net_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+
 # ----------------- SalaryRecord Serializers -----------------
 
 class SalaryRecordListSerializer(serializers.ModelSerializer):
@@ -105,4 +137,53 @@ class MonthlyReportManageSerializer(serializers.Serializer):
         return data
 
 class SalaryPaidSerializer(serializers.Serializer):
-    pass
\ No newline at end of file
+    pass
+
+# ----------------- Bulk Action Serializers -----------------
+
+class MonthlyReportBulkFilterSerializer(serializers.Serializer):
+    workspace = serializers.IntegerField(required=False)
+    year = serializers.IntegerField(required=False)
+    month = serializers.IntegerField(required=False, min_value=1, max_value=12)
+    status = serializers.ChoiceField(choices=MonthlyReport.STATUS_CHOICES, required=False)
+
+    def validate(self, data):
+        if not data:
+            raise serializers.ValidationError("Provide at least one of workspace, year, month or status.")
+        return data
+
+class SalaryRecordBulkFilterSerializer(MonthlyReportBulkFilterSerializer):
+    status = serializers.ChoiceField(choices=SalaryRecord.STATUS_CHOICES, required=False)
+
+class BulkSelectionSerializer(serializers.Serializer):
+    """Records picked by `ids`, by `filters`, or by both (ids that also match the filters)."""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=BULK_ACTION_MAX_IDS
+    )
+
+    def validate(self, data):
+        if not data.get('ids') and not data.get('filters'):
+            raise serializers.ValidationError("Provide a list of ids or filters.")
+        if data.get('ids'):
+            data['ids'] = list(dict.fromkeys(data['ids']))
+        return super().validate(data)
+
+class MonthlyReportBulkManageSerializer(BulkSelectionSerializer, MonthlyReportManageSerializer):
+    filters = MonthlyReportBulkFilterSerializer(required=False)
+
+class SalaryBulkPaidSerializer(BulkSelectionSerializer):
+    filters = SalaryRecordBulkFilterSerializer(required=False)
+
+class BulkActionItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    result = serializers.ChoiceField(choices=('updated', 'skipped', 'not_found'))
+    detail = serializers.CharField(required=False)
+
+class BulkActionResultSerializer(serializers.Serializer):
+    updated = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    not_found = serializers.IntegerField()
+    results = BulkActionItemSerializer(many=True)
+
+class ExportQuerySerializer(serializers.Serializer):
+    file_format = serializers.ChoiceField(choices=EXPORT_FORMATS, default='csv')
@@ -0,0 +1,45 @@
+# apps/reports/signals.py
+
+from decimal import Decimal
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import DailyReport
+from .rollups import apply_hours_delta
+
+@receiver(pre_save, sender=DailyReport)
+def remember_previous_report_values(sender, instance, **kwargs):
+    """Keeps the stored values of an edited report so post_save can move its hours correctly."""
+    instance._rollup_previous = None
+    if instance.pk:
+        instance._rollup_previous = sender.objects.filter(pk=instance.pk).values(
+            'student_id', 'workspace_id', 'report_date', 'hours_worked'
+        ).first()
+
+@receiver(post_save, sender=DailyReport)
+def update_rollup_on_save(sender, instance, created, **kwargs):
+    """
+    Adds a new report's hours to its month, or applies the difference of an edit.
+    An edit that moves the report to another month or workspace is a removal plus an addition.
+    """
+    hours = Decimal(instance.hours_worked)
+    previous = getattr(instance, '_rollup_previous', None)
+    if previous is None:
+        apply_hours_delta(instance.student_id, instance.workspace_id, instance.report_date, hours, 1)
+        return
+
+    old_date = previous['report_date']
+    same_bucket = (
+        previous['student_id'] == instance.student_id
+        and previous['workspace_id'] == instance.workspace_id
+        and (old_date.year, old_date.month) == (instance.report_date.year, instance.report_date.month)
+    )
+    if same_bucket:
+        apply_hours_delta(instance.student_id, instance.workspace_id, instance.report_date, hours - previous['hours_worked'], 0)
+    else:
+        apply_hours_delta(previous['student_id'], previous['workspace_id'], old_date, -previous['hours_worked'], -1)
+        apply_hours_delta(instance.student_id, instance.workspace_id, instance.report_date, hours, 1)
+
+@receiver(post_delete, sender=DailyReport)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    apply_hours_delta(instance.student_id, instance.workspace_id, instance.report_date, -Decimal(instance.hours_worked), -1)
@@ -3,29 +3,60 @@
 from rest_framework import viewsets, mixins, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db import transaction
 from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from .models import DailyReport, MonthlyReport, SalaryRecord
+from .models import DailyReport, MonthlyHoursRollup, MonthlyReport, SalaryRecord
+from .payroll import build_salary_record, monthly_totals_queryset
 from .serializers import (
     DailyReportListSerializer, DailyReportDetailSerializer, DailyReportCreateSerializer,
+    ReportMonthQuerySerializer, MonthToDateHoursSerializer, ProjectedSalarySerializer,
     MonthlyReportListSerializer, MonthlyReportDetailSerializer,
     SalaryRecordListSerializer, SalaryRecordDetailSerializer,
-    MonthlyReportManageSerializer, SalaryPaidSerializer
+    MonthlyReportManageSerializer, SalaryPaidSerializer,
+    MonthlyReportBulkManageSerializer, SalaryBulkPaidSerializer, BulkActionResultSerializer,
+    ExportQuerySerializer
 )
+from .bulk import select_for_bulk
+from .exports import DAILY_REPORT_EXPORT_COLUMNS, SALARY_EXPORT_COLUMNS, export_response
 from .permissions import IsStudent, IsStaffOrAdmin, IsOwnerOrStaffAdmin
-from apps.notifications.utils import create_notification
+from apps.notifications.utils import create_notification, create_notifications_bulk
+from apps.common.bulk import BulkActionResult
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.pagination import FeedPagination
 
 
 @extend_schema_view(
     list=extend_schema(summary="📄 My Daily Reports", tags=['Reports (Daily)']),
     create=extend_schema(summary="✍️ Create New Daily Report", tags=['Reports (Daily)']),
+    month_to_date=extend_schema(
+        parameters=[ReportMonthQuerySerializer], responses=MonthToDateHoursSerializer(many=True),
+        summary="⏱️ My Hours This Month", tags=['Reports (Daily)']
+    ),
+    projected_salary=extend_schema(
+        parameters=[ReportMonthQuerySerializer], responses=ProjectedSalarySerializer(many=True),
+        summary="💸 My Projected Salary This Month", tags=['Reports (Daily)']
+    ),
+    export=extend_schema(
+        parameters=[ExportQuerySerializer], responses={200: OpenApiTypes.BINARY},
+        summary="📥 [STAFF] Export Daily Reports (CSV/XLSX)", tags=['Reports (Daily)']
+    ),
 )
-class DailyReportViewSet(viewsets.ModelViewSet):
+class DailyReportViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     permission_classes = [IsStudent]
+    pagination_class = FeedPagination
+    keyset_ordering = ('-created_at', '-id')
+    filterset_fields = {'student__id': ['exact'], 'workspace': ['exact'], 'report_date': ['exact', 'gte', 'lte']}
     def get_queryset(self):
         if getattr(self, 'swagger_fake_view', False):
             return DailyReport.objects.none()
+        if self.action == 'export':
+            return DailyReport.objects.all()
         return DailyReport.objects.filter(student=self.request.user)
+    def get_permissions(self):
+        if self.action == 'export': self.permission_classes = [IsStaffOrAdmin]
+        return super().get_permissions()
     def get_serializer_class(self):
         if self.action == 'list':
             return DailyReportListSerializer
@@ -35,10 +66,46 @@ class DailyReportViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(student=self.request.user)
 
+    def get_report_month(self):
+        serializer = ReportMonthQuerySerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data['year'], serializer.validated_data['month']
+
+    @action(detail=False, methods=['get'], url_path='month-to-date', pagination_class=None)
+    def month_to_date(self, request):
+        """Hours reported per workspace in the month, read from the precomputed rollups."""
+        year, month = self.get_report_month()
+        rollups = MonthlyHoursRollup.objects.filter(
+            student=request.user, year=year, month=month, report_count__gt=0
+        ).order_by('workspace_id')
+        return Response(MonthToDateHoursSerializer(rollups, many=True).data)
+
+    @action(detail=False, methods=['get'], url_path='projected-salary', pagination_class=None)
+    def projected_salary(self, request):
+        """What month-end payroll would pay for the hours reported so far, per workspace."""
+        year, month = self.get_report_month()
+        rows = monthly_totals_queryset(year, month).filter(student=request.user)
+        salaries = [build_salary_record(year, month, row) for row in rows]
+        return Response(ProjectedSalarySerializer(salaries, many=True).data)
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """Streams all daily reports matching the list filters as CSV or XLSX."""
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return export_response(
+            self.filter_queryset(self.get_queryset()), DAILY_REPORT_EXPORT_COLUMNS,
+            f"daily_reports_{timezone.now():%Y-%m-%d}", params.validated_data['file_format']
+        )
+
 @extend_schema_view(
     list=extend_schema(summary="📑 [STAFF] List of Monthly Reports", tags=['Reports (Monthly)']),
     retrieve=extend_schema(summary="📑 [STAFF/Owner] View a Monthly Report", tags=['Reports (Monthly)']),
     manage_report=extend_schema(request=MonthlyReportManageSerializer, summary="📊 [STAFF] Manage a Monthly Report", tags=['Reports (Monthly)']),
+    bulk_manage=extend_schema(
+        request=MonthlyReportBulkManageSerializer, responses=BulkActionResultSerializer,
+        summary="📊 [STAFF] Approve or Reject Monthly Reports in Bulk", tags=['Reports (Monthly)']
+    ),
 )
 class MonthlyReportViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     permission_classes = [permissions.IsAuthenticated]
@@ -55,10 +122,12 @@ class MonthlyReportViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, vie
             return MonthlyReportListSerializer
         if self.action == 'manage_report':
             return MonthlyReportManageSerializer
+        if self.action == 'bulk_manage':
+            return MonthlyReportBulkManageSerializer
         return MonthlyReportDetailSerializer # retrieve
     def get_permissions(self):
         if self.action == 'retrieve': self.permission_classes = [IsOwnerOrStaffAdmin]
-        elif self.action == 'manage_report': self.permission_classes = [IsStaffOrAdmin]
+        elif self.action in ['manage_report', 'bulk_manage']: self.permission_classes = [IsStaffOrAdmin]
         return super().get_permissions()
     
     @action(detail=True, methods=['patch'], url_path='manage')
@@ -87,13 +156,75 @@ class MonthlyReportViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, vie
         )
         return Response(self.get_serializer(report).data)
 
+    @action(detail=False, methods=['post'], url_path='bulk-manage')
+    def bulk_manage(self, request):
+        """
+        Approves or rejects many reports (by ids and/or filters) in one transaction.
+        Reports whose salary is already paid, or that already have the requested status, are skipped.
+        """
+        serializer = MonthlyReportBulkManageSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        new_status = serializer.validated_data['status']
+        approved = new_status == 'APPROVED'
+        rejection_reason = None if approved else serializer.validated_data.get('rejection_reason')
+        status_text = "approved" if approved else "rejected"
+        now = timezone.now()
+        result = BulkActionResult()
+
+        with transaction.atomic():
+            queryset = self.get_queryset().select_related('workspace').select_for_update(of=('self', 'salary'))
+            reports = []
+            for report in select_for_bulk(queryset, serializer.validated_data, result):
+                if report.salary.status == 'PAID':
+                    result.skipped(report.id, "The salary for this report has already been paid.")
+                elif report.status == new_status:
+                    result.skipped(report.id, f"The report is already {status_text}.")
+                else:
+                    reports.append(report)
+            if not reports:
+                return Response(result.as_dict())
+
+            MonthlyReport.objects.filter(id__in=[report.id for report in reports]).update(
+                status=new_status, managed_by=request.user, rejection_reason=rejection_reason
+            )
+            SalaryRecord.objects.filter(id__in=[report.salary_id for report in reports]).update(
+                status=new_status, approved_by=request.user if approved else None, approved_at=now if approved else None
+            )
+            for report in reports:
+                report.status = new_status; report.managed_by = request.user; report.rejection_reason = rejection_reason
+                report.salary.status = new_status
+                result.updated(report.id)
+
+            def message(report):
+                text = f"Your report for {report.year}-{report.month} in the '{report.workspace.name}' workspace has been {status_text}."
+                if not approved:
+                    text += f" Reason: {report.rejection_reason}"
+                return text
+
+            create_notifications_bulk(
+                [(report.student, report) for report in reports],
+                actor=request.user,
+                verb=f"Your report has been {status_text}",
+                message=message
+            )
+        return Response(result.as_dict())
+
 @extend_schema_view(
     list=extend_schema(summary="💰 List of Salary Records", tags=['Salaries']),
     retrieve=extend_schema(summary="💰 View a Salary Record", tags=['Salaries']),
     mark_as_paid=extend_schema(request=SalaryPaidSerializer, summary="💵 [STAFF] Mark Salary as 'Paid'", tags=['Salaries']),
+    bulk_mark_as_paid=extend_schema(
+        request=SalaryBulkPaidSerializer, responses=BulkActionResultSerializer,
+        summary="💵 [STAFF] Mark Salaries as 'Paid' in Bulk", tags=['Salaries']
+    ),
+    export=extend_schema(
+        parameters=[ExportQuerySerializer], responses={200: OpenApiTypes.BINARY},
+        summary="📥 [STAFF] Export Salary Ledger (CSV/XLSX)", tags=['Salaries']
+    ),
 )
 class SalaryViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     permission_classes = [permissions.IsAuthenticated]
+    filterset_fields = ['student__id', 'workspace', 'year', 'month', 'status']
     def get_queryset(self):
         if getattr(self, 'swagger_fake_view', False):
             return SalaryRecord.objects.none()
@@ -105,10 +236,12 @@ class SalaryViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.G
             return SalaryRecordListSerializer
         if self.action == 'mark_as_paid':
             return SalaryPaidSerializer
+        if self.action == 'bulk_mark_as_paid':
+            return SalaryBulkPaidSerializer
         return SalaryRecordDetailSerializer # retrieve
     def get_permissions(self):
         if self.action == 'retrieve': self.permission_classes = [IsOwnerOrStaffAdmin]
-        elif self.action == 'mark_as_paid': self.permission_classes = [IsStaffOrAdmin]
+        elif self.action in ['mark_as_paid', 'bulk_mark_as_paid', 'export']: self.permission_classes = [IsStaffOrAdmin]
         return super().get_permissions()
 
     @action(detail=True, methods=['patch'], url_path='mark-as-paid')
@@ -125,4 +258,46 @@ class SalaryViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.G
             message=f"Your salary for {salary_record.year}-{salary_record.month} in the '{salary_record.workspace.name}' workspace has been paid.",
             action_object=salary_record
         )
-        return Response(self.get_serializer(salary_record).data)
\ No newline at end of file
+        return Response(self.get_serializer(salary_record).data)
+
+    @action(detail=False, methods=['post'], url_path='bulk-mark-as-paid')
+    def bulk_mark_as_paid(self, request):
+        """Marks many approved salaries (by ids and/or filters) as paid in one transaction."""
+        serializer = SalaryBulkPaidSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        now = timezone.now()
+        result = BulkActionResult()
+
+        with transaction.atomic():
+            queryset = self.get_queryset().select_related('workspace').select_for_update(of=('self',))
+            salaries = []
+            for salary_record in select_for_bulk(queryset, serializer.validated_data, result):
+                if salary_record.status != 'APPROVED':
+                    result.skipped(salary_record.id, "Only approved salaries can be marked as paid.")
+                else:
+                    salaries.append(salary_record)
+            if not salaries:
+                return Response(result.as_dict())
+
+            SalaryRecord.objects.filter(id__in=[salary_record.id for salary_record in salaries]).update(status='PAID', paid_at=now)
+            for salary_record in salaries:
+                salary_record.status = 'PAID'; salary_record.paid_at = now
+                result.updated(salary_record.id)
+
+            create_notifications_bulk(
+                [(salary_record.student, salary_record) for salary_record in salaries],
+                actor=request.user,
+                verb="Salary Paid",
+                message=lambda salary_record: f"Your salary for {salary_record.year}-{salary_record.month} in the '{salary_record.workspace.name}' workspace has been paid."
+            )
+        return Response(result.as_dict())
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """Streams all salary records matching the list filters as CSV or XLSX."""
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return export_response(
+            self.filter_queryset(self.get_queryset()), SALARY_EXPORT_COLUMNS,
+            f"salaries_{timezone.now():%Y-%m-%d}", params.validated_data['file_format']
+        )
@@ -0,0 +1,80 @@
+# apps/search/engine.py
+
+from django.contrib.postgres.search import SearchHeadline, SearchRank
+from django.db.models import F, TextField, Value
+from django.db.models.functions import Concat
+
+from apps.common.search import SEARCH_CONFIG
+from apps.jobs.models import Job, JobVacancy
+from apps.tasks.models import Task, TaskComment
+from apps.workspaces.membership import get_workspace_ids
+
+SEARCH_TYPES = ('tasks', 'comments', 'jobs', 'vacancies')
+SEARCH_RESULTS_LIMIT = 20
+
+
+def _tasks(user):
+    if user.user_type == 'ADMIN':
+        return Task.objects.all()
+    return Task.objects.filter(workspace_id__in=get_workspace_ids(user, active_only=True))
+
+
+def _comments(user):
+    if user.user_type == 'ADMIN':
+        return TaskComment.objects.all()
+    return TaskComment.objects.filter(task__workspace_id__in=get_workspace_ids(user, active_only=True))
+
+
+def _jobs(user):
+    if user.user_type == 'ADMIN':
+        return Job.objects.all()
+    return Job.objects.filter(status='ACTIVE')
+
+
+def _vacancies(user):
+    if user.user_type in ['STAFF', 'ADMIN']:
+        return JobVacancy.objects.all()
+    return JobVacancy.objects.filter(status='OPEN')
+
+
+# type: (queryset visible to the user, title expression, text the headline is cut from, parent ids returned)
+SOURCES = {
+    'tasks': (_tasks, F('title'), F('description'), {'workspace': 'workspace_id'}),
+    'comments': (_comments, F('task__title'), F('comment'), {'workspace': 'task__workspace_id', 'task': 'task_id'}),
+    'jobs': (_jobs, F('title'), F('description'), {'workspace': 'workspace_id'}),
+    'vacancies': (_vacancies, F('title'), Concat('description', Value('\n'), 'requirements', output_field=TextField()), {'job': 'job_id'}),
+}
+
+
+def search(user, query, types=SEARCH_TYPES, limit=SEARCH_RESULTS_LIMIT):
+    """
+    Ranked full-text search over the given types, scoped to what `user` may see in the
+    matching list endpoints. Each type is one query that matches through its GIN index,
+    ranks the matches and cuts headlines for the best `limit` rows only.
+    Returns up to `limit` result dicts, best first.
+    """
+    results = []
+    for search_type in types:
+        visible, title, text, parents = SOURCES[search_type]
+        rows = (
+            visible(user)
+            .filter(search_vector=query)
+            .annotate(rank=SearchRank(F('search_vector'), query))
+            .order_by('-rank', '-id')
+            .values(
+                'id', 'rank', *parents.values(),
+                result_title=title,
+                headline=SearchHeadline(text, query, config=SEARCH_CONFIG, max_words=30, min_words=10, max_fragments=2),
+            )[:limit]
+        )
+        for row in rows:
+            results.append({
+                'type': search_type,
+                'id': row['id'],
+                'title': row['result_title'],
+                'headline': row['headline'],
+                'rank': row['rank'],
+                **{name: row[field] for name, field in parents.items()},
+            })
+    results.sort(key=lambda result: result['rank'], reverse=True)
+    return results[:limit]
@@ -0,0 +1,120 @@
+# apps/search/management/commands/benchmark_search.py
+
+import statistics
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+
+from apps.common.search import build_search_query
+from apps.search.engine import SEARCH_RESULTS_LIMIT, search
+from apps.tasks.models import Task
+from apps.users.models import User
+from apps.workspaces.models import Workspace
+
+# Vocabulary of the generated task titles and descriptions.
+WORDS = [
+    'payment', 'gateway', 'webhook', 'invoice', 'report', 'salary', 'dashboard', 'export', 'import', 'login',
+    'token', 'refresh', 'profile', 'avatar', 'upload', 'meeting', 'calendar', 'reminder', 'notification', 'inbox',
+    'vacancy', 'application', 'review', 'deploy', 'docker', 'nginx', 'database', 'index', 'migration', 'backup',
+    'cache', 'redis', 'queue', 'worker', 'scheduler', 'cron', 'email', 'template', 'layout', 'button',
+    'modal', 'table', 'filter', 'search', 'pagination', 'sorting', 'chart', 'metrics', 'logging', 'alert',
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Times task search on a generated table: the icontains scan DRF's SearchFilter runs, against the "
+        "ranked full-text search over the GIN-indexed search vector. Everything runs in one transaction "
+        "that is rolled back, so no data is left behind."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000, help="Tasks to generate.")
+        parser.add_argument('--repeat', type=int, default=20, help="Runs per measured query.")
+        parser.add_argument('--force', action='store_true', help="Run even with DEBUG off.")
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError("This benchmark locks the tasks table while it runs. Use a local database or pass --force.")
+
+        try:
+            with transaction.atomic():
+                user = self.populate(options['rows'])
+                self.report(self.measure(user, options['repeat']))
+                raise Rollback
+        except Rollback:
+            self.stdout.write("Generated data rolled back.")
+
+    def populate(self, rows):
+        self.stdout.write(f"Generating {rows} tasks...")
+        user = User.objects.create(email="search-benchmark@example.invalid", first_name="Benchmark", last_name="Search", user_type='ADMIN')
+        workspace = Workspace.objects.create(name="Search benchmark", created_by=user)
+        # Filling the table with the GIN index in place is much slower than building the index afterwards.
+        self.drop_indexes()
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO {Task._meta.db_table}
+                    (workspace_id, title, description, assigned_to_id, created_by_id, status, priority, due_date, created_at, updated_at)
+                SELECT %s,
+                       w[1 + g %% 50] || ' ' || w[1 + (g / 50) %% 50] || ' ' || g,
+                       w[1 + (g * 7) %% 50] || ' ' || w[1 + (g * 13) %% 50] || ' ' || w[1 + (g / 7) %% 50] || ' ' || w[1 + (g / 2500) %% 50],
+                       %s, %s, 'STARTED', 'LOW', current_date, now() - g * interval '1 second', now()
+                FROM generate_series(1, %s) AS g, (SELECT %s::text[] AS w) AS vocabulary
+            """, [workspace.id, user.id, user.id, rows, WORDS])
+            # Run the deferred foreign key checks now; pending trigger events would block CREATE INDEX.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        self.stdout.write("Building the search index...")
+        self.create_indexes()
+        return user
+
+    def drop_indexes(self):
+        with connection.cursor() as cursor:
+            for index in Task._meta.indexes:
+                cursor.execute(f"DROP INDEX IF EXISTS {connection.ops.quote_name(index.name)}")
+
+    def create_indexes(self):
+        with connection.schema_editor() as editor:
+            for index in Task._meta.indexes:
+                editor.add_index(Task, index)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Task._meta.db_table}")
+
+    def measure(self, user, repeat):
+        measurements = {}
+        for text in ('payment', 'payment webhook', 'pay', 'cron backup'):
+            def icontains():
+                # What SearchFilter runs for search_fields = ['title', 'description']: every word must match either field.
+                queryset = Task.objects.all()
+                for word in text.split():
+                    queryset = queryset.filter(Q(title__icontains=word) | Q(description__icontains=word))
+                list(queryset.order_by('-created_at')[:SEARCH_RESULTS_LIMIT])
+
+            def full_text():
+                search(user, build_search_query(text), types=['tasks'])
+
+            measurements[text] = (self.time(icontains, repeat), self.time(full_text, repeat))
+        return measurements
+
+    def time(self, func, repeat):
+        func()  # warm-up
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))]
+
+    def report(self, measurements):
+        self.stdout.write(f"{'query':<18}{'icontains (median / p95 ms)':>30}{'full text (median / p95 ms)':>31}{'speedup':>10}")
+        for text, ((before_median, before_p95), (after_median, after_p95)) in measurements.items():
+            speedup = before_median / after_median if after_median else float('inf')
+            self.stdout.write(
+                f"{text:<18}{before_median:>19.2f} / {before_p95:>8.2f}{after_median:>20.2f} / {after_p95:>8.2f}{speedup:>9.1f}x"
+            )
@@ -0,0 +1,36 @@
+# apps/search/serializers.py
+
+from rest_framework import serializers
+
+from .engine import SEARCH_RESULTS_LIMIT, SEARCH_TYPES
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200, help_text="Words to look for; the last one also matches as a prefix.")
+    types = serializers.MultipleChoiceField(
+        choices=SEARCH_TYPES, required=False, help_text="Comma-separated types to search (all by default)."
+    )
+    limit = serializers.IntegerField(required=False, default=SEARCH_RESULTS_LIMIT, min_value=1, max_value=50)
+
+    def to_internal_value(self, data):
+        # `types` arrives as one comma-separated query parameter.
+        data = data.copy()
+        if data.get('types'):
+            data.setlist('types', [value for value in data['types'].split(',') if value])
+        return super().to_internal_value(data)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=SEARCH_TYPES)
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    headline = serializers.CharField(help_text="Matching excerpt with the matched words wrapped in <b></b>.")
+    rank = serializers.FloatField()
+    workspace = serializers.IntegerField(required=False, allow_null=True)
+    task = serializers.IntegerField(required=False)
+    job = serializers.IntegerField(required=False)
+
+
+class SearchResponseSerializer(serializers.Serializer):
+    query = serializers.CharField()
+    results = SearchResultSerializer(many=True)
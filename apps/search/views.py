@@ -0,0 +1,34 @@
+# apps/search/views.py
+
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from apps.common.search import build_search_query
+from .engine import SEARCH_TYPES, search
+from .serializers import SearchQuerySerializer, SearchResponseSerializer
+
+
+@extend_schema(
+    parameters=[SearchQuerySerializer], responses=SearchResponseSerializer,
+    summary="🔎 Search Tasks, Comments, Projects and Vacancies", tags=['Search']
+)
+class SearchView(generics.GenericAPIView):
+    """
+    Ranked full-text search. Only records the user can open through the regular endpoints are
+    returned: tasks and comments of their workspaces, active projects and open vacancies.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = SearchQuerySerializer
+
+    def get(self, request):
+        params = SearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = build_search_query(params.validated_data['q'])
+        if query is None:
+            raise ValidationError({'q': "Enter at least one word to search for."})
+
+        types = [search_type for search_type in SEARCH_TYPES if search_type in (params.validated_data.get('types') or SEARCH_TYPES)]
+        results = search(request.user, query, types=types, limit=params.validated_data['limit'])
+        return Response(SearchResponseSerializer({'query': params.validated_data['q'], 'results': results}).data)
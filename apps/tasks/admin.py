@@ -1,7 +1,7 @@
 # apps/tasks/admin.py
 
 from django.contrib import admin
-from .models import Task, TaskComment
+from .models import Task, TaskComment, ScheduledJobRun
 
 class TaskCommentInline(admin.TabularInline):
     model = TaskComment
@@ -23,4 +23,10 @@ class TaskCommentAdmin(admin.ModelAdmin):
     list_display = ('task', 'user', 'created_at')
     list_filter = ('created_at',)
     search_fields = ('comment', 'task__title', 'user__email')
-    raw_id_fields = ('task', 'user')
\ No newline at end of file
+    raw_id_fields = ('task', 'user')
+
+@admin.register(ScheduledJobRun)
+class ScheduledJobRunAdmin(admin.ModelAdmin):
+    list_display = ('job_id', 'trigger', 'status', 'started_at', 'duration_seconds', 'host')
+    list_filter = ('job_id', 'trigger', 'status')
+    readonly_fields = ('job_id', 'trigger', 'params', 'status', 'started_at', 'finished_at', 'duration_seconds', 'result', 'error', 'host')
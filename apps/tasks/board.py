@@ -0,0 +1,88 @@
+# apps/tasks/board.py
+
+from collections import defaultdict
+from django.db.models import Count, F, Max, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from apps.common.conditional import make_etag
+from .models import Task
+
+OPEN_STATUSES = ['STARTED', 'INPROGRESS']
+BOARD_TASKS_PER_COLUMN = 50
+
+
+def board_etag(workspace, *params):
+    """
+    ETag of a workspace's task board: the latest task change plus the task count, so edits,
+    new tasks and deletions all change it, and the current date, which the overdue counts
+    depend on. Costs one aggregate query.
+    """
+    state = Task.objects.filter(workspace=workspace).aggregate(last_update=Max('updated_at'), total=Count('id'))
+    return make_etag('task-board', workspace.pk, state['last_update'], state['total'], timezone.localdate(), *params)
+
+
+def build_task_board(workspace, limit=BOARD_TASKS_PER_COLUMN):
+    """
+    Kanban data for a workspace in three grouped queries: per-status and per-priority counts,
+    per-assignee workloads, and the newest `limit` tasks of every status column.
+    """
+    tasks = Task.objects.filter(workspace=workspace)
+    today = timezone.localdate()
+
+    counts = defaultdict(dict)
+    for row in tasks.values('status', 'priority').annotate(count=Count('id')).order_by():
+        counts[row['status']][row['priority']] = row['count']
+
+    open_filter = Q(status__in=OPEN_STATUSES)
+    workloads = (
+        tasks.values(
+            'assigned_to_id', 'assigned_to__first_name', 'assigned_to__last_name',
+            'assigned_to__email', 'assigned_to__user_type',
+        )
+        .annotate(
+            total=Count('id'),
+            open=Count('id', filter=open_filter),
+            overdue=Count('id', filter=open_filter & Q(due_date__lt=today)),
+            completed=Count('id', filter=Q(status='COMPLETED')),
+            urgent_open=Count('id', filter=open_filter & Q(priority='URGENT')),
+        )
+        .order_by('-open', 'assigned_to_id')
+    )
+
+    column_tasks = defaultdict(list)
+    newest_per_status = tasks.annotate(
+        position=Window(RowNumber(), partition_by=F('status'), order_by=[F('created_at').desc(), F('id').desc()])
+    ).filter(position__lte=limit).order_by('status', 'position')
+    for task in newest_per_status:
+        column_tasks[task.status].append(task)
+
+    columns = []
+    for status, label in Task.STATUS_CHOICES:
+        priorities = {priority: counts[status].get(priority, 0) for priority, _ in Task.PRIORITY_CHOICES}
+        columns.append({
+            'status': status,
+            'label': label,
+            'count': sum(priorities.values()),
+            'priority_counts': priorities,
+            'tasks': column_tasks[status],
+        })
+
+    return {
+        'workspace': workspace,
+        'total': sum(column['count'] for column in columns),
+        'columns': columns,
+        'assignees': [
+            {
+                'user': {
+                    'id': row['assigned_to_id'],
+                    'first_name': row['assigned_to__first_name'],
+                    'last_name': row['assigned_to__last_name'],
+                    'email': row['assigned_to__email'],
+                    'user_type': row['assigned_to__user_type'],
+                },
+                **{key: row[key] for key in ('total', 'open', 'overdue', 'completed', 'urgent_open')},
+            }
+            for row in workloads
+        ],
+    }
@@ -0,0 +1,141 @@
+# apps/tasks/bulk.py
+
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from apps.common.bulk import BulkActionResult
+from apps.notifications.utils import create_notifications_bulk
+from apps.workspaces.membership import get_memberships
+from apps.workspaces.models import WorkspaceMember
+from .models import Task
+
+# Statuses an assignee may move their own task to; everything else is up to the team leader.
+ASSIGNEE_STATUSES = ('INPROGRESS', 'COMPLETED')
+ASSIGNABLE_ROLES = ('STUDENT', 'TEAMLEADER')
+STATUS_LABELS = dict(Task.STATUS_CHOICES)
+
+
+def transition_denied(task, user, memberships, changes):
+    """
+    Why `user` may not apply `changes` to `task`, or None when allowed. Mirrors the single-task
+    update rules: the team leader who created the task may change anything, the assignee may
+    only move its status to one of ASSIGNEE_STATUSES.
+    """
+    role = memberships.get(task.workspace_id, (None, False))[0]
+    if task.created_by_id == user.id and role == 'TEAMLEADER':
+        return None
+    if task.assigned_to_id != user.id:
+        return "Only the team leader who created the task or its assignee can change it."
+    if 'assigned_to' in changes or 'due_date' in changes:
+        return "Only the team leader who created the task can reassign it or change its due date."
+    if changes.get('status') not in ASSIGNEE_STATUSES:
+        return f"The assignee can only move the task to {' or '.join(STATUS_LABELS[status] for status in ASSIGNEE_STATUSES)}."
+    return None
+
+
+def changes_task(task, changes):
+    """True when applying `changes` would modify the task."""
+    return any(
+        (task.assigned_to_id != value.id) if field == 'assigned_to' else (getattr(task, field) != value)
+        for field, value in changes.items()
+    )
+
+
+def transition_tasks(user, queryset, ids, changes):
+    """
+    Applies `changes` (status, assigned_to, due_date) to the tasks of `queryset` with the given ids
+    in one transaction. Permissions are checked per task against the user's memberships (one
+    cached lookup); the new assignee's roles are read with one query. Allowed tasks are updated
+    set-wise, `completed_at` being set when a task becomes COMPLETED and cleared when it leaves it.
+    The assignees (or creators, for changes made by the assignee) are notified in bulk.
+    Returns a BulkActionResult.
+    """
+    result = BulkActionResult()
+    memberships = get_memberships(user)
+    new_status = changes.get('status')
+    new_assignee = changes.get('assigned_to')
+    now = timezone.now()
+
+    with transaction.atomic():
+        tasks = {task.id: task for task in queryset.filter(id__in=ids).select_for_update(of=('self',)).order_by('id')}
+
+        assignee_roles = {}
+        if new_assignee is not None:
+            assignee_roles = dict(WorkspaceMember.objects.filter(
+                user=new_assignee, workspace_id__in={task.workspace_id for task in tasks.values()}
+            ).values_list('workspace_id', 'role'))
+
+        updated = []
+        for pk in ids:
+            task = tasks.get(pk)
+            if task is None:
+                result.not_found(pk, "Task not found.")
+                continue
+            reason = transition_denied(task, user, memberships, changes)
+            if reason is None and new_assignee is not None:
+                if assignee_roles.get(task.workspace_id) not in ASSIGNABLE_ROLES:
+                    reason = "The new assignee is not a student or team leader of the task's workspace."
+                elif new_assignee.id == task.created_by_id:
+                    reason = "You cannot assign tasks to yourself."
+            if reason is None and not changes_task(task, changes):
+                reason = "The task already has these values."
+            if reason:
+                result.skipped(pk, reason)
+            else:
+                updated.append(task)
+                result.updated(pk)
+
+        if not updated:
+            return result
+
+        values = {'updated_at': now}
+        if 'due_date' in changes:
+            values['due_date'] = changes['due_date']
+        if new_assignee is not None:
+            values['assigned_to'] = new_assignee
+        if new_status is not None:
+            values['status'] = new_status
+            values['completed_at'] = (
+                Case(When(status='COMPLETED', then=F('completed_at')), default=Value(now)) if new_status == 'COMPLETED' else None
+            )
+        Task.objects.filter(id__in=[task.id for task in updated]).update(**values)
+
+        # Work out who hears about what from the old values, then bring the loaded tasks up to date.
+        status_changes = {}
+        reassigned = []
+        for task in updated:
+            if new_status is not None and new_status != task.status:
+                # The other side of the task is notified: the assignee, or the creator when the assignee moved it.
+                recipient = task.assigned_to_id if task.created_by_id == user.id else task.created_by_id
+                status_changes[task.id] = (recipient, f"Task '{task.title}' status changed from "
+                                                      f"'{STATUS_LABELS[task.status]}' to '{STATUS_LABELS[new_status]}'.")
+            if new_assignee is not None and task.assigned_to_id != new_assignee.id:
+                reassigned.append(task)
+            if new_status == 'COMPLETED':
+                task.completed_at = task.completed_at if task.status == 'COMPLETED' else now
+            elif new_status is not None:
+                task.completed_at = None
+            if new_status is not None:
+                task.status = new_status
+            if new_assignee is not None:
+                task.assigned_to = new_assignee
+            if 'due_date' in changes:
+                task.due_date = changes['due_date']
+            task.updated_at = now
+
+        if status_changes:
+            create_notifications_bulk(
+                [(status_changes[task.id][0], task) for task in updated if task.id in status_changes],
+                actor=user,
+                verb=lambda task: "Task status changed" if task.created_by_id == user.id else "Task status updated",
+                message=lambda task: status_changes[task.id][1]
+            )
+        if reassigned:
+            create_notifications_bulk(
+                [(new_assignee, task) for task in reassigned],
+                actor=user,
+                verb="assigned you a new task",
+                message=lambda task: f"'{user.get_full_name()}' assigned you a new task: '{task.title}'."
+            )
+    return result
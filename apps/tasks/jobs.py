@@ -1,31 +1,72 @@
 # apps/tasks/jobs.py
 
+import logging
+import time
+from django.db import connection, transaction
+from django.db.models import prefetch_related_objects
 from django.utils import timezone
 from apps.tasks.models import Task
-from django.db.models import Q
-from apps.notifications.utils import create_notification
+from apps.notifications.utils import create_notifications_bulk
 
-def update_overdue_tasks():
-    """Update overdue tasks to 'FAILED' status and notify the task creator."""
-    now = timezone.now().date()
-    
-    overdue_tasks = Task.objects.filter(
-        due_date__lt=now
-    ).exclude(
-        Q(status='COMPLETED') | Q(status='CANCELED') | Q(status='FAILED')
-    ).select_related('created_by')
+logger = logging.getLogger(__name__)
 
-    if overdue_tasks.exists():
-        for task in overdue_tasks:
-            create_notification(
-                recipient=task.created_by,
-                actor=None,
-                verb="Task overdue",
-                message=f"The task '{task.title}' is overdue and has been marked as 'FAILED'.",
-                action_object=task
-            )
+OVERDUE_TASK_BATCH_SIZE = 1000
 
-        updated_count = overdue_tasks.update(status='FAILED')
-        print(f'Successfully updated {updated_count} overdue tasks to "FAILED".')
+def _mark_overdue_batch(today, batch_size):
+    """
+    Moves one batch of overdue tasks to 'FAILED' in a single UPDATE ... RETURNING and
+    returns exactly the tasks it changed. Rows locked by a concurrent edit are skipped
+    and picked up by the next run.
+    """
+    table = connection.ops.quote_name(Task._meta.db_table)
+    return list(Task.objects.raw(
+        f"""
+        WITH due AS (
+            SELECT id FROM {table}
+            WHERE due_date < %s AND status NOT IN ('COMPLETED', 'CANCELED', 'FAILED')
+            ORDER BY id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE {table} SET status = 'FAILED', updated_at = %s
+        FROM due
+        WHERE {table}.id = due.id
+        RETURNING {table}.*
+        """,
+        [today, batch_size, timezone.now()]
+    ))
+
+def update_overdue_tasks(batch_size=OVERDUE_TASK_BATCH_SIZE):
+    """
+    Update overdue tasks to 'FAILED' status and notify the task creator.
+    Each batch is updated and notified in one transaction, so the notified tasks are
+    exactly the ones that were transitioned.
+    """
+    started = time.monotonic()
+    today = timezone.localdate()
+    total = 0
+
+    while True:
+        batch_started = time.monotonic()
+        with transaction.atomic():
+            tasks = _mark_overdue_batch(today, batch_size)
+            if tasks:
+                prefetch_related_objects(tasks, 'workspace')
+                create_notifications_bulk(
+                    [(task.created_by_id, task) for task in tasks],
+                    actor=None,
+                    verb="Task overdue",
+                    message=lambda task: f"The task '{task.title}' is overdue and has been marked as 'FAILED'."
+                )
+        if not tasks:
+            break
+        total += len(tasks)
+        logger.info("Marked %d overdue tasks as FAILED in %.3fs.", len(tasks), time.monotonic() - batch_started)
+        if len(tasks) < batch_size:
+            break
+
+    if total:
+        logger.info("Overdue sweep finished: %d tasks marked as FAILED in %.3fs.", total, time.monotonic() - started)
     else:
-        print('No overdue tasks to update.')
+        logger.info("No overdue tasks to update.")
+    return total
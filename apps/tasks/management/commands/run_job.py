@@ -0,0 +1,53 @@
+# apps/tasks/management/commands/run_job.py
+
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks.models import ScheduledJobRun
+from apps.tasks.schedule import SCHEDULED_JOBS, run_job
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs a scheduled job right now and records it in the job run history. "
+        "Use --period (repeatable) to backfill monthly reports for specific months."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('job_id', nargs='?', choices=list(SCHEDULED_JOBS))
+        parser.add_argument('--period', action='append', default=[], metavar='YYYY-MM',
+                            help="Month to run generate_monthly_reports for (default: previous month).")
+        parser.add_argument('--list', action='store_true', help="Show the jobs and their latest runs.")
+
+    def handle(self, *args, **options):
+        if options['list'] or not options['job_id']:
+            self.list_jobs()
+            return
+
+        job_id = options['job_id']
+        if options['period'] and job_id != 'generate_monthly_reports':
+            raise CommandError("--period only applies to generate_monthly_reports.")
+
+        runs = [{}] if not options['period'] else [self.parse_period(period) for period in options['period']]
+        for params in runs:
+            label = f"{job_id} {params}" if params else job_id
+            try:
+                result = run_job(job_id, trigger='MANUAL', **params)
+            except Exception as e:
+                raise CommandError(f"{label} failed: {e}")
+            self.stdout.write(self.style.SUCCESS(f"{label} finished. Result: {result}"))
+
+    def parse_period(self, value):
+        try:
+            period = datetime.strptime(value, '%Y-%m')
+        except ValueError:
+            raise CommandError(f"Invalid period '{value}', expected YYYY-MM.")
+        return {'year': period.year, 'month': period.month}
+
+    def list_jobs(self):
+        for job_id, job in SCHEDULED_JOBS.items():
+            cron = ' '.join(f"{field}={value}" for field, value in job['cron'].items())
+            self.stdout.write(f"{job_id} ({cron})")
+            for run in ScheduledJobRun.objects.filter(job_id=job_id)[:5]:
+                duration = f"{run.duration_seconds:.3f}s" if run.duration_seconds is not None else '-'
+                self.stdout.write(f"    {run.started_at:%Y-%m-%d %H:%M:%S} {run.trigger:<9} {run.status:<9} {duration:>10} {run.params or ''}")
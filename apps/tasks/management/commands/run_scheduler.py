@@ -0,0 +1,85 @@
+# apps/tasks/management/commands/run_scheduler.py
+
+import logging
+import signal
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+
+logger = logging.getLogger('apps.tasks.scheduler')
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs the periodic jobs (overdue task sweep, monthly reports). Any number of instances can be "
+        "started; a PostgreSQL advisory lock makes exactly one of them the active scheduler and the "
+        "others wait as standbys."
+    )
+
+    def handle(self, *args, **options):
+        # APScheduler is only ever imported by this process.
+        from apps.tasks.scheduler import build_scheduler
+
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        standby_logged = False
+        while not self.stopping:
+            if not self._acquire_lock():
+                if not standby_logged:
+                    logger.info("Another scheduler holds the lock; standing by.")
+                    standby_logged = True
+                self._sleep(settings.SCHEDULER_LOCK_RETRY_INTERVAL)
+                continue
+            standby_logged = False
+
+            logger.info("Scheduler lock acquired; this process is the leader.")
+            scheduler = build_scheduler()
+            scheduler.start()
+            try:
+                while not self.stopping and self._heartbeat():
+                    self._sleep(settings.SCHEDULER_HEARTBEAT_INTERVAL)
+            finally:
+                scheduler.shutdown(wait=True)
+                self._release_lock()
+            if not self.stopping:
+                logger.warning("Lost the database connection holding the scheduler lock; re-electing.")
+
+        logger.info("Scheduler stopped.")
+
+    def _acquire_lock(self):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_lock(%s)", [settings.SCHEDULER_LOCK_ID])
+                return cursor.fetchone()[0]
+        except DatabaseError:
+            logger.exception("Could not reach the database to take the scheduler lock.")
+            connection.close()
+            return False
+
+    def _heartbeat(self):
+        # The session-level lock lives as long as this connection does.
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except DatabaseError:
+            connection.close()
+            return False
+
+    def _release_lock(self):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [settings.SCHEDULER_LOCK_ID])
+        except DatabaseError:
+            connection.close()
+
+    def _sleep(self, seconds):
+        deadline = time.monotonic() + seconds
+        while not self.stopping and time.monotonic() < deadline:
+            time.sleep(min(1, seconds))
+
+    def _stop(self, signum, frame):
+        self.stopping = True
@@ -0,0 +1,33 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledJobRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.CharField(max_length=100)),
+                ('trigger', models.CharField(choices=[('SCHEDULER', 'Scheduler'), ('MANUAL', 'Manual')], default='SCHEDULER', max_length=20)),
+                ('params', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='RUNNING', max_length=20)),
+                ('started_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('duration_seconds', models.FloatField(blank=True, null=True)),
+                ('result', models.TextField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('host', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'db_table': 'scheduled_job_runs',
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['job_id', '-started_at'], name='job_run_job_started_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and avoids
+    # blocking writes to the tasks and comments tables while the indexes are built.
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0004_task_search_vector_taskcomment_search_vector'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['workspace', '-created_at', '-id'], name='tasks_workspace_feed_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='taskcomment',
+            index=models.Index(fields=['task', 'created_at', 'id'], name='task_comments_task_feed_idx'),
+        ),
+    ]
@@ -1,9 +1,29 @@
 # apps/tasks/models.py
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.utils import timezone
+from apps.common.search import SEARCH_CONFIG, SearchVectorManager
 from apps.users.models import User
 from apps.workspaces.models import Workspace
 
+RECENT_COMMENTS_LIMIT = 10
+# Keyset ordering of the task comment feed, oldest first.
+COMMENT_FEED_ORDERING = ('created_at', 'id')
+
+class TaskQuerySet(models.QuerySet):
+    def with_comment_summary(self, limit=RECENT_COMMENTS_LIMIT):
+        """
+        Annotates `comments_count` and prefetches the newest `limit` comments with their authors
+        into `recent_comments` (newest first), so a task's comment summary costs two queries
+        however long its history is.
+        """
+        recent = TaskComment.objects.select_related('user').order_by('-created_at', '-id')[:limit]
+        return self.annotate(comments_count=models.Count('comments')).prefetch_related(
+            models.Prefetch('comments', queryset=recent, to_attr='recent_comments')
+        )
+
 class Task(models.Model):
     STATUS_CHOICES = (
         ('STARTED', 'Started'),
@@ -36,10 +56,22 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector('title', weight='A', config=SEARCH_CONFIG) + SearchVector('description', weight='B', config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchVectorManager.from_queryset(TaskQuerySet)()
 
     class Meta:
         db_table = 'tasks'
         ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='tasks_search_gin'),
+            # Task feed: a workspace's tasks, newest first (keyset pagination on created_at, id).
+            models.Index(fields=['workspace', '-created_at', '-id'], name='tasks_workspace_feed_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.workspace.name})"
@@ -49,10 +81,54 @@ class TaskComment(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='task_comments')
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector('comment', config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchVectorManager()
 
     class Meta:
         db_table = 'task_comments'
         ordering = ['created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='task_comments_search_gin'),
+            # Comment feed: a task's comments, oldest first (COMMENT_FEED_ORDERING).
+            models.Index(fields=['task', 'created_at', 'id'], name='task_comments_task_feed_idx'),
+        ]
+
+    def __str__(self):
+        return f"Comment on {self.task.title} by {self.user.first_name} {self.user.last_name}"
+
+class ScheduledJobRun(models.Model):
+    """One execution of a scheduled job, whether started by `run_scheduler` or by `run_job`."""
+    STATUS_CHOICES = (
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    )
+    TRIGGER_CHOICES = (
+        ('SCHEDULER', 'Scheduler'),
+        ('MANUAL', 'Manual'),
+    )
+    job_id = models.CharField(max_length=100)
+    trigger = models.CharField(max_length=20, choices=TRIGGER_CHOICES, default='SCHEDULER')
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='RUNNING')
+    started_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_seconds = models.FloatField(null=True, blank=True)
+    result = models.TextField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+    host = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        db_table = 'scheduled_job_runs'
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['job_id', '-started_at'], name='job_run_job_started_idx'),
+        ]
 
     def __str__(self):
-        return f"Comment on {self.task.title} by {self.user.first_name} {self.user.last_name}"
\ No newline at end of file
+        return f"{self.job_id} at {self.started_at:%Y-%m-%d %H:%M} ({self.status})"
@@ -1,14 +1,11 @@
 # apps/tasks/permissions.py
 
 from rest_framework import permissions
-from apps.workspaces.models import WorkspaceMember
+from apps.workspaces.membership import get_role, is_member
 
 def get_user_role_in_workspace(user, workspace):
     """Get the role of a user in a specific workspace."""
-    try:
-        return WorkspaceMember.objects.get(workspace=workspace, user=user).role
-    except WorkspaceMember.DoesNotExist:
-        return None
+    return get_role(user, workspace)
 
 class IsWorkspaceMember(permissions.BasePermission):
     """Checks if the user is an active member of the workspace associated with the task."""
@@ -20,7 +17,7 @@ class IsWorkspaceMember(permissions.BasePermission):
             return False
         if user.user_type == 'ADMIN':
             return True
-        return WorkspaceMember.objects.filter(workspace=obj.workspace, user=user, is_active=True).exists()
+        return is_member(user, obj.workspace_id)
 
 class IsTeamLeaderForAction(permissions.BasePermission):
     """
@@ -50,9 +47,9 @@ class IsTeamLeaderForAction(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         """ Check if the user is the team leader of the workspace associated with the task."""
         user = request.user
-        role = get_user_role_in_workspace(user, obj.workspace)
+        role = get_user_role_in_workspace(user, obj.workspace_id)
 
-        return obj.created_by == user and role == 'TEAMLEADER'
+        return obj.created_by_id == user.id and role == 'TEAMLEADER'
 
 class IsAssigneeForStatusUpdate(permissions.BasePermission):
     """Only allows the assignee of the task to change its status."""
@@ -0,0 +1,63 @@
+# apps/tasks/schedule.py
+
+import logging
+import os
+import socket
+import time
+import traceback
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import ScheduledJobRun
+
+logger = logging.getLogger(__name__)
+
+# job id -> dotted path of the job function and its cron schedule (in TIME_ZONE).
+# Kept free of APScheduler so web workers and `run_job` never import it.
+SCHEDULED_JOBS = {
+    'update_overdue_tasks': {
+        'func': 'apps.tasks.jobs.update_overdue_tasks',
+        'cron': {'hour': '0', 'minute': '1'},
+    },
+    'reconcile_monthly_rollups': {
+        'func': 'apps.reports.rollups.reconcile_monthly_rollups',
+        'cron': {'hour': '1', 'minute': '30'},
+    },
+    'generate_monthly_reports': {
+        'func': 'apps.reports.jobs.generate_monthly_reports_and_salaries',
+        'cron': {'day': '1', 'hour': '2', 'minute': '0'},
+    },
+    'refresh_workspace_analytics': {
+        'func': 'apps.workspaces.analytics.refresh_workspace_analytics',
+        'cron': {'minute': '15'},
+    },
+}
+
+
+def run_job(job_id, trigger='SCHEDULER', **params):
+    """
+    Runs a registered job and records the run (status, duration, result or traceback)
+    in ScheduledJobRun. Errors are re-raised after being recorded.
+    """
+    func = import_string(SCHEDULED_JOBS[job_id]['func'])
+    run = ScheduledJobRun.objects.create(
+        job_id=job_id, trigger=trigger, params=params, host=f"{socket.gethostname()}:{os.getpid()}"
+    )
+    logger.info("Job %s started (run #%s, %s).", job_id, run.pk, trigger.lower())
+    started = time.monotonic()
+    try:
+        result = func(**params)
+    except Exception:
+        run.status = 'FAILED'
+        run.error = traceback.format_exc()
+        logger.exception("Job %s failed (run #%s).", job_id, run.pk)
+        raise
+    else:
+        run.status = 'SUCCEEDED'
+        run.result = None if result is None else str(result)
+        return result
+    finally:
+        run.finished_at = timezone.now()
+        run.duration_seconds = round(time.monotonic() - started, 3)
+        run.save(update_fields=['status', 'result', 'error', 'finished_at', 'duration_seconds'])
+        logger.info("Job %s finished in %.3fs with status %s.", job_id, run.duration_seconds, run.status)
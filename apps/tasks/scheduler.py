@@ -1,34 +1,52 @@
 # apps/tasks/scheduler.py
 
+import logging
 from apscheduler.schedulers.background import BackgroundScheduler
-from django_apscheduler.jobstores import DjangoJobStore
-from .jobs import update_overdue_tasks
-from apps.reports.jobs import generate_monthly_reports_and_salaries
+from apscheduler.triggers.cron import CronTrigger
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
 
-def start():
+from .models import ScheduledJobRun
+from .schedule import SCHEDULED_JOBS, run_job
+
+logger = logging.getLogger(__name__)
+
+
+def _run_scheduled(job_id):
+    # Jobs run in the scheduler's worker threads; each gets its own, freshly checked connection.
+    close_old_connections()
+    try:
+        run_job(job_id, trigger='SCHEDULER')
+    except Exception:
+        pass  # Already logged and recorded by run_job.
+    finally:
+        close_old_connections()
+
+
+def _missed_since_last_run(job_id, trigger):
+    """True if a fire time passed since the last scheduled run, e.g. while no scheduler was up."""
+    last_run = ScheduledJobRun.objects.filter(job_id=job_id, trigger='SCHEDULER').only('started_at').first()
+    if last_run is None:
+        return False
+    next_fire_time = trigger.get_next_fire_time(None, last_run.started_at)
+    return next_fire_time is not None and next_fire_time <= timezone.now()
+
+
+def build_scheduler():
     """
-    Start the background scheduler to run periodic tasks.
-    This function initializes the scheduler and adds jobs to it.
+    A scheduler with every job in SCHEDULED_JOBS. Jobs whose fire time was missed while no
+    leader was running are queued to run once right away.
     """
-    scheduler = BackgroundScheduler()
-    scheduler.add_jobstore(DjangoJobStore(), "default")
-    scheduler.add_job(
-        update_overdue_tasks,
-        trigger='cron',
-        hour='0',
-        minute='1',
-        id='update_overdue_tasks_job', 
-        replace_existing=True,
-    )
-    
-    scheduler.add_job(
-        generate_monthly_reports_and_salaries,
-        trigger='cron',
-        day='1',
-        hour='2',
-        minute='0',
-        id='generate_monthly_reports_job',
-        replace_existing=True,
-    )
-    print("Scheduler started...")
-    scheduler.start()
\ No newline at end of file
+    scheduler = BackgroundScheduler(timezone=settings.TIME_ZONE, job_defaults={
+        'coalesce': True,
+        'max_instances': 1,
+        'misfire_grace_time': settings.SCHEDULER_MISFIRE_GRACE_TIME,
+    })
+    for job_id, job in SCHEDULED_JOBS.items():
+        trigger = CronTrigger(timezone=settings.TIME_ZONE, **job['cron'])
+        scheduler.add_job(_run_scheduled, trigger=trigger, args=[job_id], id=job_id, replace_existing=True)
+        if _missed_since_last_run(job_id, trigger):
+            logger.warning("Job %s missed a scheduled run; running it now.", job_id)
+            scheduler.add_job(_run_scheduled, args=[job_id], id=f"{job_id}:catch-up")
+    return scheduler
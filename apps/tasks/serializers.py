@@ -2,10 +2,13 @@
 
 from rest_framework import serializers
 from django.utils import timezone
-from .models import Task, TaskComment
+from .models import COMMENT_FEED_ORDERING, RECENT_COMMENTS_LIMIT, Task, TaskComment
+from .board import BOARD_TASKS_PER_COLUMN
 from apps.users.models import User
 from apps.workspaces.models import Workspace, WorkspaceMember
 
+from apps.common.bulk import BULK_ACTION_MAX_IDS
+from apps.common.pagination import KeysetPagination
 from apps.users.serializers import UserSummarySerializer
 from apps.workspaces.serializers import WorkspaceSummarySerializer
 from apps.notifications.utils import create_notification
@@ -35,17 +38,64 @@ class TaskListSerializer(serializers.ModelSerializer):
             'status', 'status_display', 'priority', 'priority_display', 'due_date'
         ]
 
+# ----------------- Task Board Serializers -----------------
+
+class TaskBoardQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(required=False, default=BOARD_TASKS_PER_COLUMN, min_value=0, max_value=200,
+                                     help_text="Newest tasks returned per status column.")
+
+class TaskBoardColumnSerializer(serializers.Serializer):
+    status = serializers.CharField()
+    label = serializers.CharField()
+    count = serializers.IntegerField()
+    priority_counts = serializers.DictField(child=serializers.IntegerField())
+    tasks = TaskListSerializer(many=True)
+
+class TaskBoardAssigneeSerializer(serializers.Serializer):
+    user = UserSummarySerializer()
+    total = serializers.IntegerField()
+    open = serializers.IntegerField()
+    overdue = serializers.IntegerField()
+    completed = serializers.IntegerField()
+    urgent_open = serializers.IntegerField()
+
+class TaskBoardSerializer(serializers.Serializer):
+    workspace = WorkspaceSummarySerializer()
+    total = serializers.IntegerField()
+    columns = TaskBoardColumnSerializer(many=True)
+    assignees = TaskBoardAssigneeSerializer(many=True)
+
 class TaskDetailSerializer(serializers.ModelSerializer):
     workspace = WorkspaceSummarySerializer(read_only=True)
     assigned_to = UserSummarySerializer(read_only=True)
     created_by = UserSummarySerializer(read_only=True)
-    comments = TaskCommentSerializer(many=True, read_only=True)
+    recent_comments = TaskCommentSerializer(many=True, read_only=True)
+    comments_count = serializers.IntegerField(read_only=True)
+    comments_cursor = serializers.SerializerMethodField(
+        help_text="Cursor for the task's comment list returning the comments older than `recent_comments`; null when there are none."
+    )
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     priority_display = serializers.CharField(source='get_priority_display', read_only=True)
     
     class Meta:
         model = Task
-        fields = '__all__'
+        exclude = ['search_vector']
+
+    def to_representation(self, instance):
+        # Tasks loaded without Task.objects.with_comment_summary() (e.g. notification targets)
+        # get the same summary with two queries of their own.
+        if not hasattr(instance, 'comments_count'):
+            instance.comments_count = instance.comments.count()
+        if not hasattr(instance, 'recent_comments'):
+            instance.recent_comments = list(
+                instance.comments.select_related('user').order_by('-created_at', '-id')[:RECENT_COMMENTS_LIMIT]
+            )
+        return super().to_representation(instance)
+
+    def get_comments_cursor(self, obj) -> str | None:
+        if obj.comments_count <= len(obj.recent_comments):
+            return None
+        return KeysetPagination.cursor_for(obj.recent_comments[-1], COMMENT_FEED_ORDERING, reverse=True)
 
 class TaskCreateSerializer(serializers.ModelSerializer):
     workspace = serializers.PrimaryKeyRelatedField(queryset=Workspace.objects.all(), label="Ish maydoni")
@@ -119,4 +169,35 @@ class TaskUpdateByAssigneeSerializer(serializers.ModelSerializer):
             instance.completed_at = timezone.now()
         else:
             instance.completed_at = None
-        return super().update(instance, validated_data)
\ No newline at end of file
+        return super().update(instance, validated_data)
+
+
+# ----------------- Bulk Transition Serializers -----------------
+
+class TaskBulkTransitionSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=BULK_ACTION_MAX_IDS,
+        help_text="IDs of the tasks to change."
+    )
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    assigned_to = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), required=False, label="Bajaruvchi")
+    due_date = serializers.DateField(required=False)
+
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
+
+    def validate(self, data):
+        if not any(field in data for field in ('status', 'assigned_to', 'due_date')):
+            raise serializers.ValidationError("Provide at least one of status, assigned_to or due_date.")
+        return data
+
+class TaskBulkItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(help_text="Task ID")
+    result = serializers.ChoiceField(choices=('updated', 'skipped', 'not_found'))
+    detail = serializers.CharField(required=False)
+
+class TaskBulkTransitionResultSerializer(serializers.Serializer):
+    updated = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    not_found = serializers.IntegerField()
+    results = TaskBulkItemSerializer(many=True)
@@ -0,0 +1,12 @@
+# apps/tasks/signals.py
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.common.conditional import touch
+from .models import Task, TaskComment
+
+@receiver([post_save, post_delete], sender=TaskComment)
+def touch_task_on_comment_change(sender, instance, **kwargs):
+    """Task details embed the comments, so a comment change is a task change (see ConditionalGetMixin)."""
+    touch(Task, instance.task_id)
@@ -1,17 +1,23 @@
 # apps/tasks/views.py
 
 from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django.shortcuts import get_object_or_404
 
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.pagination import FeedPagination
+from apps.workspaces.membership import get_workspace_ids
 from apps.reports.models import MonthlyReport
-from apps.notifications.utils import create_notification
-from .models import Task, TaskComment
+from apps.notifications.utils import create_notification, create_notifications_bulk
+from .bulk import transition_tasks
+from .models import COMMENT_FEED_ORDERING, Task, TaskComment
 from .serializers import (
     TaskListSerializer, TaskDetailSerializer, 
     TaskCreateSerializer, TaskUpdateByTeamLeaderSerializer,
-    TaskUpdateByAssigneeSerializer, TaskCommentSerializer, TaskCommentCreateSerializer
+    TaskUpdateByAssigneeSerializer, TaskCommentSerializer, TaskCommentCreateSerializer,
+    TaskBulkTransitionSerializer, TaskBulkTransitionResultSerializer
 )
 from .permissions import (
     IsWorkspaceMember, IsTeamLeaderForAction, IsAssigneeForStatusUpdate, IsCommentOwner
@@ -24,9 +30,15 @@ from .permissions import (
     update=extend_schema(summary="📋 Update Task", tags=['Tasks']),
     partial_update=extend_schema(summary="📋 Partially Update Task", tags=['Tasks']),
     destroy=extend_schema(summary="📋 Delete Task (TeamLeader Only)", tags=['Tasks']),
+    bulk_transition=extend_schema(
+        request=TaskBulkTransitionSerializer, responses=TaskBulkTransitionResultSerializer,
+        summary="📋 Change Status, Assignee or Due Date of Many Tasks", tags=['Tasks']
+    ),
 )
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Task.objects.select_related('workspace', 'assigned_to', 'created_by').all()
+    pagination_class = FeedPagination
+    keyset_ordering = ('-created_at', '-id')
 
     def get_serializer_class(self):
         if getattr(self, 'swagger_fake_view', False):
@@ -37,6 +49,9 @@ class TaskViewSet(viewsets.ModelViewSet):
                 
         if self.action == 'create':
             return TaskCreateSerializer
+
+        if self.action == 'bulk_transition':
+            return TaskBulkTransitionSerializer
         
         if self.action in ['update', 'partial_update']:
             task = self.get_object()
@@ -53,12 +68,21 @@ class TaskViewSet(viewsets.ModelViewSet):
         user = self.request.user
         if not user.is_authenticated:
             return Task.objects.none()
-            
+
+        queryset = self.queryset.all()
+        if self.action == 'retrieve':
+            queryset = queryset.with_comment_summary()
         if user.user_type == 'ADMIN':
-            return self.queryset.all()
+            return queryset
             
-        user_workspace_ids = user.workspace_memberships.filter(is_active=True).values_list('workspace_id', flat=True)
-        return self.queryset.filter(workspace_id__in=user_workspace_ids)
+        user_workspace_ids = get_workspace_ids(user, active_only=True)
+        return queryset.filter(workspace_id__in=user_workspace_ids)
+
+    def get_object(self):
+        # get_serializer_class() needs the task to pick the update serializer; load and check it once per request.
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
 
     def get_permissions(self):
         if self.action == 'create':
@@ -81,6 +105,19 @@ class TaskViewSet(viewsets.ModelViewSet):
             action_object=task
         )
 
+    @action(detail=False, methods=['post'], url_path='bulk-transition')
+    def bulk_transition(self, request):
+        """
+        Applies one status, assignee and/or due date change to many tasks in one transaction.
+        The team leader who created a task may change anything on it; its assignee may only move
+        it to InProgress or Completed. Other tasks are skipped and reported in the results.
+        """
+        serializer = TaskBulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        changes = {field: value for field, value in serializer.validated_data.items() if field != 'ids'}
+        result = transition_tasks(request.user, self.get_queryset(), serializer.validated_data['ids'], changes)
+        return Response(result.as_dict())
+
 
 
 
@@ -94,6 +131,8 @@ class TaskViewSet(viewsets.ModelViewSet):
 )
 class TaskCommentViewSet(viewsets.ModelViewSet):
     queryset = TaskComment.objects.select_related('user').all()
+    pagination_class = FeedPagination
+    keyset_ordering = COMMENT_FEED_ORDERING
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -124,16 +163,8 @@ class TaskCommentViewSet(viewsets.ModelViewSet):
         commenter = self.request.user
         comment = serializer.save(user=commenter, task=task)
         
-        create_notification(
-            recipient=task.created_by,
-            actor=commenter,
-            verb="commented on your task",
-            message=f"'{commenter.get_full_name()}' commented on your task: '{task.title}'.",
-            action_object=comment
-        )
-
-        create_notification(
-            recipient=task.assigned_to,
+        create_notifications_bulk(
+            [task.created_by_id, task.assigned_to_id],
             actor=commenter,
             verb="commented on your task",
             message=f"'{commenter.get_full_name()}' commented on your task: '{task.title}'.",
@@ -0,0 +1,24 @@
+# apps/users/filters.py
+
+import django_filters
+
+from .models import Student
+from .skills import normalize_skills, with_all_skills
+
+
+class StudentProfileFilter(django_filters.FilterSet):
+    skills = django_filters.CharFilter(
+        method='filter_skills',
+        help_text="Comma-separated skills the student must all have (case-insensitive), e.g. 'Django,React'."
+    )
+    year_of_study_min = django_filters.NumberFilter(field_name='year_of_study', lookup_expr='gte')
+    jlpt = django_filters.CharFilter(lookup_expr='iexact')
+    ielts = django_filters.CharFilter(lookup_expr='iexact')
+
+    class Meta:
+        model = Student
+        fields = ['year_of_study', 'level_status', 'semester']
+
+    def filter_skills(self, queryset, name, value):
+        skills = normalize_skills(value.split(','))
+        return with_all_skills(queryset, skills) if skills else queryset
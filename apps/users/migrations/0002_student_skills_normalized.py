@@ -0,0 +1,25 @@
+# Generated by Django 5.2.3 on 2026-10-17 19:39
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='skills_normalized',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.functions.text.Lower(django.db.models.functions.comparison.Cast('it_skills', models.TextField())), models.JSONField()), output_field=models.JSONField()),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skills_normalized'], name='students_skills_gin'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.functions import Cast, Lower
 from django.core.validators import FileExtensionValidator
 
 class UserManager(BaseUserManager):
@@ -93,6 +95,12 @@ class Student(models.Model):
         default=None 
     )
     it_skills = models.JSONField(default=list, blank=True)
+    # `it_skills` lower-cased for case-insensitive skill queries, maintained by PostgreSQL.
+    skills_normalized = models.GeneratedField(
+        expression=Cast(Lower(Cast('it_skills', models.TextField())), models.JSONField()),
+        output_field=models.JSONField(),
+        db_persist=True,
+    )
     semester = models.IntegerField(choices=SEMESTER_CHOICES, blank=True, null=True)
     year_of_study = models.IntegerField(choices=YEAR_CHOICES, blank=True, null=True)
     hire_date = models.DateField(null=True, blank=True)
@@ -116,6 +124,10 @@ class Student(models.Model):
     class Meta:
         db_table = 'students'
         ordering = ['user__email']
+        indexes = [
+            # Serves skill containment (@>) and overlap (?|) queries.
+            GinIndex(fields=['skills_normalized'], name='students_skills_gin'),
+        ]
 
 class Recruiter(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='recruiter_profile')
@@ -2,12 +2,18 @@
 
 import json
 from rest_framework import serializers
-import requests
 from django.conf import settings
 from django.contrib.auth import authenticate
+from django.contrib.auth.tokens import default_token_generator
+from django.utils.encoding import force_bytes, force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from django.db import transaction
 from .models import User, Student, Recruiter, Staff
+from .skills import matched_skills
 from apps.workspaces.models import WorkspaceMember
+from apps.workspaces.membership import invalidate_memberships
 from apps.notifications.utils import create_notification
+from apps.outbox.utils import enqueue
 
 class StringifiedJSONField(serializers.JSONField):
     def to_internal_value(self, data):
@@ -18,6 +24,19 @@ class StringifiedJSONField(serializers.JSONField):
                 self.fail('invalid', input=data)
         return super().to_internal_value(data)
 
+class SkillListField(StringifiedJSONField):
+    """A JSON list of skill names; blanks and repeats are dropped."""
+    def to_internal_value(self, data):
+        skills = super().to_internal_value(data)
+        if not isinstance(skills, list) or not all(isinstance(skill, str) for skill in skills):
+            raise serializers.ValidationError("Expected a list of skill names.")
+        seen, unique = set(), []
+        for skill in (skill.strip() for skill in skills):
+            if skill and skill.lower() not in seen:
+                seen.add(skill.lower())
+                unique.append(skill)
+        return unique
+
 class ChangePasswordSerializer(serializers.Serializer):
     old_password = serializers.CharField(required=True, write_only=True)
     new_password = serializers.CharField(required=True, write_only=True, min_length=8)
@@ -34,6 +53,25 @@ class ChangePasswordSerializer(serializers.Serializer):
             raise serializers.ValidationError({"new_password": "New passwords do not match"})
         return attrs
 
+class SetPasswordSerializer(serializers.Serializer):
+    """Sets a password with the one-time token sent in the welcome email."""
+    uid = serializers.CharField(required=True, write_only=True)
+    token = serializers.CharField(required=True, write_only=True)
+    new_password = serializers.CharField(required=True, write_only=True, min_length=8)
+    confirm_password = serializers.CharField(required=True, write_only=True)
+
+    def validate(self, attrs):
+        try:
+            user = User.objects.get(pk=force_str(urlsafe_base64_decode(attrs['uid'])))
+        except (TypeError, ValueError, OverflowError, User.DoesNotExist):
+            user = None
+        if user is None or not default_token_generator.check_token(user, attrs['token']):
+            raise serializers.ValidationError({"token": "The link is invalid or has expired."})
+        if attrs['new_password'] != attrs['confirm_password']:
+            raise serializers.ValidationError({"new_password": "New passwords do not match"})
+        attrs['user'] = user
+        return attrs
+
 # --- USER SERIALIZERS ---
 class UserDetailSerializer(serializers.ModelSerializer):
     class Meta:
@@ -53,41 +91,26 @@ class UserCreateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         password = validated_data.pop('password')
-        user = User(**validated_data)
-        user.set_password(password)
-        user.save()
-        if user.user_type == 'STUDENT': Student.objects.create(user=user)
-        elif user.user_type == 'RECRUITER': Recruiter.objects.create(user=user)
-        elif user.user_type == 'STAFF': Staff.objects.create(user=user)
-        create_notification(
-            recipient=user, actor=None, verb="You have successfully registered on JDU Coworking platform.",
-            message=f"Welcome, {user.first_name}! You have successfully registered on JDU Coworking platform."
-        )
-    
-        print(f"New user created: {user.email}. Triggering welcome email.")
-        lambda_url = settings.LAMBDA_WELCOME_EMAIL_URL
-        api_key = settings.LAMBDA_API_KEY
-
-        if not lambda_url or not api_key:
-            print("Warning: Lambda URL or API Key is not configured. Skipping email.")
-        else:
-            payload = {
+        with transaction.atomic():
+            user = User(**validated_data)
+            user.set_password(password)
+            user.save()
+            if user.user_type == 'STUDENT': Student.objects.create(user=user)
+            elif user.user_type == 'RECRUITER': Recruiter.objects.create(user=user)
+            elif user.user_type == 'STAFF': Staff.objects.create(user=user)
+            create_notification(
+                recipient=user, actor=None, verb="You have successfully registered on JDU Coworking platform.",
+                message=f"Welcome, {user.first_name}! You have successfully registered on JDU Coworking platform."
+            )
+            # Delivered by the outbox worker, so the request never waits on the Lambda endpoint.
+            # The email carries a one-time set-password token (for auth/set-password/), never the password:
+            # the token expires after PASSWORD_RESET_TIMEOUT and stops working once the password changes.
+            enqueue('users.welcome_email', {
                 "email": user.email,
                 "first_name": user.first_name,
-                "password": password  
-            }
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": api_key
-            }
-            try:
-                response = requests.post(lambda_url, json=payload, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    print(f"Successfully triggered welcome email for {user.email}.")
-                else:
-                    print(f"Error triggering Lambda for {user.email}. Status: {response.status_code}, Response: {response.text}")
-            except requests.exceptions.RequestException as e:
-                print(f"Failed to connect to Lambda endpoint: {e}")
+                "uid": urlsafe_base64_encode(force_bytes(user.pk)),
+                "token": default_token_generator.make_token(user)
+            })
         return user
 
        
@@ -112,6 +135,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
                 if new_role == 'STUDENT' and hasattr(instance, 'student_profile') and instance.student_profile.level_status == 'TEAMLEAD':
                     new_role = 'TEAMLEADER'
                 WorkspaceMember.objects.filter(user=instance).update(role=new_role)
+                invalidate_memberships(instance)
         return super().update(instance, validated_data)
 
 # --- PROFILE SERIALIZERS ---
@@ -119,13 +143,28 @@ class StudentProfileListSerializer(serializers.ModelSerializer):
     user = UserSummarySerializer(read_only=True)
     class Meta:
         model = Student
-        fields = ['id', 'user', 'level_status', 'year_of_study']
+        fields = ['id', 'user', 'level_status', 'year_of_study', 'it_skills']
+
+class StudentSkillMatchSerializer(StudentProfileListSerializer):
+    """A student scored against a skill list passed in the context as `skills` (normalized)."""
+    matched_skills_count = serializers.IntegerField(read_only=True)
+    matched_skills = serializers.SerializerMethodField()
+    match_ratio = serializers.SerializerMethodField()
+
+    class Meta(StudentProfileListSerializer.Meta):
+        fields = StudentProfileListSerializer.Meta.fields + ['jlpt', 'ielts', 'matched_skills_count', 'matched_skills', 'match_ratio']
+
+    def get_matched_skills(self, obj) -> list[str]:
+        return matched_skills(obj.it_skills, self.context['skills'])
+
+    def get_match_ratio(self, obj) -> float:
+        return round(obj.matched_skills_count / len(self.context['skills']), 4)
 
 class StudentProfileDetailSerializer(serializers.ModelSerializer):
     user = UserDetailSerializer(read_only=True)
     class Meta:
         model = Student
-        fields = '__all__'
+        exclude = ['skills_normalized']
 
 class RecruiterProfileListSerializer(serializers.ModelSerializer):
     user = UserSummarySerializer(read_only=True)
@@ -153,16 +192,16 @@ class StaffProfileDetailSerializer(serializers.ModelSerializer):
 
 # --- PROFILE UPDATE SERIALIZERS ---
 class StudentProfilePersonalUpdateSerializer(serializers.ModelSerializer):
-    it_skills = StringifiedJSONField(required=False)
+    it_skills = SkillListField(required=False)
     class Meta:
         model = Student
         fields = ['it_skills', 'bio', 'resume_file', 'jlpt', 'ielts']
 
 class StudentProfileAdminUpdateSerializer(serializers.ModelSerializer):
-    it_skills = StringifiedJSONField(required=False)
+    it_skills = SkillListField(required=False)
     class Meta:
         model = Student
-        exclude = ['user']
+        exclude = ['user', 'skills_normalized']
 
 class RecruiterProfileUpdateSerializer(serializers.ModelSerializer):
     class Meta:
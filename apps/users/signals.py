@@ -10,6 +10,7 @@ from .models import User, Student
 
 # Models and utils from other apps
 from apps.workspaces.models import WorkspaceMember
+from apps.workspaces.membership import invalidate_memberships
 from apps.notifications.utils import create_notification
 
 # ====================================================================
@@ -30,6 +31,7 @@ def sync_student_role_in_workspaces(sender, instance, **kwargs):
     if instance.level_status == 'TEAMLEAD':
         updated_count = WorkspaceMember.objects.filter(user=user).exclude(role='TEAMLEADER').update(role='TEAMLEADER')
         if updated_count > 0:
+            invalidate_memberships(user)
             create_notification(
                 recipient=user,
                 actor=None, 
@@ -40,6 +42,7 @@ def sync_student_role_in_workspaces(sender, instance, **kwargs):
     elif instance.level_status == 'SIMPLE':
         updated_count = WorkspaceMember.objects.filter(user=user).exclude(role='STUDENT').update(role='STUDENT')
         if updated_count > 0:
+            invalidate_memberships(user)
             create_notification(
                 recipient=user,
                 actor=None,
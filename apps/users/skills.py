@@ -0,0 +1,62 @@
+# apps/users/skills.py
+
+import re
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.functions import Coalesce
+
+SKILL_MATCH_LIMIT = 20
+# Separators between the skills of a vacancy's requirements text: commas, semicolons, slashes, new lines, bullets.
+_REQUIREMENT_SEPARATORS = re.compile(r'[,;/|\n\r•]+')
+
+
+def normalize_skills(skills):
+    """Lower-cased, stripped, de-duplicated skill names, in their original order."""
+    return list(dict.fromkeys(skill.strip().lower() for skill in skills if skill and skill.strip()))
+
+
+def parse_requirements(text):
+    """Skill list of a vacancy's requirements text, e.g. "Django, React\\n- PostgreSQL"."""
+    return normalize_skills(part.strip(' \t-*.') for part in _REQUIREMENT_SEPARATORS.split(text or ''))
+
+
+def matched_skills(it_skills, skills):
+    """The entries of a student's `it_skills` found in `skills` (normalized), as the student wrote them."""
+    skills = set(skills)
+    return [skill for skill in it_skills if skill.strip().lower() in skills]
+
+
+def skill_match_count(skills, field='skills_normalized'):
+    """SQL expression counting how many of `skills` (normalized) the skill list in `field` contains."""
+    return sum(
+        (Case(When(**{f'{field}__contains': [skill]}, then=Value(1)), default=Value(0), output_field=IntegerField())
+         for skill in skills),
+        Value(0),
+    )
+
+
+def with_all_skills(queryset, skills):
+    """Students having every one of `skills` (case-insensitive), served by the skill index."""
+    return queryset.filter(skills_normalized__contains=normalize_skills(skills))
+
+
+def match_students(queryset, skills, limit=SKILL_MATCH_LIMIT):
+    """
+    The `limit` students of `queryset` best matching `skills`, scored in SQL: the skill index
+    narrows the table down to students with at least one of the skills, each is scored by the
+    number of skills they have, and ties go to students further along in their studies.
+    Ranking reads only ids and scores; the winners are then loaded with one more query.
+    Returns a list of students carrying `matched_skills_count`, best first.
+    """
+    skills = normalize_skills(skills)
+    if not skills:
+        return []
+    ranked = list(
+        queryset.filter(skills_normalized__has_any_keys=skills)
+        .annotate(matched_skills_count=skill_match_count(skills))
+        .order_by('-matched_skills_count', Coalesce('year_of_study', 0).desc(), 'id')
+        .values_list('id', 'matched_skills_count')[:limit]
+    )
+    students = queryset.in_bulk([pk for pk, _ in ranked])
+    for pk, score in ranked:
+        students[pk].matched_skills_count = score
+    return [students[pk] for pk, _ in ranked]
@@ -13,7 +13,8 @@ from .views import (
     StudentProfileViewSet, 
     RecruiterProfileViewSet, 
     StaffProfileViewSet,
-    ChangePasswordView
+    ChangePasswordView,
+    SetPasswordView
 )
 
 router = DefaultRouter(trailing_slash=False)
@@ -28,6 +29,7 @@ auth_urlpatterns = [
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('token/verify/', TokenVerifyView.as_view(), name='token_verify'),
     path('change-password/', ChangePasswordView.as_view(), name='change-password'),
+    path('set-password/', SetPasswordView.as_view(), name='set-password'),
 ]
 
 urlpatterns = [
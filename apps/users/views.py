@@ -14,8 +14,10 @@ from .serializers import (
     StudentProfilePersonalUpdateSerializer, StudentProfileAdminUpdateSerializer,
     RecruiterProfileListSerializer, RecruiterProfileDetailSerializer, RecruiterProfileUpdateSerializer,
     StaffProfileListSerializer, StaffProfileDetailSerializer, StaffProfileUpdateSerializer,
-    ChangePasswordSerializer
+    ChangePasswordSerializer, SetPasswordSerializer
 )
+from apps.common.conditional import ConditionalGetMixin
+from .filters import StudentProfileFilter
 from .permissions import IsAdminUser, IsStaffUser, IsRecruiterUser, IsStudentUser, IsAdminOrStaff, IsProfileOwner
 
 @extend_schema(summary="🔐 Change Password", tags=["Authentication"])
@@ -34,6 +36,20 @@ class ChangePasswordView(generics.UpdateAPIView):
             user.save()
             return Response({"message": "Password changed successfully."}, status=status.HTTP_200_OK)
 
+@extend_schema(summary="🔑 Set Password from the Welcome Email", tags=["Authentication"])
+class SetPasswordView(generics.GenericAPIView):
+    serializer_class = SetPasswordSerializer
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data['user']
+        user.set_password(serializer.validated_data["new_password"])
+        user.save()
+        return Response({"message": "Password set successfully."}, status=status.HTTP_200_OK)
+
 @extend_schema_view(
     list=extend_schema(summary="👥 [ADMIN] List of all users", tags=["User Management"]),
     retrieve=extend_schema(summary="👤 [ADMIN] Get a single user", tags=["User Management"]),
@@ -43,7 +59,7 @@ class ChangePasswordView(generics.UpdateAPIView):
     destroy=extend_schema(summary="🗑️ [ADMIN] Delete a user", tags=["User Management"]),
     me=extend_schema(summary="👤 Get current user details", tags=["User Management"])
 )
-class UserManagementViewSet(viewsets.ModelViewSet):
+class UserManagementViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = User.objects.all().order_by('-created_at')
     permission_classes = [IsAdminUser]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -75,6 +91,7 @@ class BaseProfileViewSet(mixins.RetrieveModelMixin, mixins.UpdateModelMixin,
 )
 class StudentProfileViewSet(BaseProfileViewSet):
     queryset = Student.objects.select_related('user').all()
+    filterset_class = StudentProfileFilter
     
     def get_serializer_class(self):
         if getattr(self, 'swagger_fake_view', False): return StudentProfileListSerializer
@@ -1,6 +1,6 @@
 # apps/workspaces/admin.py
 from django.contrib import admin
-from .models import Workspace, WorkspaceMember
+from .models import Workspace, WorkspaceMember, WorkspaceActivitySummary
 
 @admin.register(Workspace)
 class WorkspaceAdmin(admin.ModelAdmin):
@@ -16,3 +16,10 @@ class WorkspaceMemberAdmin(admin.ModelAdmin):
     list_filter = ['role', 'is_active', 'joined_at']
     search_fields = ['workspace__name', 'user__email', 'user__first_name', 'user__last_name']
     raw_id_fields = ['workspace', 'user']
+
+
+@admin.register(WorkspaceActivitySummary)
+class WorkspaceActivitySummaryAdmin(admin.ModelAdmin):
+    list_display = ['workspace', 'period', 'period_start', 'hours_worked', 'payroll_net', 'tasks_due', 'refreshed_at']
+    list_filter = ['period']
+    raw_id_fields = ['workspace']
@@ -0,0 +1,168 @@
+# apps/workspaces/analytics.py
+
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, DateField, Q, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from apps.meetings.models import Meeting
+from apps.reports.models import DailyReport, MonthlyHoursRollup, SalaryRecord
+from apps.tasks.models import Task
+from .models import WorkspaceActivitySummary
+
+logger = logging.getLogger(__name__)
+
+
+def months_back(day, months):
+    """First day of the month `months` months before the month of `day`."""
+    index = day.year * 12 + day.month - 1 - months
+    return day.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def _month_filter(start):
+    """Rows with (year, month) on or after the month of `start`."""
+    return Q(year__gt=start.year) | Q(year=start.year, month__gte=start.month)
+
+
+def collect_activity(month_start=None, week_start=None):
+    """
+    Aggregates hours, payroll, task and meeting figures per workspace and period with one
+    grouped query per source. Returns {(workspace_id, period, period_start): {field: value}}.
+    Without start dates the whole history is aggregated.
+    """
+    today = timezone.localdate()
+    rows = defaultdict(dict)
+
+    daily_reports = DailyReport.objects.all()
+    rollups = MonthlyHoursRollup.objects.filter(report_count__gt=0)
+    salaries = SalaryRecord.objects.all()
+    tasks = Task.objects.all()
+    meetings = Meeting.objects.filter(workspace__isnull=False).exclude(status=Meeting.Status.CANCELLED)
+    if week_start is not None:
+        daily_reports = daily_reports.filter(report_date__gte=week_start)
+    if month_start is not None:
+        rollups = rollups.filter(_month_filter(month_start))
+        salaries = salaries.filter(_month_filter(month_start))
+        tasks = tasks.filter(due_date__gte=month_start)
+        meetings = meetings.filter(start_time__date__gte=month_start)
+
+    weekly = (
+        daily_reports.annotate(period_start=TruncWeek('report_date'))
+        .values('workspace_id', 'period_start')
+        .annotate(hours=Sum('hours_worked'), reports=Count('id'), students=Count('student_id', distinct=True))
+        .order_by()
+    )
+    for row in weekly:
+        rows[(row['workspace_id'], 'WEEK', row['period_start'])].update(
+            hours_worked=row['hours'], report_count=row['reports'], active_students=row['students']
+        )
+
+    monthly_hours = (
+        rollups.values('workspace_id', 'year', 'month')
+        .annotate(hours=Sum('total_hours'), reports=Sum('report_count'), students=Count('student_id'))
+        .order_by()
+    )
+    for row in monthly_hours:
+        rows[(row['workspace_id'], 'MONTH', date(row['year'], row['month'], 1))].update(
+            hours_worked=row['hours'], report_count=row['reports'], active_students=row['students']
+        )
+
+    payroll = (
+        salaries.values('workspace_id', 'year', 'month')
+        .annotate(gross=Sum('gross_amount'), net=Sum('net_amount'))
+        .order_by()
+    )
+    for row in payroll:
+        rows[(row['workspace_id'], 'MONTH', date(row['year'], row['month'], 1))].update(
+            payroll_gross=row['gross'], payroll_net=row['net']
+        )
+
+    # Tasks are counted in the month they are due in.
+    overdue = Q(status='FAILED') | (Q(due_date__lt=today) & ~Q(status__in=['COMPLETED', 'CANCELED', 'FAILED']))
+    task_counts = (
+        tasks.annotate(period_start=TruncMonth('due_date'))
+        .values('workspace_id', 'period_start')
+        .annotate(
+            due=Count('id', filter=~Q(status='CANCELED')),
+            completed=Count('id', filter=Q(status='COMPLETED')),
+            overdue=Count('id', filter=overdue),
+        )
+        .order_by()
+    )
+    for row in task_counts:
+        rows[(row['workspace_id'], 'MONTH', row['period_start'])].update(
+            tasks_due=row['due'], tasks_completed=row['completed'], tasks_overdue=row['overdue']
+        )
+
+    meeting_counts = (
+        meetings.annotate(period_start=TruncMonth('start_time', output_field=DateField()))
+        .values('workspace_id', 'period_start')
+        .annotate(meetings=Count('id'))
+        .order_by()
+    )
+    for row in meeting_counts:
+        rows[(row['workspace_id'], 'MONTH', row['period_start'])]['meetings_count'] = row['meetings']
+
+    return rows
+
+
+def refresh_workspace_analytics(months=None):
+    """
+    Rebuilds the workspace activity summaries of the last `months` months
+    (WORKSPACE_ANALYTICS_REFRESH_MONTHS by default) in one transaction; older rows are kept.
+    The first run, when no summaries exist yet, rebuilds the whole history.
+    Returns the number of summary rows written.
+    """
+    months = settings.WORKSPACE_ANALYTICS_REFRESH_MONTHS if months is None else months
+    summaries = WorkspaceActivitySummary.objects.all()
+    month_start = week_start = None
+    if summaries.exists():
+        month_start = months_back(timezone.localdate(), months - 1)
+        week_start = month_start - timedelta(days=month_start.weekday())
+        summaries = summaries.filter(
+            Q(period='MONTH', period_start__gte=month_start) | Q(period='WEEK', period_start__gte=week_start)
+        )
+
+    rows = collect_activity(month_start, week_start)
+    with transaction.atomic():
+        summaries.delete()
+        created = WorkspaceActivitySummary.objects.bulk_create([
+            WorkspaceActivitySummary(workspace_id=workspace_id, period=period, period_start=period_start, **values)
+            for (workspace_id, period, period_start), values in rows.items()
+        ], batch_size=1000)
+    logger.info("Workspace analytics refreshed: %d summary rows written since %s.", len(created), month_start or "the beginning")
+    return len(created)
+
+
+def workspace_analytics(workspace, months):
+    """
+    Dashboard data of one workspace for the last `months` months, read from the summary table
+    with a single query: weekly and monthly series plus totals over the period.
+    """
+    since = months_back(timezone.localdate(), months - 1)
+    summaries = list(workspace.activity_summaries.filter(
+        Q(period='MONTH', period_start__gte=since)
+        | Q(period='WEEK', period_start__gte=since - timedelta(days=since.weekday()))
+    ).order_by('period_start'))
+    monthly = [summary for summary in summaries if summary.period == 'MONTH']
+
+    totals = {
+        name: sum(getattr(summary, name) for summary in monthly)
+        for name in ('hours_worked', 'payroll_gross', 'payroll_net', 'tasks_due', 'tasks_completed', 'tasks_overdue', 'meetings_count')
+    }
+    tasks_due = totals['tasks_due']
+    totals['completion_rate'] = round(totals['tasks_completed'] / tasks_due, 4) if tasks_due else None
+    totals['overdue_ratio'] = round(totals['tasks_overdue'] / tasks_due, 4) if tasks_due else None
+
+    return {
+        'workspace': workspace,
+        'since': since,
+        'refreshed_at': max((summary.refreshed_at for summary in summaries), default=None),
+        'totals': totals,
+        'weekly': [summary for summary in summaries if summary.period == 'WEEK'],
+        'monthly': monthly,
+    }
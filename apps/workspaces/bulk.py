@@ -0,0 +1,144 @@
+# apps/workspaces/bulk.py
+
+import threading
+from contextlib import contextmanager
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from apps.common.bulk import BulkActionResult
+from apps.common.conditional import touch
+from apps.notifications.utils import create_notifications_bulk
+from apps.users.models import User
+from .membership import invalidate_memberships
+from .models import Workspace, WorkspaceMember
+
+_state = threading.local()
+
+ROLE_BY_USER_TYPE = {'ADMIN': 'ADMIN', 'STAFF': 'STAFF', 'RECRUITER': 'RECRUITER'}
+
+
+@contextmanager
+def bulk_member_change():
+    """
+    Silences the per-member signal side effects (notifications, touching the workspace) while a
+    bulk change runs; the bulk code does them once for the whole batch. Cache invalidation
+    signals keep running.
+    """
+    previous = getattr(_state, 'suppressed', False)
+    _state.suppressed = True
+    try:
+        yield
+    finally:
+        _state.suppressed = previous
+
+
+def in_bulk_member_change():
+    return getattr(_state, 'suppressed', False)
+
+
+def resolve_member_role(user_type, level_status):
+    """Workspace role for a user: staff-like types map directly, students by their level."""
+    if user_type == 'STUDENT':
+        return 'TEAMLEADER' if level_status == 'TEAMLEAD' else 'STUDENT'
+    return ROLE_BY_USER_TYPE.get(user_type)
+
+
+def resolve_member_roles(user_ids):
+    """{user_id: role} for the existing users among `user_ids`, read with one query."""
+    users = User.objects.filter(id__in=user_ids).values_list('id', 'user_type', 'student_profile__level_status')
+    return {user_id: resolve_member_role(user_type, level_status) for user_id, user_type, level_status in users}
+
+
+def lock_workspace(workspace):
+    """Locks the workspace row, serializing membership changes so `max_members` holds under concurrency."""
+    return Workspace.objects.select_for_update().get(pk=getattr(workspace, 'pk', workspace))
+
+
+def add_members(workspace, user_ids, is_active=True, roles=None, result=None, notify=True):
+    """
+    Adds the users to the workspace in one transaction: existing members are skipped, roles are
+    resolved in one query (or taken from `roles`), the members are inserted with bulk_create
+    and, unless `notify` is off, notified with one bulk insert. Raises ValidationError, adding
+    no one, when the new active members would exceed `max_members`.
+    Returns (created members, BulkActionResult).
+    """
+    result = result or BulkActionResult(outcomes=('added', 'skipped', 'not_found'))
+    with transaction.atomic():
+        workspace = lock_workspace(workspace)
+        existing = set(WorkspaceMember.objects.filter(workspace=workspace, user_id__in=user_ids).values_list('user_id', flat=True))
+        candidates = [user_id for user_id in user_ids if user_id not in existing]
+        if roles is None:
+            roles = resolve_member_roles(candidates)
+
+        members = []
+        for user_id in user_ids:
+            if user_id in existing:
+                result.skipped(user_id, "Already a member of this workspace.")
+            elif user_id not in roles:
+                result.not_found(user_id, "User not found.")
+            elif roles[user_id] is None:
+                result.skipped(user_id, "Role could not be determined for the user.")
+            else:
+                members.append(WorkspaceMember(workspace=workspace, user_id=user_id, role=roles[user_id], is_active=is_active))
+
+        if is_active and members:
+            free_seats = workspace.max_members - workspace.members.filter(is_active=True).count()
+            if len(members) > free_seats:
+                raise ValidationError(
+                    f"The workspace has {max(free_seats, 0)} free seats; {len(members)} new members cannot be added."
+                )
+
+        members = WorkspaceMember.objects.bulk_create(members)
+        for member in members:
+            result.record(member.user_id, 'added')
+        if members:
+            invalidate_memberships(*[member.user_id for member in members])
+            touch(Workspace, workspace.pk)
+        if members and notify:
+            create_notifications_bulk(
+                [member.user_id for member in members],
+                actor=workspace.created_by_id,
+                verb=f"You added '{workspace.name}' workspace.",
+                message=f"Congratulations! You have been added to the '{workspace.name}' workspace.",
+                action_object=workspace
+            )
+    return members, result
+
+
+def remove_members(workspace, user_ids):
+    """
+    Removes the users' memberships in one transaction and notifies them with one bulk insert.
+    The workspace always keeps at least one admin. Returns a BulkActionResult.
+    """
+    result = BulkActionResult(outcomes=('removed', 'skipped', 'not_found'))
+    with transaction.atomic():
+        workspace = lock_workspace(workspace)
+        members = {member.user_id: member for member in WorkspaceMember.objects.filter(workspace=workspace, user_id__in=user_ids)}
+        remaining_admins = workspace.members.filter(role='ADMIN').exclude(user_id__in=list(members)).exists()
+
+        removed = []
+        for user_id in user_ids:
+            member = members.get(user_id)
+            if member is None:
+                result.not_found(user_id, "Not a member of this workspace.")
+            elif member.role == 'ADMIN' and not remaining_admins:
+                # Keep the first admin in the request so the workspace is never left without one.
+                remaining_admins = True
+                result.skipped(user_id, "You cannot remove the last admin from the workspace.")
+            else:
+                removed.append(member)
+                result.record(user_id, 'removed')
+
+        if removed:
+            # post_delete still drops each user's cached memberships.
+            with bulk_member_change():
+                WorkspaceMember.objects.filter(id__in=[member.id for member in removed]).delete()
+            touch(Workspace, workspace.pk)
+            create_notifications_bulk(
+                [member.user_id for member in removed],
+                actor=None,
+                verb=f"You have been removed from '{workspace.name}' workspace.",
+                message=f"You have been removed from the '{workspace.name}' workspace.",
+                action_object=workspace
+            )
+    return result
@@ -0,0 +1,84 @@
+# apps/workspaces/membership.py
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import WorkspaceMember
+
+MEMBERSHIP_CACHE_KEY = 'workspaces:memberships:{user_id}'
+# Attribute on the user object holding the memberships for the rest of the request.
+MEMBERSHIP_ATTR = '_workspace_memberships'
+
+
+def _cache_key(user_id):
+    return MEMBERSHIP_CACHE_KEY.format(user_id=user_id)
+
+
+def _workspace_id(workspace):
+    """Accepts a Workspace, an id, or an id string as sent in request data."""
+    workspace_id = getattr(workspace, 'pk', workspace)
+    try:
+        return int(workspace_id)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_memberships(user):
+    """
+    Returns {workspace_id: (role, is_active)} for every workspace the user belongs to.
+    Loaded with one query, kept on the user object for the rest of the request and, when
+    WORKSPACE_MEMBERSHIP_CACHE_TTL is set, cached across requests until one of the user's
+    memberships changes.
+    """
+    if not user or not user.is_authenticated:
+        return {}
+    memberships = getattr(user, MEMBERSHIP_ATTR, None)
+    if memberships is None:
+        key = _cache_key(user.pk)
+        ttl = settings.WORKSPACE_MEMBERSHIP_CACHE_TTL
+        memberships = cache.get(key) if ttl > 0 else None
+        if memberships is None:
+            memberships = {
+                workspace_id: (role, is_active)
+                for workspace_id, role, is_active in WorkspaceMember.objects.filter(user=user).values_list(
+                    'workspace_id', 'role', 'is_active'
+                )
+            }
+            if ttl > 0:
+                cache.set(key, memberships, timeout=ttl)
+        setattr(user, MEMBERSHIP_ATTR, memberships)
+    return memberships
+
+
+def get_role(user, workspace, active_only=False):
+    """The user's role in the workspace, or None if they are not a member."""
+    membership = get_memberships(user).get(_workspace_id(workspace))
+    if membership is None or (active_only and not membership[1]):
+        return None
+    return membership[0]
+
+
+def is_member(user, workspace, active_only=True):
+    return get_role(user, workspace, active_only=active_only) is not None
+
+
+def get_workspace_ids(user, active_only=False):
+    return [
+        workspace_id for workspace_id, (_, is_active) in get_memberships(user).items()
+        if is_active or not active_only
+    ]
+
+
+def invalidate_memberships(*users):
+    """
+    Drops the cached memberships of the given users (or user ids).
+    Call it after changing memberships with queryset.update(), which sends no signals.
+    The entry is dropped again on commit, so a read that raced the write cannot leave stale data behind.
+    """
+    keys = [_cache_key(getattr(user, 'pk', user)) for user in users]
+    for user in users:
+        if hasattr(user, MEMBERSHIP_ATTR):
+            delattr(user, MEMBERSHIP_ATTR)
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,38 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workspaces', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkspaceActivitySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('WEEK', 'Week'), ('MONTH', 'Month')], max_length=10)),
+                ('period_start', models.DateField(verbose_name='First day of the period')),
+                ('hours_worked', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('report_count', models.PositiveIntegerField(default=0)),
+                ('active_students', models.PositiveIntegerField(default=0)),
+                ('payroll_gross', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('payroll_net', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('tasks_due', models.PositiveIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('tasks_overdue', models.PositiveIntegerField(default=0)),
+                ('meetings_count', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_summaries', to='workspaces.workspace')),
+            ],
+            options={
+                'verbose_name': 'Workspace Activity Summary',
+                'verbose_name_plural': 'Workspace Activity Summaries',
+                'db_table': 'workspace_activity_summaries',
+                'ordering': ['workspace', 'period', 'period_start'],
+                'unique_together': {('workspace', 'period', 'period_start')},
+            },
+        ),
+    ]
@@ -4,6 +4,13 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from apps.users.models import User
 
+class WorkspaceQuerySet(models.QuerySet):
+    def with_member_counts(self):
+        """Annotates `active_members_count` in SQL, so listing workspaces needs no query per row."""
+        return self.annotate(
+            active_members_count=models.Count('members', filter=models.Q(members__is_active=True))
+        )
+
 class Workspace(models.Model):
     name = models.CharField(max_length=200, verbose_name="Workspace name")
     description = models.TextField(blank=True, verbose_name="Workspace description")
@@ -26,6 +33,8 @@ class Workspace(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated at")
 
+    objects = WorkspaceQuerySet.as_manager()
+
     class Meta:
         db_table = 'workspaces'
         ordering = ['-created_at']
@@ -37,7 +46,16 @@ class Workspace(models.Model):
     
     @property
     def active_members_count(self):
-        return self.members.filter(is_active=True).count()
+        """Annotated by `Workspace.objects.with_member_counts()`; counted with a query otherwise."""
+        if self._active_members_count is None:
+            return self.members.filter(is_active=True).count()
+        return self._active_members_count
+
+    @active_members_count.setter
+    def active_members_count(self, value):
+        self._active_members_count = value
+
+    _active_members_count = None
     
     @property
     def is_full(self):
@@ -97,4 +115,47 @@ class WorkspaceMember(models.Model):
             raise ValidationError("Workspace is full, new members cannot be added.")
 
     def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+
+class WorkspaceActivitySummary(models.Model):
+    """
+    Precomputed dashboard aggregates of a workspace for one week or one month.
+    Rows are rebuilt by `refresh_workspace_analytics` (see analytics.py) on a schedule,
+    so the analytics endpoint reads a handful of rows instead of aggregating raw data.
+    Weekly rows only carry the hour figures; monthly rows carry everything.
+    """
+    PERIOD_CHOICES = (
+        ('WEEK', 'Week'),
+        ('MONTH', 'Month'),
+    )
+    workspace = models.ForeignKey(Workspace, on_delete=models.CASCADE, related_name='activity_summaries')
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES)
+    period_start = models.DateField(verbose_name="First day of the period")
+    hours_worked = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    report_count = models.PositiveIntegerField(default=0)
+    active_students = models.PositiveIntegerField(default=0)
+    payroll_gross = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    payroll_net = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    tasks_due = models.PositiveIntegerField(default=0)
+    tasks_completed = models.PositiveIntegerField(default=0)
+    tasks_overdue = models.PositiveIntegerField(default=0)
+    meetings_count = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'workspace_activity_summaries'
+        ordering = ['workspace', 'period', 'period_start']
+        unique_together = ('workspace', 'period', 'period_start')
+        verbose_name = "Workspace Activity Summary"
+        verbose_name_plural = "Workspace Activity Summaries"
+
+    def __str__(self):
+        return f"{self.workspace_id} - {self.period} {self.period_start}"
+
+    @property
+    def completion_rate(self):
+        return round(self.tasks_completed / self.tasks_due, 4) if self.tasks_due else None
+
+    @property
+    def overdue_ratio(self):
+        return round(self.tasks_overdue / self.tasks_due, 4) if self.tasks_due else None
@@ -1,5 +1,6 @@
 from rest_framework import permissions
-from .models import WorkspaceMember, Workspace
+from .models import Workspace
+from .membership import get_role, is_member
 
 class IsAdminUserType(permissions.BasePermission):
     
@@ -15,7 +16,7 @@ class IsWorkspaceMember(permissions.BasePermission):
             return False
         if getattr(user, 'user_type', None) == 'ADMIN':
             return True
-        return WorkspaceMember.objects.filter(workspace=obj, user=user, is_active=True).exists()
+        return is_member(user, obj)
     
 class IsAdminOrWorkspaceMemberReadOnly(permissions.BasePermission):
 
@@ -30,7 +31,7 @@ class IsAdminOrWorkspaceMemberReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             if getattr(user, 'user_type', None) == 'ADMIN':
                 return True
-            return WorkspaceMember.objects.filter(workspace=obj, user=user, is_active=True).exists()
+            return is_member(user, obj)
         
         return getattr(user, 'user_type', None) == 'ADMIN'
 
@@ -55,21 +56,11 @@ class IsWorkspaceMembersStaff(permissions.BasePermission):
         # Obyektdan workspace'ni topamiz.
         # `obj` bu Workspace'ning o'zi bo'lishi mumkin yoki boshqa modelda (masalan, Task)
         # unga ishora qiluvchi `workspace` maydoni bo'lishi mumkin.
-        workspace = None
-        if isinstance(obj, Workspace):
-            workspace = obj
-        elif hasattr(obj, 'workspace'):
-            workspace = obj.workspace
-        
+        workspace_id = obj.pk if isinstance(obj, Workspace) else getattr(obj, 'workspace_id', None)
+
         # Agar workspace topilmasa, ruxsat yo'q
-        if not workspace:
+        if not workspace_id:
             return False
 
-        # Foydalanuvchining shu workspace'dagi a'zoligini va rolini tekshiramiz
-        try:
-            member = WorkspaceMember.objects.get(workspace=workspace, user=user, is_active=True)
-            # A'zolik roli 'STAFF' bo'lsa, ruxsat beramiz
-            return member.role == 'STAFF'
-        except WorkspaceMember.DoesNotExist:
-            # Agar foydalanuvchi bu workspace'ning a'zosi bo'lmasa, ruxsat yo'q
-            return False
+        # Faol a'zolik roli 'STAFF' bo'lsa, ruxsat beramiz
+        return get_role(user, workspace_id, active_only=True) == 'STAFF'
@@ -1,11 +1,13 @@
 # apps/workspaces/serializers.py
 
+from django.conf import settings
 from rest_framework import serializers
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
-from .models import Workspace, WorkspaceMember
+from .models import Workspace, WorkspaceMember, WorkspaceActivitySummary
 from apps.users.models import User
 from apps.users.serializers import UserSummarySerializer
+from apps.common.bulk import BULK_ACTION_MAX_IDS
 
 # ----------------- Workspace Serializers -----------------
 
@@ -39,6 +41,48 @@ class WorkspaceListSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'workspace_type', 'active_members_count', 'created_by']
 
 
+# ----------------- Analytics Serializers -----------------
+
+class WorkspaceAnalyticsQuerySerializer(serializers.Serializer):
+    months = serializers.IntegerField(required=False, default=12, min_value=1, max_value=settings.WORKSPACE_ANALYTICS_MAX_MONTHS)
+
+class WorkspaceWeeklyActivitySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = WorkspaceActivitySummary
+        fields = ['period_start', 'hours_worked', 'report_count', 'active_students']
+
+class WorkspaceMonthlyActivitySerializer(serializers.ModelSerializer):
+    completion_rate = serializers.FloatField(read_only=True, allow_null=True)
+    overdue_ratio = serializers.FloatField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = WorkspaceActivitySummary
+        fields = [
+            'period_start', 'hours_worked', 'report_count', 'active_students', 'payroll_gross', 'payroll_net',
+            'tasks_due', 'tasks_completed', 'tasks_overdue', 'completion_rate', 'overdue_ratio', 'meetings_count'
+        ]
+
+class WorkspaceAnalyticsTotalsSerializer(serializers.Serializer):
+    hours_worked = serializers.DecimalField(max_digits=12, decimal_places=2)
+    payroll_gross = serializers.DecimalField(max_digits=14, decimal_places=2)
+    payroll_net = serializers.DecimalField(max_digits=14, decimal_places=2)
+    tasks_due = serializers.IntegerField()
+    tasks_completed = serializers.IntegerField()
+    tasks_overdue = serializers.IntegerField()
+    completion_rate = serializers.FloatField(allow_null=True)
+    overdue_ratio = serializers.FloatField(allow_null=True)
+    meetings_count = serializers.IntegerField()
+
+class WorkspaceAnalyticsSerializer(serializers.Serializer):
+    """Dashboard figures of a workspace, read from the precomputed activity summaries."""
+    workspace = WorkspaceSummarySerializer()
+    since = serializers.DateField()
+    refreshed_at = serializers.DateTimeField(allow_null=True)
+    totals = WorkspaceAnalyticsTotalsSerializer()
+    weekly = WorkspaceWeeklyActivitySerializer(many=True)
+    monthly = WorkspaceMonthlyActivitySerializer(many=True)
+
+
 # ----------------- WorkspaceMember Serializers -----------------
 
 class WorkspaceMemberDetailSerializer(serializers.ModelSerializer):
@@ -102,4 +146,33 @@ class WorkspaceMemberCreateSerializer(serializers.ModelSerializer):
 class WorkspaceMemberRateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = WorkspaceMember
-        fields = ['hourly_rate_override']
\ No newline at end of file
+        fields = ['hourly_rate_override']
+
+class WorkspaceMemberBulkRemoveSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=BULK_ACTION_MAX_IDS,
+        help_text="IDs of the users whose memberships are affected."
+    )
+
+    def validate_user_ids(self, value):
+        return list(dict.fromkeys(value))
+
+class WorkspaceMemberBulkAddSerializer(WorkspaceMemberBulkRemoveSerializer):
+    is_active = serializers.BooleanField(default=True)
+
+class WorkspaceMemberBulkItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(help_text="User ID")
+    result = serializers.CharField()
+    detail = serializers.CharField(required=False)
+
+class WorkspaceMemberBulkAddResultSerializer(serializers.Serializer):
+    added = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    not_found = serializers.IntegerField()
+    results = WorkspaceMemberBulkItemSerializer(many=True)
+
+class WorkspaceMemberBulkRemoveResultSerializer(serializers.Serializer):
+    removed = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    not_found = serializers.IntegerField()
+    results = WorkspaceMemberBulkItemSerializer(many=True)
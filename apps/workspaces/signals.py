@@ -2,16 +2,32 @@
 
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import WorkspaceMember
+from .models import Workspace, WorkspaceMember
+from .membership import invalidate_memberships
+from .bulk import in_bulk_member_change
+from apps.common.conditional import touch
 from apps.notifications.utils import create_notification
 
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+def invalidate_member_cache(sender, instance, **kwargs):
+    """
+    Drops the user's cached memberships whenever one of them is created, changed or removed.
+    """
+    invalidate_memberships(instance.user if sender.user.is_cached(instance) else instance.user_id)
+
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+def touch_workspace_on_member_change(sender, instance, **kwargs):
+    """The workspace payload includes its active member count, so a membership change is a workspace change."""
+    if not in_bulk_member_change():
+        touch(Workspace, instance.workspace_id)
+
 @receiver(post_save, sender=WorkspaceMember)
 def notify_on_new_member(sender, instance, created, **kwargs):
     """
     Sends a notification when a new member is added to a workspace.
     `created` - indicates whether the object was newly created.
     """
-    if created:
+    if created and not in_bulk_member_change():
         workspace = instance.workspace
         actor = workspace.created_by 
 
@@ -28,6 +44,8 @@ def notify_on_member_removal(sender, instance, **kwargs):
     """
     Sends a notification when a member is removed from a workspace.
     """
+    if in_bulk_member_change():
+        return
     workspace = instance.workspace
     
     create_notification(
@@ -10,9 +10,18 @@ from .models import Workspace, WorkspaceMember
 from .serializers import (
     WorkspaceListSerializer, WorkspaceDetailSerializer, 
     WorkspaceMemberListSerializer, WorkspaceMemberDetailSerializer,
-    WorkspaceMemberCreateSerializer, WorkspaceMemberRateUpdateSerializer
+    WorkspaceMemberCreateSerializer, WorkspaceMemberRateUpdateSerializer,
+    WorkspaceAnalyticsQuerySerializer, WorkspaceAnalyticsSerializer,
+    WorkspaceMemberBulkAddSerializer, WorkspaceMemberBulkRemoveSerializer,
+    WorkspaceMemberBulkAddResultSerializer, WorkspaceMemberBulkRemoveResultSerializer
 )
 from .permissions import IsAdminOrWorkspaceMemberReadOnly, IsAdminUserType, IsWorkspaceMembersStaff
+from .membership import get_workspace_ids
+from .analytics import workspace_analytics
+from .bulk import add_members, remove_members
+from apps.common.conditional import ConditionalGetMixin, conditional_response
+from apps.tasks.board import board_etag, build_task_board
+from apps.tasks.serializers import TaskBoardQuerySerializer, TaskBoardSerializer
 from apps.users.permissions import IsAdminOrStaff
 
 @extend_schema_view(
@@ -28,7 +37,8 @@ from apps.users.permissions import IsAdminOrStaff
     ),
     members=extend_schema(summary="Workspace members list"),
 )
-class WorkspaceViewSet(mixins.ListModelMixin,
+class WorkspaceViewSet(ConditionalGetMixin,
+                       mixins.ListModelMixin,
                        mixins.RetrieveModelMixin,
                        mixins.UpdateModelMixin,
                        mixins.DestroyModelMixin,
@@ -57,9 +67,11 @@ class WorkspaceViewSet(mixins.ListModelMixin,
         user = self.request.user
         if not user.is_authenticated:
             return Workspace.objects.none()
+        # Meta.ordering is not applied to aggregated querysets, so it is restated here.
+        workspaces = Workspace.objects.with_member_counts().order_by('-created_at')
         if getattr(user, 'user_type', None) == 'ADMIN':
-            return Workspace.objects.all()
-        return Workspace.objects.filter(members__user=user, members__is_active=True)
+            return workspaces
+        return workspaces.filter(id__in=get_workspace_ids(user, active_only=True))
 
     @action(detail=True, methods=['get'], url_path='members')
     def members(self, request, pk=None):
@@ -80,6 +92,36 @@ class WorkspaceViewSet(mixins.ListModelMixin,
         output_serializer = WorkspaceMemberDetailSerializer(member)
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
+    @extend_schema(
+        summary="[ADMIN] Add many members to workspace",
+        request=WorkspaceMemberBulkAddSerializer,
+        responses=WorkspaceMemberBulkAddResultSerializer
+    )
+    @action(detail=True, methods=['post'], url_path='add-members', permission_classes=[IsAdminUserType])
+    def bulk_add_members(self, request, pk=None):
+        """
+        Adds a list of users in one transaction. Fails without adding anyone when the new
+        active members would not fit into `max_members`.
+        """
+        workspace = get_object_or_404(Workspace, pk=pk)
+        serializer = WorkspaceMemberBulkAddSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        _, result = add_members(workspace, serializer.validated_data['user_ids'], is_active=serializer.validated_data['is_active'])
+        return Response(result.as_dict())
+
+    @extend_schema(
+        summary="[ADMIN] Remove many members from workspace",
+        request=WorkspaceMemberBulkRemoveSerializer,
+        responses=WorkspaceMemberBulkRemoveResultSerializer
+    )
+    @action(detail=True, methods=['post'], url_path='remove-members', permission_classes=[IsAdminUserType])
+    def bulk_remove_members(self, request, pk=None):
+        workspace = get_object_or_404(Workspace, pk=pk)
+        serializer = WorkspaceMemberBulkRemoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = remove_members(workspace, serializer.validated_data['user_ids'])
+        return Response(result.as_dict())
+
     @extend_schema(
         summary="[ADMIN] Remove member from workspace",
         parameters=[
@@ -120,4 +162,42 @@ class WorkspaceViewSet(mixins.ListModelMixin,
         serializer = WorkspaceMemberRateUpdateSerializer(instance=member, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
-        return Response(WorkspaceMemberDetailSerializer(member).data)
\ No newline at end of file
+        return Response(WorkspaceMemberDetailSerializer(member).data)
+
+    @extend_schema(
+        summary="Workspace task board",
+        parameters=[TaskBoardQuerySerializer],
+        responses={200: TaskBoardSerializer, 304: None}
+    )
+    @action(detail=True, methods=['get'], url_path='task-board')
+    def task_board(self, request, pk=None):
+        """
+        Kanban board: tasks grouped by status with per-column and per-priority counts and
+        per-assignee workloads. Send the ETag back in If-None-Match to get a 304 while nothing changed.
+        """
+        workspace = self.get_object()
+        params = TaskBoardQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        limit = params.validated_data['limit']
+        return conditional_response(
+            request,
+            board_etag(workspace, limit),
+            lambda: Response(TaskBoardSerializer(build_task_board(workspace, limit)).data)
+        )
+
+    @extend_schema(
+        summary="[STAFF/ADMIN] Workspace analytics",
+        parameters=[WorkspaceAnalyticsQuerySerializer],
+        responses=WorkspaceAnalyticsSerializer
+    )
+    @action(detail=True, methods=['get'], url_path='analytics', permission_classes=[IsAdminOrStaff])
+    def analytics(self, request, pk=None):
+        """
+        Hours per week, payroll cost, task completion and overdue rates and meeting counts per month.
+        Served from the activity summaries refreshed by the `refresh_workspace_analytics` job.
+        """
+        workspace = get_object_or_404(Workspace, pk=pk)
+        params = WorkspaceAnalyticsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = workspace_analytics(workspace, params.validated_data['months'])
+        return Response(WorkspaceAnalyticsSerializer(data).data)
@@ -49,7 +49,6 @@ THIRD_PARTY_APPS = [
     'corsheaders',
     'django_filters',
     'drf_spectacular',
-    'django_apscheduler'
 ]
 
 LOCAL_APPS = [
@@ -60,6 +59,8 @@ LOCAL_APPS = [
     'apps.meetings',
     'apps.jobs',
     'apps.notifications',
+    'apps.outbox',
+    'apps.search',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -352,3 +353,118 @@ DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
 
 # Fayllarning URL manzilini S3'ga moslashtiramiz
 MEDIA_URL = f"https://{config('AWS_STORAGE_BUCKET_NAME')}.s3.amazonaws.com/media/"
+
+# ==============================================================================
+# 			Monthly Report Generation Settings
+# ==============================================================================
+# Worker processes rendering Excel files (0 = one per CPU core)
+MONTHLY_REPORT_RENDER_WORKERS = config('MONTHLY_REPORT_RENDER_WORKERS', default=0, cast=int)
+# Threads uploading rendered files to storage concurrently
+MONTHLY_REPORT_UPLOAD_WORKERS = config('MONTHLY_REPORT_UPLOAD_WORKERS', default=8, cast=int)
+
+# ==============================================================================
+# 			Ledger Export Settings
+# ==============================================================================
+# Rows fetched per round trip by the CSV/XLSX export endpoints (server-side cursor)
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+# Exported workbooks larger than this (in bytes) are spooled to disk before being streamed
+EXPORT_SPOOL_MAX_SIZE = config('EXPORT_SPOOL_MAX_SIZE', default=4 * 1024 * 1024, cast=int)
+
+# ==============================================================================
+# 			Workspace Analytics Settings
+# ==============================================================================
+# Months (back from the current one) recomputed by each `refresh_workspace_analytics` run;
+# older summaries are kept as they are.
+WORKSPACE_ANALYTICS_REFRESH_MONTHS = config('WORKSPACE_ANALYTICS_REFRESH_MONTHS', default=3, cast=int)
+# Longest history the analytics endpoint returns
+WORKSPACE_ANALYTICS_MAX_MONTHS = config('WORKSPACE_ANALYTICS_MAX_MONTHS', default=24, cast=int)
+
+# ==============================================================================
+# 			Outbox Worker Settings
+# ==============================================================================
+# Messages claimed per batch by `python manage.py run_outbox_worker`
+OUTBOX_BATCH_SIZE = config('OUTBOX_BATCH_SIZE', default=50, cast=int)
+# Seconds the worker sleeps when nothing is due
+OUTBOX_POLL_INTERVAL = config('OUTBOX_POLL_INTERVAL', default=2, cast=float)
+# Attempts before a message is dead-lettered
+OUTBOX_MAX_ATTEMPTS = config('OUTBOX_MAX_ATTEMPTS', default=8, cast=int)
+# Exponential backoff between attempts (seconds)
+OUTBOX_RETRY_BASE_DELAY = config('OUTBOX_RETRY_BASE_DELAY', default=10, cast=int)
+OUTBOX_RETRY_MAX_DELAY = config('OUTBOX_RETRY_MAX_DELAY', default=3600, cast=int)
+# How long a claimed message is hidden from other workers (seconds). The lease restarts when
+# each delivery begins and must be more than twice OUTBOX_HTTP_TIMEOUT.
+OUTBOX_LEASE_SECONDS = config('OUTBOX_LEASE_SECONDS', default=300, cast=int)
+# Timeout for outgoing HTTP calls made by handlers (seconds)
+OUTBOX_HTTP_TIMEOUT = config('OUTBOX_HTTP_TIMEOUT', default=10, cast=int)
+
+# ==============================================================================
+# 			Cache Settings
+# ==============================================================================
+# LocMemCache is per process; set REDIS_URL when running several web workers so
+# they share cached values such as the unread-notification counters.
+REDIS_URL = config('REDIS_URL', default=None)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'jdu-coworking',
+        }
+    }
+
+# Cached unread-notification counters expire after this many seconds and are
+# then recounted from the database, which bounds any drift. The counters are only kept in a
+# shared cache: with the per-process LocMemCache other workers would miss the updates.
+# 0 counts from the database on every read.
+NOTIFICATION_UNREAD_COUNT_TTL = config('NOTIFICATION_UNREAD_COUNT_TTL', default=300 if REDIS_URL else 0, cast=int)
+
+# Cached workspace memberships (apps/workspaces/membership.py) are dropped on every
+# membership change; the TTL only limits how long an unused entry stays around.
+# Memberships decide permissions, so they are cached across requests only in a shared
+# cache: with the per-process LocMemCache other workers would miss the invalidation.
+# 0 keeps them for the current request only.
+WORKSPACE_MEMBERSHIP_CACHE_TTL = config('WORKSPACE_MEMBERSHIP_CACHE_TTL', default=600 if REDIS_URL else 0, cast=int)
+
+# ==============================================================================
+# 			Scheduler Settings
+# ==============================================================================
+# `python manage.py run_scheduler` instances compete for this PostgreSQL advisory lock;
+# the holder runs the jobs, the others retry every SCHEDULER_LOCK_RETRY_INTERVAL seconds.
+SCHEDULER_LOCK_ID = config('SCHEDULER_LOCK_ID', default=72_410_001, cast=int)
+SCHEDULER_LOCK_RETRY_INTERVAL = config('SCHEDULER_LOCK_RETRY_INTERVAL', default=30, cast=int)
+# How often the leader checks that the connection holding the lock is alive (seconds)
+SCHEDULER_HEARTBEAT_INTERVAL = config('SCHEDULER_HEARTBEAT_INTERVAL', default=15, cast=int)
+# A run that starts later than this after its fire time is skipped (seconds)
+SCHEDULER_MISFIRE_GRACE_TIME = config('SCHEDULER_MISFIRE_GRACE_TIME', default=3600, cast=int)
+
+# ==============================================================================
+# 			Logging
+# ==============================================================================
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {
+            'format': '{asctime} {levelname} {name}: {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'loggers': {
+        'apps': {
+            'handlers': ['console'],
+            'level': config('APPS_LOG_LEVEL', default='INFO'),
+        },
+    },
+}
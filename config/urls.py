@@ -26,6 +26,7 @@ urlpatterns = [
     path('jobs/', include('apps.jobs.urls')),
     path('meetings/', include('apps.meetings.urls')),
     path('notifications/', include('apps.notifications.urls')),
+    path('search/', include('apps.search.urls')),
 ]
 
 if settings.DEBUG: